@@ -8,6 +8,18 @@ from smartmin.models import SmartModel
 from datetime import datetime
 from django.utils.translation import ugettext_lazy as _
 
+# how many rows we insert at once when finalizing a season
+BULK_BATCH_SIZE = 500
+
+def quantize(value):
+    """
+    Rounds decimal values to the four places our aggregate columns store
+    """
+    if isinstance(value, Decimal):
+        return value.quantize(Decimal(".0001"))
+    else:
+        return value
+
 class FinalizeTask(SmartModel):
     season = models.ForeignKey(Season, verbose_name=_("Season"),
                                help_text=_("The season which will be finalized"))
@@ -45,37 +57,106 @@ class SeasonMetric(models.Model):
     label = models.CharField(max_length=128, verbose_name=_("Label"))
     is_cost = models.BooleanField(default=True, verbose_name=_("Is Cost"))
 
+    # season stats, calculated when the season is finalized
+    average = models.DecimalField(max_digits=16, decimal_places=4, null=True, verbose_name=_("Average"))
+    lowest = models.DecimalField(max_digits=16, decimal_places=4, null=True, verbose_name=_("Lowest"))
+    highest = models.DecimalField(max_digits=16, decimal_places=4, null=True, verbose_name=_("Highest"))
+
+    def get_best(self):
+        if self.is_cost:
+            return self.lowest
+        else:
+            return self.highest
+
+    def calculate_stats(self, report_values):
+        """
+        Given all the report values for this metric in the season, calculates our season stats and
+        sets the season rank on each value.  This is done with a single pass over the sorted values.
+        """
+        values = sorted([_ for _ in report_values if not _.value is None], key=lambda _: _.value)
+        count = len(values)
+
+        if count:
+            self.average = sum([_.value for _ in values], Decimal(0)) / count
+            self.lowest = values[0].value
+            self.highest = values[-1].value
+        else:
+            self.average = None
+            self.lowest = None
+            self.highest = None
+
+        # walk each run of equal values, they all share the same rank
+        start = 0
+        while start < count:
+            end = start
+            while end < count and values[end].value == values[start].value:
+                end += 1
+
+            # low values are good, our rank is one more than the number of values lower than us
+            if self.is_cost:
+                rank = start + 1
+
+            # high values are good, our rank is one more than the number of values higher than us
+            else:
+                rank = count - end + 1
+
+            for report_value in values[start:end]:
+                report_value.season_rank = rank if report_value.value else None
+
+            start = end
+
+    @classmethod
+    def recalculate_for_season(cls, season):
+        """
+        Recalculates the stats and ranks for all the metrics in the passed in season from the values
+        that are already saved.
+        """
+        values = dict()
+        for report_value in ReportValue.objects.filter(metric__season=season):
+            values.setdefault(report_value.metric_id, []).append(report_value)
+
+        for metric in SeasonMetric.objects.filter(season=season):
+            metric_values = values.get(metric.pk, [])
+            metric.calculate_stats(metric_values)
+            metric.save()
+
+            for report_value in metric_values:
+                report_value.save()
+
 class ReportValue(models.Model):
     report = models.ForeignKey(Report, verbose_name=_("Report"))
     metric = models.ForeignKey(SeasonMetric, verbose_name="Metric")
     value = models.DecimalField(max_digits=16, decimal_places=4, verbose_name=_("Value"), null=True)
 
-    def get_season_values(self):
-        all_values = ReportValue.objects.filter(report__season=self.report.season,
-                                                metric=self.metric).aggregate(Avg('value'), Min('value'), Max('value'))
+    season_rank = models.IntegerField(null=True, verbose_name=_("Season Rank"))
 
-        season_values = dict(avg=all_values['value__avg'], min=all_values['value__min'], max=all_values['value__max'])
+    def get_season_values(self):
+        metric = self.metric
 
-        if self.metric.is_cost:
-            season_values['best'] = all_values['value__min']
-        else:
-            season_values['best'] = all_values['value__max']
+        # our average used to come straight out of an Avg aggregate, which gives us floats
+        average = metric.average
+        if not average is None:
+            average = float(average)
 
-        return season_values
+        return dict(avg=average, min=metric.lowest, max=metric.highest, best=metric.get_best())
 
     def rank(self):
         if not self.value:
             return None
 
-        # low values are good
-        if self.metric.is_cost:
-            return ReportValue.objects.filter(report__season=self.report.season, metric=self.metric, 
-                                              value__lt=self.value).count() + 1
+        return self.season_rank
 
-        # high values are good
-        else:
-            return ReportValue.objects.filter(report__season=self.report.season, metric=self.metric, 
-                                              value__gt=self.value).count() + 1
+    @classmethod
+    def ranks_for_report(cls, report):
+        """
+        Returns a dict of metric slug to the value, rank and season values for that metric for
+        the passed in report.  This is a single query.
+        """
+        ranks = dict()
+        for value in ReportValue.objects.filter(report=report).select_related('metric'):
+            ranks[value.metric.slug] = dict(value=value.value, rank=value.rank(), **value.get_season_values())
+
+        return ranks
 
 class SeasonAggregate(models.Model):
     season = models.ForeignKey(Season, verbose_name=_("Season"))
@@ -114,224 +195,291 @@ class SeasonAggregate(models.Model):
 
     @classmethod
     def add_metric(cls, metrics, report, slug, label, value, is_cost):
-        metric = metrics.get(slug, None)
-        if not metric:
-            metric = SeasonMetric.objects.create(season=report.season, slug=slug, label=label, is_cost=is_cost)
-            metrics[slug] = metric
-
-        ReportValue.objects.create(metric=metric, report=report, value=value)
+        # values are saved once we've calculated their ranks, round them the same way saving them will
+        metrics.append((slug, label, quantize(value), is_cost))
 
     @classmethod
-    def calculate_for_season(cls, season):
-        from reports.pdf.production import ProductionBox
-        from reports.pdf.sales import SalesBox
-        from reports.pdf.expenses import ExpenseBox
-        from reports.pdf.farmer import FarmerBox
-        from reports.pdf.cash import CashBox
-        from reports.models import Report
-
-        # remove existing aggregates
-        SeasonAggregate.objects.filter(season=season).delete()
-        ReportValue.objects.filter(report__season=season).delete()
-        SeasonMetric.objects.filter(season=season).delete()
-
+    def calculate_report_values(cls, report):
+        """
+        Calculates the metrics for the passed in report, building all its report boxes in the
+        process.  Returns a dict of plain values which merge_report_values() adds to our season totals.
+        """
         # aggregates are all in local currency
+        season = report.season
         currency = season.country.currency
         curr_code = currency.currency_code
 
         # exchange rate for this season
         exchange = season.exchange_rate
-        
-        # the set of keys we've seen
+
+        # dict containing the aggregate values for this report
+        values = dict()
+
+        # the keys in our values and whether each is a cost
         slugs = dict()
 
-        # our report metrics
-        metrics = dict()
+        # list of the metrics for this report
+        metrics = []
+
+        # calculates the metrics for this report and populates our
+        # report boxes in the process
+        report.calculate_metrics()
+
+        production = report.production_box
+        sales = report.sales_box
+        expenses = report.expenses_box
+        cash = report.cash_box
+        farmer = report.farmer_box
+
+        green = production.green_total
+        cherry = production.cherry_total
+        green_ratio = production.cherry_to_green_ratio
 
-        # a list of all the report values we have accumulated
-        report_values = []
+        for category in expenses.get_categories():
+            cls.add_value(values, slugs, category.slug(), cls.per_kilo(category.value, green, exchange))
+            cls.add_value(values, slugs, "%s__advance" % category.slug(), cls.per_kilo(category.advance_value, green, exchange))
+            cls.add_value(values, slugs, "%s__non_advance" % category.slug(), cls.per_kilo(category.non_advance_value(), green, exchange))
+
+            cls.add_metric(metrics, report, "%s__kgc" % category.slug(), "%s Expenses (%s/KgC)" % (category.name, curr_code), cls.per_kilo(category.value, cherry, exchange), True)
+            cls.add_metric(metrics, report, '%s__non_advance__kgc' % category.slug(), "%s Non-Advance Expenses (%s/KgC)" % (category.name, curr_code), cls.per_kilo(category.non_advance_value(), cherry, exchange), True)
+
+            for child in category.children:
+                cls.add_value(values, slugs, child.slug(), cls.per_kilo(child.value, green, exchange))
+                cls.add_metric(metrics, report, "%s__kgc" % child.slug(), "%s (%s/KgC)" % (child.name, curr_code), cls.per_kilo(child.value, cherry, exchange), True)
+
+        # add in our total expenses
+        cls.add_value(values, slugs, 'sales_revenue', cls.per_kilo(expenses.sales_revenue, green, exchange), False)
+        cls.add_value(values, slugs, 'misc_revenue', cls.per_kilo(expenses.misc_revenue, green, exchange), False)
+        cls.add_value(values, slugs, 'total_revenue', cls.per_kilo(expenses.total_revenue, green, exchange), False)
+        cls.add_value(values, slugs, 'total_expenses', cls.per_kilo(expenses.total, green, exchange))
+
+        cls.add_value(values, slugs, 'total_forex_loss', cls.per_kilo(expenses.total_forex_loss, green, exchange))
+        cls.add_value(values, slugs, 'total_profit', cls.per_kilo(expenses.total_profit, green, exchange), False)
+        cls.add_value(values, slugs, 'production_cost', expenses.production_cost.as_local(exchange))
+        
+        # cash box
+        cls.add_value(values, slugs, 'cash_due', cls.per_kilo(cash.cash_due, cherry, exchange))
+        cls.add_value(values, slugs, 'unused_working_capital', cls.per_kilo(cash.cash_due, cherry, exchange))
 
-        # for each finalized report
-        for report in Report.objects.filter(season=season, is_finalized=True):
-            # dict containing the aggregate values for this report
-            values = dict()
+        # graphs
+        cls.add_value(values, slugs, 'farmer_payment', cls.per_kilo(farmer.total_paid, cherry, exchange))
+        cls.add_value(values, slugs, 'cherry_to_parchment_ratio', production.cherry_to_parchment_ratio)
+        cls.add_value(values, slugs, 'parchment_to_green_ratio', production.parchment_to_green_ratio)
+        cls.add_value(values, slugs, 'cherry_to_green_ratio', production.cherry_to_green_ratio)
+        cls.add_value(values, slugs, 'cherry_to_top_grade_ratio', production.cherry_to_top_grade_ratio)
+        cls.add_value(values, slugs, 'top_grade_percentage', production.top_grade_percentage)
 
-            # calculates the metrics for this report and populates our
-            # report boxes in the process
-            report.calculate_metrics()
+        # total cherry
+        cls.add_value(values, slugs, 'total_cherry', production.cherry_total, False)
 
+        # working capital received
+        cls.add_value(values, slugs, 'working_capital_received', report.working_capital)
+
+        # sales box
+        cls.add_value(values, slugs, 'fot_price', sales.fot_price.as_local(exchange))
+
+        # metrics
+        cls.add_metric(metrics, report, 'total_revenue', "Total Revenue (%s)" % curr_code, expenses.total_revenue.as_local(exchange), False)
+        cls.add_metric(metrics, report, 'total_revenue__kgc', "Total Revenue (%s/KgC)" % curr_code, cls.per_kilo(expenses.total_revenue, cherry, exchange), False)
+
+        cls.add_metric(metrics, report, 'total_expenses', "Total Expenses (%s)" % curr_code, expenses.total.as_local(exchange), True)
+        cls.add_metric(metrics, report, 'total_expenses__kgc', "Total Expenses (%s/KgC)" % curr_code, cls.per_kilo(expenses.total, cherry, exchange), True)
+
+        cls.add_metric(metrics, report, 'total_profit', "Total Profit (%s)" % curr_code, expenses.total_profit.as_local(exchange), False)
+        cls.add_metric(metrics, report, 'total_profit__kgc', "Total Profit (%s/KgC)" % curr_code, cls.per_kilo(expenses.total_profit, cherry, exchange), False)
+
+        cls.add_metric(metrics, report, 'fot_price', "FOT Price (%s/KgG)" % curr_code, sales.fot_price.as_local(exchange), False)
+        cls.add_metric(metrics, report, 'fot_price_kgc', "FOT Price (%s/KgC)" % curr_code, cls.per_kilo(sales.fot_price * sales.total_export_volume, cherry, exchange), False)
+        cls.add_metric(metrics, report, 'farmer_payment__sum', "Farmer Payment Sum (%s)" % curr_code, farmer.total_paid.as_local(exchange), False)
+
+        cls.add_metric(metrics, report, 'total_revenue', "Total Revenue (%s)" % curr_code, expenses.total_revenue.as_local(exchange), False)
+
+        cls.add_metric(metrics, report, 'total_cherry', "Total Cherry (KgC)", production.cherry_total, False)
+        cls.add_metric(metrics, report, 'total_parchment', "Total Parchment (KgP)", production.parchment_total, False)
+        cls.add_metric(metrics, report, 'total_green', "Total Green (KgG)", production.green_total, False)
+
+        cls.add_metric(metrics, report, 'cherry_to_parchment_ratio', "Cherry to Parchment Ratio", production.cherry_to_parchment_ratio, True)
+        cls.add_metric(metrics, report, 'parchment_to_green_ratio', "Parchment to Green Ratio", production.parchment_to_green_ratio, True)
+        cls.add_metric(metrics, report, 'cherry_to_green_ratio', "Cherry to Green Ratio", production.cherry_to_green_ratio, True)
+        cls.add_metric(metrics, report, 'cherry_to_top_grade_ratio', "Cherry to Top Grade Ratio", production.cherry_to_top_grade_ratio, True)
+        cls.add_metric(metrics, report, 'top_grade_percentage', "Top Grade Percentage", production.top_grade_percentage, False)
+
+        # cash uses
+        for use in cash.get_uses():
+            cls.add_value(values, slugs, use.slug(), cls.per_kilo(use.total, cherry, exchange), False)
+
+        # cash sources
+        for source in cash.get_sources():
+            cls.add_value(values, slugs, source.slug(), cls.per_kilo(source.total, cherry, exchange), False)
+
+        # retained profit
+        cls.add_value(values, slugs, 'retained_profit', cls.per_kilo(cash.retained_profit, cherry, exchange), False)
+
+        # farmer payments
+        for row in farmer.get_rows():
+            value = row.value
+
+            # we store per kilo of green here, which we have to calculate using ratios otherwise it doesn't
+            # properly take into account parchment that is not milled
+            if not value is None and cherry and not green_ratio is None:
+                # calculate per kilo of cherry
+                value = value.as_local(exchange) / cherry * green_ratio
+
+            cls.add_value(values, slugs, row.slug(), value, False)
+
+            metric_label = "%s (%s/KgC)" % (row.label, curr_code)
+            if row.row_for == 'MEM':
+                metric_label += " (Members)"
+            elif row.row_for == 'NON':
+                metric_label += " (Non-Members)"
+            else:
+                metric_label += " (All Farmers)"
+
+            cls.add_metric(metrics, report, row.slug(), metric_label, cls.per_kilo(row.value, cherry, exchange), False)
+
+        return dict(values=values, slugs=slugs, metrics=metrics,
+                    farmer_price=report.farmer_price, farmer_share=report.farmer_share,
+                    production_cost=report.production_cost, cherry_to_green_ratio=report.cherry_to_green_ratio)
+
+    @classmethod
+    def merge_report_values(cls, reports, results, slugs, totals, metrics, report_values, log):
+        """
+        Merges the results of calculate_report_values for each of the passed in reports into
+        our season wide totals, metrics and report values.
+        """
+        for index, (report, result) in enumerate(zip(reports, results)):
             # save our updated metrics
+            report.farmer_price = result['farmer_price']
+            report.farmer_share = result['farmer_share']
+            report.production_cost = result['production_cost']
+            report.cherry_to_green_ratio = result['cherry_to_green_ratio']
             report.save()
 
-            production = report.production_box
-            sales = report.sales_box
-            expenses = report.expenses_box
-            cash = report.cash_box
-            farmer = report.farmer_box
-
-            green = production.green_total
-            cherry = production.cherry_total
-            green_ratio = production.cherry_to_green_ratio
-
-            for category in expenses.get_categories():
-                cls.add_value(values, slugs, category.slug(), cls.per_kilo(category.value, green, exchange))
-                cls.add_value(values, slugs, "%s__advance" % category.slug(), cls.per_kilo(category.advance_value, green, exchange))
-                cls.add_value(values, slugs, "%s__non_advance" % category.slug(), cls.per_kilo(category.non_advance_value(), green, exchange))
-
-                cls.add_metric(metrics, report, "%s__kgc" % category.slug(), "%s Expenses (%s/KgC)" % (category.name, curr_code), cls.per_kilo(category.value, cherry, exchange), True)
-                cls.add_metric(metrics, report, '%s__non_advance__kgc' % category.slug(), "%s Non-Advance Expenses (%s/KgC)" % (category.name, curr_code), cls.per_kilo(category.non_advance_value(), cherry, exchange), True)
-
-                for child in category.children:
-                    cls.add_value(values, slugs, child.slug(), cls.per_kilo(child.value, green, exchange))
-                    cls.add_metric(metrics, report, "%s__kgc" % child.slug(), "%s (%s/KgC)" % (child.name, curr_code), cls.per_kilo(child.value, cherry, exchange), True)
-
-            # add in our total expenses
-            cls.add_value(values, slugs, 'sales_revenue', cls.per_kilo(expenses.sales_revenue, green, exchange), False)
-            cls.add_value(values, slugs, 'misc_revenue', cls.per_kilo(expenses.misc_revenue, green, exchange), False)
-            cls.add_value(values, slugs, 'total_revenue', cls.per_kilo(expenses.total_revenue, green, exchange), False)
-            cls.add_value(values, slugs, 'total_expenses', cls.per_kilo(expenses.total, green, exchange))
-
-            cls.add_value(values, slugs, 'total_forex_loss', cls.per_kilo(expenses.total_forex_loss, green, exchange))
-            cls.add_value(values, slugs, 'total_profit', cls.per_kilo(expenses.total_profit, green, exchange), False)
-            cls.add_value(values, slugs, 'production_cost', expenses.production_cost.as_local(exchange))
-            
-            # cash box
-            cls.add_value(values, slugs, 'cash_due', cls.per_kilo(cash.cash_due, cherry, exchange))
-            cls.add_value(values, slugs, 'unused_working_capital', cls.per_kilo(cash.cash_due, cherry, exchange))
+            slugs.update(result['slugs'])
 
-            # graphs
-            cls.add_value(values, slugs, 'farmer_payment', cls.per_kilo(farmer.total_paid, cherry, exchange))
-            cls.add_value(values, slugs, 'cherry_to_parchment_ratio', production.cherry_to_parchment_ratio)
-            cls.add_value(values, slugs, 'parchment_to_green_ratio', production.parchment_to_green_ratio)
-            cls.add_value(values, slugs, 'cherry_to_green_ratio', production.cherry_to_green_ratio)
-            cls.add_value(values, slugs, 'cherry_to_top_grade_ratio', production.cherry_to_top_grade_ratio)
-            cls.add_value(values, slugs, 'top_grade_percentage', production.top_grade_percentage)
+            # add this report's values to our running totals
+            for slug, value in result['values'].items():
+                if value is None:
+                    continue
 
-            # total cherry
-            cls.add_value(values, slugs, 'total_cherry', production.cherry_total, False)
+                total = totals.get(slug, None)
+                if total is None:
+                    totals[slug] = [value, 1, value, value]
+                else:
+                    total[0] += value
+                    total[1] += 1
 
-            # working capital received
-            cls.add_value(values, slugs, 'working_capital_received', report.working_capital)
+                    if value < total[2]:
+                        total[2] = value
 
-            # sales box
-            cls.add_value(values, slugs, 'fot_price', sales.fot_price.as_local(exchange))
+                    if value > total[3]:
+                        total[3] = value
 
-            # metrics
-            cls.add_metric(metrics, report, 'total_revenue', "Total Revenue (%s)" % curr_code, expenses.total_revenue.as_local(exchange), False)
-            cls.add_metric(metrics, report, 'total_revenue__kgc', "Total Revenue (%s/KgC)" % curr_code, cls.per_kilo(expenses.total_revenue, cherry, exchange), False)
+            for slug, label, value, is_cost in result['metrics']:
+                if not slug in metrics:
+                    metrics[slug] = SeasonMetric(season=report.season, slug=slug, label=label, is_cost=is_cost)
+                    report_values[slug] = []
 
-            cls.add_metric(metrics, report, 'total_expenses', "Total Expenses (%s)" % curr_code, expenses.total.as_local(exchange), True)
-            cls.add_metric(metrics, report, 'total_expenses__kgc', "Total Expenses (%s/KgC)" % curr_code, cls.per_kilo(expenses.total, cherry, exchange), True)
+                report_values[slug].append(ReportValue(report=report, value=value))
 
-            cls.add_metric(metrics, report, 'total_profit', "Total Profit (%s)" % curr_code, expenses.total_profit.as_local(exchange), False)
-            cls.add_metric(metrics, report, 'total_profit__kgc', "Total Profit (%s/KgC)" % curr_code, cls.per_kilo(expenses.total_profit, cherry, exchange), False)
+            if (index + 1) % 25 == 0:
+                log("Calculated metrics for %d of %d report(s)." % (index + 1, len(reports)))
 
-            cls.add_metric(metrics, report, 'fot_price', "FOT Price (%s/KgG)" % curr_code, sales.fot_price.as_local(exchange), False)
-            cls.add_metric(metrics, report, 'fot_price_kgc', "FOT Price (%s/KgC)" % curr_code, cls.per_kilo(sales.fot_price * sales.total_export_volume, cherry, exchange), False)
-            cls.add_metric(metrics, report, 'farmer_payment__sum', "Farmer Payment Sum (%s)" % curr_code, farmer.total_paid.as_local(exchange), False)
+    @classmethod
+    def calculate_for_season(cls, season, log=None):
+        """
+        Finalizes the passed in season, calculating the metrics for each finalized report and the
+        aggregates across all of them.  Everything is accumulated in memory and then inserted in bulk.
+
+        If passed in, log is called with progress messages as we go, FinalizeTask.log for example.
+        """
+        from reports.models import Report
+        from seasons.models import season_trees
 
-            cls.add_metric(metrics, report, 'total_revenue', "Total Revenue (%s)" % curr_code, expenses.total_revenue.as_local(exchange), False)
+        # make sure we use the current configuration for our season
+        season_trees.invalidate_season(season.pk)
 
-            cls.add_metric(metrics, report, 'total_cherry', "Total Cherry (KgC)", production.cherry_total, False)
-            cls.add_metric(metrics, report, 'total_parchment', "Total Parchment (KgP)", production.parchment_total, False)
-            cls.add_metric(metrics, report, 'total_green', "Total Green (KgG)", production.green_total, False)
+        # remove existing aggregates
+        SeasonAggregate.objects.filter(season=season).delete()
+        ReportValue.objects.filter(report__season=season).delete()
+        SeasonMetric.objects.filter(season=season).delete()
 
-            cls.add_metric(metrics, report, 'cherry_to_parchment_ratio', "Cherry to Parchment Ratio", production.cherry_to_parchment_ratio, True)
-            cls.add_metric(metrics, report, 'parchment_to_green_ratio', "Parchment to Green Ratio", production.parchment_to_green_ratio, True)
-            cls.add_metric(metrics, report, 'cherry_to_green_ratio', "Cherry to Green Ratio", production.cherry_to_green_ratio, True)
-            cls.add_metric(metrics, report, 'cherry_to_top_grade_ratio', "Cherry to Top Grade Ratio", production.cherry_to_top_grade_ratio, True)
-            cls.add_metric(metrics, report, 'top_grade_percentage', "Top Grade Percentage", production.top_grade_percentage, False)
+        if not log:
+            log = lambda message: None
 
-            # cash uses
-            for use in cash.get_uses():
-                cls.add_value(values, slugs, use.slug(), cls.per_kilo(use.total, cherry, exchange), False)
+        # the set of keys we've seen
+        slugs = dict()
 
-            # cash sources
-            for source in cash.get_sources():
-                cls.add_value(values, slugs, source.slug(), cls.per_kilo(source.total, cherry, exchange), False)
+        # running total, count, lowest and highest for each key
+        totals = dict()
 
-            # retained profit
-            cls.add_value(values, slugs, 'retained_profit', cls.per_kilo(cash.retained_profit, cherry, exchange), False)
+        # our report metrics
+        metrics = dict()
+        report_values = dict()
 
-            # farmer payments
-            for row in farmer.get_rows():
-                value = row.value
+        reports = list(Report.objects.filter(season=season, is_finalized=True))
+        log("Calculating metrics for %d report(s)." % len(reports))
 
-                # we store per kilo of green here, which we have to calculate using ratios otherwise it doesn't
-                # properly take into account parchment that is not milled
-                if not value is None and cherry and not green_ratio is None:
-                    # calculate per kilo of cherry
-                    value = value.as_local(exchange) / cherry * green_ratio
+        results = (cls.calculate_report_values(report) for report in reports)
+        cls.merge_report_values(reports, results, slugs, totals, metrics, report_values, log)
 
-                cls.add_value(values, slugs, row.slug(), value, False)
+        # calculate our average and best for each key
+        aggregates = dict()
+        for slug, is_cost in slugs.items():
+            average = lowest = highest = None
 
-                metric_label = "%s (%s/KgC)" % (row.label, curr_code)
-                if row.row_for == 'MEM':
-                    metric_label += " (Members)"
-                elif row.row_for == 'NON':
-                    metric_label += " (Non-Members)"
-                else:
-                    metric_label += " (All Farmers)"
-
-                cls.add_metric(metrics, report, row.slug(), metric_label, cls.per_kilo(row.value, cherry, exchange), False)
-
-            report_values.append(values)
-
-        # now for each key, calculate the average and best
-        for slug in slugs.keys():
-            is_cost = slugs[slug]
-            total = Decimal(0)
-            count = 0
-            lowest = None
-            highest = None
-
-            for report_value in report_values:
-                if slug in report_value:
-                    value = report_value[slug]
-                    if not value is None:
-                        total = total + value
-                        count += 1
-
-                        if lowest is None or value < lowest:
-                            lowest = value
-                            
-                        if highest is None or value > highest:
-                            highest = value
-
-            # calculate our mean
-            if count > 0:
+            if slug in totals:
+                total, count, lowest, highest = totals[slug]
                 average = total / count
-            else:
-                average = None
 
             if is_cost:
                 best = lowest
             else:
                 best = highest
 
-            # add our slug aggregate
-            SeasonAggregate.objects.create(season=season, slug=slug, average=average, lowest=lowest, 
-                                           highest=highest, best=best)
+            aggregates[slug] = SeasonAggregate(season=season, slug=slug, average=quantize(average), lowest=quantize(lowest),
+                                               highest=quantize(highest), best=quantize(best))
+
+        SeasonAggregate.objects.bulk_create(aggregates.values(), batch_size=BULK_BATCH_SIZE)
+        log("Saved %d season aggregate(s)." % len(aggregates))
+
+        # calculate the stats and ranks for each metric, then save them
+        for slug, metric in metrics.items():
+            metric.calculate_stats(report_values[slug])
+
+        SeasonMetric.objects.bulk_create(metrics.values(), batch_size=BULK_BATCH_SIZE)
+
+        # bulk inserts don't give us back ids, so look them up for our report values
+        metric_ids = dict(SeasonMetric.objects.filter(season=season).values_list('slug', 'id'))
+
+        values = []
+        for slug, metric_values in report_values.items():
+            for report_value in metric_values:
+                report_value.metric_id = metric_ids[slug]
+                values.append(report_value)
 
+        for start in range(0, len(values), BULK_BATCH_SIZE):
+            ReportValue.objects.bulk_create(values[start:start + BULK_BATCH_SIZE])
+            log("Saved %d of %d report value(s)." % (min(start + BULK_BATCH_SIZE, len(values)), len(values)))
 
         # set our gauge limits based on our aggregates
-        if 'farmer_payment' in slugs:
-            agg = SeasonAggregate.objects.get(season=season, slug='farmer_payment')
+        if 'farmer_payment' in aggregates:
+            agg = aggregates['farmer_payment']
             season.farmer_payment_left = agg.lowest
             season.farmer_payment_right = agg.highest
         
-        if 'cherry_to_green_ratio' in slugs:
-            agg = SeasonAggregate.objects.get(season=season, slug='cherry_to_green_ratio')
+        if 'cherry_to_green_ratio' in aggregates:
+            agg = aggregates['cherry_to_green_ratio']
             season.cherry_ratio_left = agg.highest
             season.cherry_ratio_right = agg.lowest
 
-        if 'production_cost' in slugs:
-            agg = SeasonAggregate.objects.get(season=season, slug='production_cost')
+        if 'production_cost' in aggregates:
+            agg = aggregates['production_cost']
             season.total_costs_left = agg.highest
             season.total_costs_right = agg.lowest
 
-        if 'fot_price' in slugs:
-            agg = SeasonAggregate.objects.get(season=season, slug='fot_price')
+        if 'fot_price' in aggregates:
+            agg = aggregates['fot_price']
             season.sale_price_left = agg.lowest
             season.sale_price_right = agg.highest
 
@@ -339,7 +487,7 @@ class SeasonAggregate(models.Model):
         season.is_finalized = True
         season.save()
 
-        return len(report_values)
+        return len(reports)
 
             
 
@@ -5,6 +5,7 @@ from datetime import datetime
 def finalize_season(task):  #pragma: no cover
     from .models import SeasonAggregate
     from django.db import transaction
+    from util.progress import get_progress_logger
 
     transaction.enter_transaction_management()
     transaction.managed()
@@ -16,7 +17,8 @@ def finalize_season(task):  #pragma: no cover
         
         transaction.commit()
 
-        report_count = SeasonAggregate.calculate_for_season(task.season)
+        # our progress is saved on its own connection so it can be seen while we are still working
+        report_count = SeasonAggregate.calculate_for_season(task.season, log=get_progress_logger(task))
 
         task.log("Season finished at %s\n" % datetime.now())
         task.log("%d finalized reports(s) included in season." % report_count)
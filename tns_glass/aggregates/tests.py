@@ -3,7 +3,7 @@ from ..tests import TNSTestCase
 from reports.tests.base import PDFTestCase
 from seasons.models import *
 from reports.models import *
-from .models import SeasonAggregate, FinalizeTask, ReportValue
+from .models import SeasonAggregate, FinalizeTask, ReportValue, SeasonMetric
 from django.core.urlresolvers import reverse
 
 class FinalizeTest(TNSTestCase):
@@ -131,7 +131,12 @@ class FinalizeTest(TNSTestCase):
         nasho_report = self.generate_report(self.nasho, Decimal("1"))
         coko_report = self.generate_report(self.coko, Decimal("2"))
 
-        SeasonAggregate.calculate_for_season(self.season)
+        messages = []
+        self.assertEquals(2, SeasonAggregate.calculate_for_season(self.season, log=messages.append))
+
+        # we log our progress as we go
+        self.assertEquals("Calculating metrics for 2 report(s).", messages[0])
+        self.assertTrue(messages[-1].startswith("Saved %d of %d report value(s)" % (ReportValue.objects.count(), ReportValue.objects.count())))
 
         aggs = SeasonAggregate.for_season(self.season)
 
@@ -170,6 +175,18 @@ class FinalizeTest(TNSTestCase):
         self.assertEquals(1, ReportValue.objects.get(report=nasho_report, metric__slug='total_profit').rank())
         self.assertEquals(2, ReportValue.objects.get(report=coko_report, metric__slug='total_profit').rank())
 
+        # ranks and season values are also available for a whole report at once
+        ranks = ReportValue.ranks_for_report(coko_report)
+        self.assertEquals(2, ranks['total_expenses']['rank'])
+        self.assertDecimalEquals("-43000", ranks['total_profit']['value'])
+        self.assertDecimalEquals("-43000", ranks['total_profit']['min'])
+        self.assertDecimalEquals("-21500", ranks['total_profit']['best'])
+        self.assertEquals(-32250.0, ranks['total_profit']['avg'])
+
+        # and match what we get when recalculating them from scratch
+        SeasonMetric.recalculate_for_season(self.season)
+        self.assertEquals(ranks, ReportValue.ranks_for_report(coko_report))
+
         # reload our season
         season = Season.objects.get(pk=self.season.pk)
 
@@ -188,6 +205,21 @@ class FinalizeTest(TNSTestCase):
 
     test_two_different_reports.active = True
 
+    def test_report_values(self):
+        import pickle
+        nasho_report = self.generate_report(self.nasho, Decimal("1"))
+
+        # report values are plain values, nothing in them refers back to our report
+        result = pickle.loads(pickle.dumps(SeasonAggregate.calculate_report_values(nasho_report)))
+
+        self.assertDecimalEquals("20", result['values']['expense__%d' % self.expense_cherry_advance.id])
+        self.assertTrue(result['slugs']['total_expenses'])
+        self.assertFalse(result['slugs']['total_profit'])
+
+        metrics = dict((slug, value) for slug, label, value, is_cost in result['metrics'])
+        self.assertDecimalEquals("21.80", metrics['total_expenses__kgc'])
+        self.assertEquals(nasho_report.farmer_price, result['farmer_price'])
+
 
 
         
@@ -1,7 +1,67 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
 from django.template import Context, Template
+from django.utils.translation import get_language
+from django.utils.encoding import smart_str
 from rapidsms_xforms.models import XForm
 from django.utils.translation import ugettext_lazy as _
+from collections import OrderedDict
+from hashlib import md5
+import threading
+
+class TemplateCache(object):
+    """
+    A process local LRU cache of compiled message templates.  Compiling templates is by far the most
+    expensive part of sending out CCs and reminders, and we send the same handful of messages
+    over and over again.
+
+    Templates are keyed by (form, slug, language, message hash), so an edited message always gets
+    compiled fresh, even when it was edited in another process.  We only cache the compiled templates,
+    the messages themselves are always read from the database.
+    """
+    def __init__(self, size=500):
+        self.size = size
+        self.templates = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_template(self, message, form_id=None, slug=None, prefix="{% load messages %}"):
+        """
+        Returns the compiled template for the passed in message, compiling it if we haven't seen it.
+        """
+        key = (form_id, slug, get_language(), md5(smart_str(prefix + message)).hexdigest())
+
+        with self.lock:
+            template = self.templates.pop(key, None)
+            if template is not None:
+                self.hits += 1
+                self.templates[key] = template
+                return template
+
+        # compile outside of our lock, this can raise if the template is invalid
+        template = Template(prefix + message)
+
+        with self.lock:
+            self.misses += 1
+            self.templates[key] = template
+            while len(self.templates) > self.size:
+                self.templates.popitem(last=False)
+
+        return template
+
+    def invalidate(self, sender=None, **kwargs):
+        """
+        Throws away everything we have cached, can be used directly as a signal receiver.
+        """
+        with self.lock:
+            self.templates = OrderedDict()
+
+    def get_stats(self):
+        return dict(size=len(self.templates), hits=self.hits, misses=self.misses)
+
+# shared by blurbs, ccs, reminders and broadcasts
+template_cache = TemplateCache()
 
 class Blurb(models.Model):
     """
@@ -31,19 +91,36 @@ class Blurb(models.Model):
             Blurb.objects.create(form=form, slug=slug, description=default, message=default)
             template = default
 
-        return render(template, variables)
+        return render(template, variables, form_id=form.pk, slug=slug)
 
     def __unicode__(self):
         return "%s (%s)" % (self.form.name, self.slug)
 
+post_save.connect(template_cache.invalidate, sender=Blurb, dispatch_uid='invalidate_blurb_templates')
+post_delete.connect(template_cache.invalidate, sender=Blurb, dispatch_uid='invalidate_blurb_deletes')
+post_save.connect(template_cache.invalidate, sender=XForm, dispatch_uid='invalidate_xform_templates')
+post_delete.connect(template_cache.invalidate, sender=XForm, dispatch_uid='invalidate_xform_deletes')
 
-def render(message, variables):
+def render(message, variables, form_id=None, slug=None):
     """
     Renders a template given a template string and values to substitute.
     """
     try:
-        template = Template("{% load messages %}" + message)
+        template = template_cache.get_template(message, form_id, slug)
         context = Context(variables)
         return template.render(context)
     except:
         return message
+
+def render_response(xform, variables):
+    """
+    Renders the response of the passed in xform with the passed in variables, the same as
+    XForm.render_response() but using our cache of compiled templates.
+    """
+    try:
+        template = template_cache.get_template(xform.response, xform.pk, 'response')
+    except Exception:
+        # leave responses that don't compile to xforms, so they fail the same way they always have
+        return XForm.render_response(xform.response, variables)
+
+    return template.render(Context(variables))
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from smartmin.models import SmartModel
 
 from sms.models import *
@@ -7,16 +7,18 @@ from csps.models import CSP
 from locales.models import Country
 from seasons.models import Season
 
-from rapidsms_httprouter.router import get_router
 from rapidsms_httprouter.models import Message
 from reports.models import Report
 from aggregates.models import ReportValue, SeasonMetric
 
 from django.db.models import Sum
 from datetime import timedelta
+from functools import partial
+from util.outbox import Outbox
 
 from django.utils.translation import ugettext_lazy as _
-from django.template import Context, Template
+from django.template import Context
+from blurbs.models import template_cache
 
 class Broadcast(SmartModel):
     RECIPIENT_CHOICES = (('F', "Farmers"),
@@ -110,125 +112,176 @@ class Broadcast(SmartModel):
 
         return wetmills.order_by('name')
 
-    def add_report_context(self, context, report):
-        # plug all our report values into our context
-        for value in ReportValue.objects.filter(report=report):
-            context[value.metric.slug] = value.value
+    def get_report_contexts(self, wetmills):
+        """
+        Returns a dict of wetmill id to the report values for that wetmill, including ranks and season
+        values for each metric.  Only wetmills with finalized reports are included.
+        """
+        contexts = dict()
+
+        reports = dict()
+        for report in Report.objects.filter(season=self.report_season, wetmill__in=wetmills, is_finalized=True):
+            reports[report.pk] = report.wetmill_id
 
-            # throw in our rank slug
+        if not reports:
+            return contexts
+
+        # plug all our report values into our context, ranks and season values are precomputed
+        # when the season is finalized
+        for value in ReportValue.objects.filter(report__in=reports.keys()).select_related('metric'):
+            context = contexts.setdefault(reports[value.report_id], dict())
+
+            context[value.metric.slug] = value.value
             context["%s__rank" % value.metric.slug] = value.rank()
 
-            # throw in our season slugs
             season_values = value.get_season_values()
             for key in season_values.keys():
                 context["%s__%s" % (value.metric.slug, key)] = season_values[key]
 
-    def add_sms_context(self, context, wetmill, now):
-        previous_sitoki = SitokiSubmission.objects.filter(season=self.sms_season, wetmill=wetmill, 
-                                                          active=True).order_by('-start_of_week')
-
-        sitoki_end = None
-        cherry_end = None
-
-        context['sms_cherry_purchased'] = Decimal(0)
-        context['sms_parchment_processed'] = Decimal(0)
-        context['sms_cherry_to_parchment_ratio'] = Decimal(0)
-
-        if previous_sitoki:
-            sitoki_end = previous_sitoki[0].start_of_week
-            cherry_end = sitoki_end - timedelta(days=10)
+        return contexts
 
-            # get all ibitumbwe submissions that ocurred
-            subs = IbitumbweSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                      active=True, report_day__lte=cherry_end)
+    def get_sms_contexts(self, wetmills, now):
+        """
+        Returns a dict of wetmill id to the SMS variables for that wetmill.  This is done in a query
+        per message type for all wetmills at once.
+        """
+        today = now.date() if isinstance(now, datetime) else now
+
+        # the cherry purchased per day for each wetmill
+        ibitumbwe = dict()
+        for row in IbitumbweSubmission.objects.filter(season=self.sms_season, wetmill__in=wetmills, active=True)\
+                                              .values('wetmill', 'report_day').order_by().annotate(Sum('cherry_purchased')):
+            ibitumbwe.setdefault(row['wetmill'], []).append(row)
+
+        # parchment stored per week
+        sitoki = dict()
+        for row in SitokiSubmission.objects.filter(season=self.sms_season, wetmill__in=wetmills, active=True)\
+                                           .values('wetmill', 'start_of_week').order_by()\
+                                           .annotate(Sum('grade_a_stored'), Sum('grade_b_stored'), Sum('grade_c_stored')):
+            sitoki.setdefault(row['wetmill'], []).append(row)
+
+        # and expenses per week
+        amafaranga = dict()
+        for row in AmafarangaSubmission.objects.filter(season=self.sms_season, wetmill__in=wetmills, active=True)\
+                                               .values('wetmill', 'start_of_week').order_by()\
+                                               .annotate(Sum('working_capital'), Sum('full_time_labor'), Sum('casual_labor'),
+                                                         Sum('commission'), Sum('transport'), Sum('other_expenses')):
+            amafaranga.setdefault(row['wetmill'], []).append(row)
+
+        def total(rows, field):
+            return sum([row[field] for row in rows], Decimal(0))
+
+        contexts = dict()
+        for wetmill in wetmills:
+            context = dict()
+            contexts[wetmill.pk] = context
+
+            wetmill_ibitumbwe = ibitumbwe.get(wetmill.pk, [])
+            wetmill_sitoki = sitoki.get(wetmill.pk, [])
+            wetmill_amafaranga = amafaranga.get(wetmill.pk, [])
+
+            context['sms_cherry_purchased'] = Decimal(0)
+            context['sms_parchment_processed'] = Decimal(0)
+            context['sms_cherry_to_parchment_ratio'] = Decimal(0)
+
+            if wetmill_sitoki:
+                sitoki_end = max([row['start_of_week'] for row in wetmill_sitoki])
+                cherry_end = sitoki_end - timedelta(days=10)
+
+                # get the sum of cherry purchased
+                subs = [row for row in wetmill_ibitumbwe if row['report_day'] <= cherry_end]
+                if subs:
+                    context['sms_cherry_purchased'] = total(subs, 'cherry_purchased__sum')
+
+                context['sms_parchment_processed'] = total(wetmill_sitoki, 'grade_a_stored__sum') + \
+                                                     total(wetmill_sitoki, 'grade_b_stored__sum') + \
+                                                     total(wetmill_sitoki, 'grade_c_stored__sum')
+
+                if context['sms_parchment_processed'] > Decimal(0):
+                    ratio = context['sms_cherry_purchased'] / context['sms_parchment_processed']
+                    ratio = ratio.quantize(Decimal(".01"))
+                    context['sms_cherry_to_parchment_ratio'] = ratio
+
+            subs = [row for row in wetmill_amafaranga if row['start_of_week'] <= today]
+
+            casual_labor = Decimal(0)
+            context['sms_working_cap'] = Decimal(0)
+            context['sms_working_cap_non_cherry_percent'] = Decimal(0)
 
-            # get the sum of cherry purchased
             if subs:
-                context['sms_cherry_purchased'] = subs.aggregate(Sum('cherry_purchased'))['cherry_purchased__sum']
+                working_capital = total(subs, 'working_capital__sum')
+                context['sms_working_cap'] = working_capital
 
-            # get all sitoki submissions
-            subs = SitokiSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                   active=True, start_of_week__lte=sitoki_end)
+                non_cherry = total(subs, 'full_time_labor__sum') + total(subs, 'casual_labor__sum') + total(subs, 'commission__sum') + \
+                             total(subs, 'transport__sum') + total(subs, 'other_expenses__sum')
 
-            sums = subs.aggregate(Sum('grade_a_stored'), Sum('grade_b_stored'), Sum('grade_c_stored'))
-            if subs:
-                context['sms_parchment_processed'] = sums['grade_a_stored__sum'] + sums['grade_b_stored__sum'] + sums['grade_c_stored__sum']
+                context['sms_working_cap_non_cherry_percent'] = (non_cherry * Decimal("100") / working_capital).quantize(Decimal("1"))
+                casual_labor = total(subs, 'casual_labor__sum')
 
-            if context['sms_parchment_processed'] > Decimal(0):
-                ratio = context['sms_cherry_purchased'] / context['sms_parchment_processed']
-                ratio = ratio.quantize(Decimal(".01"))
-                context['sms_cherry_to_parchment_ratio'] = ratio
+            context['last_amafaranga_submission'] = max([row['start_of_week'] for row in subs]) if subs else None
 
-        subs = AmafarangaSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                   active=True, start_of_week__lte=now)
+            subs = [row for row in wetmill_ibitumbwe if row['report_day'] <= today]
 
-        casual_labor = Decimal(0)
-        context['sms_working_cap'] = Decimal(0)
-        context['sms_working_cap_non_cherry_percent'] = Decimal(0)
+            context['sms_casual_labor_kgc'] = Decimal(0)
+            if subs and casual_labor > Decimal(0):
+                cherry_purchased_ytd = total(subs, 'cherry_purchased__sum')
 
-        if subs:
-            sums = subs.aggregate(Sum('working_capital'), Sum('full_time_labor'), Sum('casual_labor'), 
-                                  Sum('commission'), Sum('transport'), Sum('other_expenses'))
-            working_capital = sums['working_capital__sum']
+                if cherry_purchased_ytd > Decimal(0):
+                    context['sms_casual_labor_kgc'] = (casual_labor / cherry_purchased_ytd).quantize(Decimal(".01"))
 
-            context['sms_working_cap'] = working_capital
+            context['last_ibitumbwe_submission'] = max([row['report_day'] for row in subs]) if subs else None
 
-            non_cherry = sums['full_time_labor__sum'] + sums['casual_labor__sum'] + sums['commission__sum'] + sums['transport__sum'] + sums['other_expenses__sum']
+            subs = [row for row in wetmill_sitoki if row['start_of_week'] <= today]
+            context['last_sitoki_submission'] = max([row['start_of_week'] for row in subs]) if subs else None
 
-            context['sms_working_cap_non_cherry_percent'] = (non_cherry * Decimal("100") / working_capital).quantize(Decimal("1"))
-            casual_labor = sums['casual_labor__sum']
+            context['today'] = now
 
-        subs = IbitumbweSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                  active=True, report_day__lte=now)
+        return contexts
 
-        context['sms_casual_labor_kgc'] = Decimal(0)
-        if subs and casual_labor > Decimal(0):
-            cherry_purchased_ytd = subs.aggregate(Sum('cherry_purchased'))['cherry_purchased__sum']
+    def get_wetmill_contexts(self, wetmills, now, total_wetmills=None):
+        """
+        Builds the context for each of the passed in wetmills, returning a dict of wetmill id to
+        context.  This does everything up front, in a few queries for all the wetmills, so that
+        rendering each message is just a matter of substituting values.
+        """
+        if total_wetmills is None:
+            total_wetmills = len(self.get_wetmills())
 
-            if cherry_purchased_ytd > Decimal(0):
-                context['sms_casual_labor_kgc'] = (casual_labor / cherry_purchased_ytd).quantize(Decimal(".01"))
+        contexts = dict()
+        for wetmill in wetmills:
+            contexts[wetmill.pk] = dict(total_wetmills=total_wetmills)
 
-        subs = IbitumbweSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                  active=True, report_day__lte=now).order_by('-report_day')
-        if subs:
-            context['last_ibitumbwe_submission'] = subs[0].report_day
-        else:
-            context['last_ibitumbwe_submission'] = None
+        # if we have a finalized report, and the season is finalized
+        if self.report_season and self.report_season.is_finalized:
+            for wetmill_id, context in self.get_report_contexts(wetmills).items():
+                contexts[wetmill_id].update(context)
 
-        subs = SitokiSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                               active=True, start_of_week__lte=now).order_by('-start_of_week')
-        if subs:
-            context['last_sitoki_submission'] = subs[0].start_of_week
-        else:
-            context['last_sitoki_submission'] = None
+        # if we are an SMS message, insert those variables
+        if self.sms_season:
+            for wetmill_id, context in self.get_sms_contexts(wetmills, now).items():
+                contexts[wetmill_id].update(context)
 
-        subs = AmafarangaSubmission.objects.filter(season=self.sms_season, wetmill=wetmill,
-                                                  active=True, start_of_week__lte=now).order_by('-start_of_week')
-        if subs:
-            context['last_amafaranga_submission'] = subs[0].start_of_week
-        else:
-            context['last_amafaranga_submission'] = None
+        return contexts
 
-        context['today'] = now
+    def add_report_context(self, context, report):
+        context.update(self.get_report_contexts([report.wetmill]).get(report.wetmill_id, dict()))
 
-    def render(self, wetmill, actor, now):
+    def add_sms_context(self, context, wetmill, now):
+        context.update(self.get_sms_contexts([wetmill], now)[wetmill.pk])
+
+    def render(self, wetmill, actor, now, contexts=None):
         """
-        Renders this template for the passed in actor
+        Renders this template for the passed in actor.  Callers rendering for many wetmills should
+        pass in the contexts from get_wetmill_contexts()
         """
-        total_wetmills = len(self.get_wetmills())
-        context = dict(wetmill=wetmill, actor=actor, total_wetmills=total_wetmills)
+        if contexts is None:
+            contexts = self.get_wetmill_contexts([wetmill], now)
 
-        # if we have a finalized report, and the season is finalized
-        if self.report_season and self.report_season.is_finalized:
-            report = Report.get_for_wetmill_season(wetmill, self.report_season)
-            if report and report.is_finalized:
-                self.add_report_context(context, report)
+        context = dict(contexts[wetmill.pk])
+        context['wetmill'] = wetmill
+        context['actor'] = actor
 
-        # if we are an SMS message, insert those variables
-        if self.sms_season:
-            self.add_sms_context(context, wetmill, now)
-
-        t = Template(self.text)
+        t = template_cache.get_template(self.text, prefix="")
         return t.render(Context(context)).strip()
 
     def get_recipients_for_wetmill(self, wetmill):
@@ -269,29 +322,39 @@ class Broadcast(SmartModel):
         """
         send the message to all connections linked to a broadcast object 
         """
-        router = get_router()
         now = datetime.now()
+        outbox = Outbox(links=[self.messages])
 
-        for wetmill in self.get_wetmills():
+        # build the context for all our wetmills up front
+        wetmills = list(self.get_wetmills())
+        contexts = self.get_wetmill_contexts(wetmills, now, len(wetmills))
+
+        for wetmill in wetmills:
             recipients = self.get_recipients_for_wetmill(wetmill)
 
-            # for each recipient, render the message
+            # for each recipient, queue up the message, it is rendered when the outbox is sent
             for recipient in recipients:
-                try:
-                    message_text = self.render(wetmill, recipient, now)
-
-                    # ignore messages that have no content (if statements make this possible)
-                    if message_text:
-                        db_message = router.add_outgoing(recipient.connection, message_text)
-                        self.messages.add(db_message)
-                        
-                except Exception as e: #pragma: no cover
-                    print("Error sending broadcast: %d for recipient: %d and wetmill %d" %
-                          (self.id, recipient.id, wetmill.id), e)
+                outbox.add(recipient.connection, partial(self.render, wetmill, recipient, now, contexts))
+
+        outbox.send()
 
         self.sent = True
         self.save()
 
+    def claim_and_send(self):
+        """
+        Claims this broadcast and sends it inside a single transaction, so if the send dies part way
+        through neither the claim nor the queued messages are committed and the broadcast will be
+        picked up again.  Errors for individual recipients are logged by the outbox and don't stop
+        the send.  Returns whether we sent it, another worker may have beaten us to it.
+        """
+        with transaction.commit_on_success():
+            claimed = Broadcast.objects.filter(pk=self.pk, sent=False).update(sent=True)
+            if claimed:
+                self.send()
+
+        return bool(claimed)
+
     def add_report_variables(self, variables):
         variables.append(dict(slug='total_wetmills', label="Number of Wetmills"))
         for metric in SeasonMetric.objects.filter(season=self.report_season):
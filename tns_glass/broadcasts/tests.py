@@ -10,6 +10,7 @@ from sms.models import Farmer, Accountant, WetmillObserver, SitokiSubmission, Am
 from decimal import Decimal
 from reports.models import Report
 from aggregates.models import ReportValue, SeasonAggregate
+from util.outbox import Outbox
 
 class BroadcastTestCase(TNSTestCase):
 
@@ -201,6 +202,16 @@ class BroadcastTestCase(TNSTestCase):
 
         self.assertEquals("21800 1/2", broadcast.render(self.nasho, accountant, now))
 
+        # contexts built up front match looking up each value on its own
+        contexts = broadcast.get_wetmill_contexts(list(broadcast.get_wetmills()), now)
+        self.assertEquals("21800 1/2", broadcast.render(self.nasho, accountant, now, contexts))
+
+        for value in ReportValue.objects.filter(report=nasho_report):
+            season_values = value.get_season_values()
+            self.assertEquals(value.rank(), contexts[self.nasho.pk]["%s__rank" % value.metric.slug])
+            self.assertEquals(season_values['best'], contexts[self.nasho.pk]["%s__best" % value.metric.slug])
+            self.assertEquals(season_values['avg'], contexts[self.nasho.pk]["%s__avg" % value.metric.slug])
+
         # try an if statement, make sure we strip spaces out
         broadcast.text = "{% if total_expenses < 0 %}This won't be shown{%endif%}  "
         broadcast.save()
@@ -330,6 +341,61 @@ class BroadcastTestCase(TNSTestCase):
         self.assertEquals(self.conn1, messages[0].connection)
         self.assertEquals("Hi Nasho", messages[0].text)
 
+        # claiming a broadcast that has already been sent does nothing
+        self.assertFalse(broadcast.claim_and_send())
+        self.assertEquals(1, broadcast.messages.count())
+
+        # otherwise we claim and send it
+        Broadcast.objects.filter(pk=broadcast.pk).update(sent=False)
+        broadcast.messages.all().delete()
+        self.assertTrue(broadcast.claim_and_send())
+        self.assertTrue(Broadcast.objects.get(pk=broadcast.pk).sent)
+        self.assertEquals(1, broadcast.messages.count())
+
+        # an error rendering the message for one recipient doesn't keep the others from getting theirs
+        Broadcast.objects.filter(pk=broadcast.pk).update(sent=False, text="Hello {{ wetmill.name }}")
+        broadcast.messages.all().delete()
+        broadcast = Broadcast.objects.get(pk=broadcast.pk)
+
+        render = broadcast.render
+        def broken_render(wetmill, actor, now, contexts=None):
+            if wetmill == self.nasho:
+                raise Exception("Broken")
+            return render(wetmill, actor, now, contexts)
+        broadcast.render = broken_render
+
+        self.assertTrue(broadcast.claim_and_send())
+        self.assertTrue(Broadcast.objects.get(pk=broadcast.pk).sent)
+
+        messages = broadcast.messages.all()
+        self.assertEquals(1, len(messages))
+        self.assertEquals(self.conn2, messages[0].connection)
+        self.assertEquals("Hello Coko", messages[0].text)
+
+    def test_outbox(self):
+        self.create_connections()
+
+        broadcast = Broadcast.objects.create(recipients='F',
+                                             text="Hello",
+                                             country=self.rwanda,
+                                             created_by=self.admin,
+                                             modified_by=self.admin)
+
+        outbox = Outbox(batch_size=2, links=[broadcast.messages])
+        outbox.add(self.conn1, lambda: "One")
+        outbox.add(self.conn2, lambda: "Two", 'rw')
+        outbox.add(self.conn1, lambda: "")
+        outbox.add(self.conn2, lambda: "Three")
+
+        sent = outbox.send()
+
+        # empty messages are skipped and messages with the same language are sent together
+        self.assertEquals(["One", "Three", "Two"], [message.text for message in sent])
+        self.assertEquals([1, 2], [timing['messages'] for timing in outbox.timings])
+
+        # and all are linked to our broadcast
+        self.assertEquals(set([message.pk for message in sent]), set([message.pk for message in broadcast.messages.all()]))
+
     def test_views(self):
         self.season = self.rwanda_2010
         self.configure_season()
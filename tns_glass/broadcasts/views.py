@@ -123,10 +123,14 @@ class BroadcastCRUDL(SmartCRUDL):
             broadcast = self.object
             broadcast.text = self.request.REQUEST.get('text', broadcast.text)
 
-            for wetmill in broadcast.get_wetmills():
+            now = datetime.now()
+            wetmills = list(broadcast.get_wetmills())
+            contexts = broadcast.get_wetmill_contexts(wetmills, now, len(wetmills))
+
+            for wetmill in wetmills:
                 for recipient in broadcast.get_recipients_for_wetmill(wetmill):
                     try:
-                        text = broadcast.render(wetmill, recipient, datetime.now())
+                        text = broadcast.render(wetmill, recipient, now, contexts)
 
                         if text:
                             messages.append(dict(number=recipient.connection.identity, text=text, wetmill=wetmill))
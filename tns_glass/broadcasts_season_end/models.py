@@ -9,12 +9,14 @@ from reports.models import Report
 from aggregates.models import ReportValue, SeasonMetric
 
 from django.utils.translation import ugettext_lazy as _
-from django.template import Context, Template
+from django.template import Context
+from blurbs.models import template_cache
 
-from rapidsms_httprouter.router import get_router
 from rapidsms_httprouter.models import Message
+from util.outbox import Outbox
 
 from datetime import datetime
+from functools import partial
 
 
 """
@@ -98,17 +100,12 @@ class BroadcastsOnSeasonEnd(SmartModel):
         return wetmills.order_by('name')
 
     def add_report_context(self, context, report):
-        # plug all our report values into our context
-        for value in ReportValue.objects.filter(report=report):
-            context[value.metric.slug] = value.value
+        # plug all our report values, ranks and season values into our context
+        for slug, values in ReportValue.ranks_for_report(report).items():
+            context[slug] = values['value']
 
-            # throw in our rank slug
-            context["%s__rank" % value.metric.slug] = value.rank()
-
-            # throw in our season slugs
-            season_values = value.get_season_values()
-            for key in season_values.keys():
-                context["%s__%s" % (value.metric.slug, key)] = season_values[key]
+            for key in ('rank', 'avg', 'min', 'max', 'best'):
+                context["%s__%s" % (slug, key)] = values[key]
 
     def render(self, wetmill, report_season, actor, now):
         """
@@ -123,33 +120,24 @@ class BroadcastsOnSeasonEnd(SmartModel):
             if report and report.is_finalized:
                 self.add_report_context(context, report)
 
-        t = Template(self.text)
+        t = template_cache.get_template(self.text, prefix="")
         return t.render(Context(context)).strip()
 
     def send(self, wetmill_chosen, season):
         """
         send the message to all connections linked to a broadcast object
         """
-        router = get_router()
         now = datetime.now()
+        outbox = Outbox(links=[self.messages])
 
         msg_recipients = self.get_recipients_for_wetmill(wetmill_chosen)
 
-        # for each recipient, render the message
+        # for each recipient, queue up the message, it is rendered when the outbox is sent
         for recipient in msg_recipients:
-            try:
-                message_text = self.render(wetmill_chosen, season, recipient, now)
-
-                # ignore messages that have no content (if statements make this possible)
-                if message_text:
-                    db_message = router.add_outgoing(recipient.connection, message_text)
-                    self.messages.add(db_message)
-                    self.report_seasons.add(season)
-                    self.wetmills.add(wetmill_chosen)
-
+            outbox.add(recipient.connection, partial(self.render, wetmill_chosen, season, recipient, now))
 
-            except Exception as e:
-                print("Error sending end of season messages: %d for recipient: %d and wetmill %d" %
-                      (self.name, recipient.id, wetmill_chosen.id), e)
+        if outbox.send():
+            self.report_seasons.add(season)
+            self.wetmills.add(wetmill_chosen)
 
         self.save()
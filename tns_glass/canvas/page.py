@@ -1,13 +1,61 @@
 import os
+import threading
 from datetime import datetime
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.pdfmetrics import stringWidth, getAscent, getDescent
 
 from django.conf import settings
 from django.utils.translation import ugettext as _
 
+class ResourceCache(object):
+    """
+    A process local cache of the images and font metrics used when rendering PDFs.  When drawing
+    an image from a path ReportLab reads and decodes the file again for every PDF, which for our
+    maps and logos is a good part of the time spent rendering.
+
+    Images are decoded once, the first time they are asked for, and then shared by every PDF
+    rendered in this process.  Our images are part of the code base, so we never throw them away.
+    """
+    def __init__(self):
+        self.images = dict()
+        self.metrics = dict()
+        self.lock = threading.Lock()
+
+    def get_image(self, path):
+        """
+        Returns a decoded ImageReader for the image at the passed in path
+        """
+        image = self.images.get(path, None)
+        if image is not None:
+            return image
+
+        # decode outside of our lock, once cached, images are only ever read
+        image = ImageReader(path)
+        image.getRGBData()
+        if getattr(image, '_dataA', None):
+            image._dataA.getRGBData()
+
+        with self.lock:
+            return self.images.setdefault(path, image)
+
+    def get_metrics(self, font, size):
+        """
+        Returns the ascent and descent of the passed in font and size, the descent is negative
+        """
+        key = (font, size)
+        metrics = self.metrics.get(key, None)
+        if metrics is None:
+            metrics = (getAscent(font, size), getDescent(font, size))
+            self.metrics[key] = metrics
+
+        return metrics
+
+# shared by our reports and scorecards
+resources = ResourceCache()
+
 class PDFPage(object):
 
     PAGE_WIDTH = A4[0]
@@ -187,11 +235,35 @@ class PDFPage(object):
 
         return self.BOX_HEIGHT + self.BOX_PADDING
 
+    def calculate_font_metrics(self):
+        """
+        Calculates the heights of our header and box rows from their fonts
+        """
+        (ascent, descent) = resources.get_metrics(self.HEADER_FONT, self.HEADER_SIZE)
+        self.HEADER_ASCENT = ascent
+        self.HEADER_DESCENT = -descent
+        self.HEADER_HEIGHT = self.HEADER_ASCENT + self.HEADER_DESCENT + self.HEADER_PADDING * 2
+
+        (ascent, descent) = resources.get_metrics(self.BOX_FONT, self.BOX_SIZE)
+        self.BOX_ASCENT = ascent
+        self.BOX_DESCENT = -descent
+        self.BOX_HEIGHT = self.BOX_ASCENT + self.BOX_DESCENT + self.BOX_PADDING * 2
+
+    def get_font_ascent(self, font, size):
+        return resources.get_metrics(font, size)[0]
+
+    def get_font_descent(self, font, size):
+        return resources.get_metrics(font, size)[1]
+
+    def get_image(self, path):
+        return resources.get_image(path)
+
     def get_line_height(self):
-        return getAscent(self.font, self.size) - getDescent(self.font, self.size) + self.BOX_PADDING
+        (ascent, descent) = resources.get_metrics(self.font, self.size)
+        return ascent - descent + self.BOX_PADDING
 
     def get_ascent(self):
-        return getAscent(self.font, self.size)
+        return self.get_font_ascent(self.font, self.size)
 
     def get_width(self, text):
         return stringWidth(text, self.font, self.size)
@@ -374,7 +446,7 @@ class PDFPage(object):
         c.saveState()
         c.translate(self.WIDTH-self.PAGE_MARGIN-self.TNS_LOGO_WIDTH, y+self.TNS_LOGO_HEIGHT)
         c.scale(1.0,-1.0)
-        (width, height) = c.drawImage(self.TNS_LOGO, 0, 0, 
+        (width, height) = c.drawImage(self.get_image(self.TNS_LOGO), 0, 0, 
                                       width=self.TNS_LOGO_WIDTH, height=self.TNS_LOGO_HEIGHT,
                                       mask='auto', preserveAspectRatio=True, anchor='nw')
         c.restoreState()
@@ -1 +1,40 @@
-# Create your views here.
+import os
+import tempfile
+from django.core.servers.basehttp import FileWrapper
+from django.http import StreamingHttpResponse
+
+# PDFs bigger than this are spooled to disk while they are sent instead of being kept in memory
+PDF_SPOOL_SIZE = 1024 * 1024
+
+def pdf_file_response(pdf, filename, size):
+    """
+    Returns a response that streams the passed in open PDF file as an attachment, the file is
+    closed once the response has been sent.
+    """
+    response = StreamingHttpResponse(FileWrapper(pdf), content_type='application/pdf')
+    response['Content-Length'] = size
+    response['Content-Disposition'] = 'attachment; filename=%s' % filename
+    return response
+
+def render_pdf_response(render, filename):
+    """
+    Calls render with a file to write a PDF to and returns a response that streams it out.  Small
+    PDFs stay in memory, large ones are spooled to a temporary file, either way we only ever hold
+    a single copy of the PDF.
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+    try:
+        render(output)
+    except:
+        output.close()
+        raise
+
+    size = output.tell()
+    output.seek(0)
+    return pdf_file_response(output, filename, size)
+
+def open_pdf_response(path, filename):
+    """
+    Returns a response that streams the PDF at the passed in path
+    """
+    return pdf_file_response(open(path, 'rb'), filename, os.path.getsize(path))
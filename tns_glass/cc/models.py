@@ -1,12 +1,14 @@
 from django.db import models
-from django.template import Context, Template
+from django.db.models.signals import post_save, post_delete
+from django.template import Context
 from django.contrib.contenttypes.models import ContentType
-from django.utils.translation import trans_real
 from django.db.utils import DatabaseError
 
 from rapidsms_xforms.models import XForm
-from rapidsms_httprouter.router import get_router
+from util.outbox import Outbox
+from functools import partial
 from django.utils.translation import ugettext_lazy as _
+from blurbs.models import template_cache
 
 def get_valid_reporter_types():
     """
@@ -85,35 +87,28 @@ class MessageCC(models.Model):
           recipients: the people who should receive the CC.  should be an iterable collection of Actors
           values: dict that will be used for any variable substitution
         """
-        orig = trans_real.get_language()
-        
-        router = get_router()
-        for recipient in recipients:
-            try:
-                # do not send to our sender
-                if recipient.connection == sender:
-                    continue
+        outbox = Outbox()
 
-                # activate our language if there is one
-                if getattr(recipient, 'language', None):
-                    trans_real.activate(recipient.language)
+        for recipient in recipients:
+            # do not send to our sender
+            if recipient.connection == sender:
+                continue
 
-                # render our message
-                message = self.render_message(values)
+            # our message is rendered in the recipient's language if they have one
+            outbox.add(recipient.connection, partial(self.render_message, values),
+                       getattr(recipient, 'language', None))
 
-                # and send it off
-                router.add_outgoing(recipient.connection, message)
-            finally:
-                trans_real.activate(orig)
+        outbox.send()
 
     def render_message(self, variables):
         """
         Renders this message, substituting any variables based on the variables passed in.
         """
-        # build our template
-        template = Template("{% load messages %}" + self.message)
+        # look up our compiled template
+        template = template_cache.get_template(self.message, self.form_id, 'cc-%s' % self.slug)
         context = Context(variables)
         return template.render(context)
-        
-        
+
+post_save.connect(template_cache.invalidate, sender=MessageCC, dispatch_uid='invalidate_cc_templates')
+post_delete.connect(template_cache.invalidate, sender=MessageCC, dispatch_uid='invalidate_cc_deletes')
 
@@ -0,0 +1,36 @@
+from optparse import make_option
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from seasons.models import Season
+from dashboard.models import WetmillSeasonRollup
+
+class Command(BaseCommand):
+    """
+    Rebuilds the dashboard rollups of every wetmill from their submissions.  Rollups are kept up to
+    date as submissions change, this is for filling them in the first time or after editing
+    submissions directly in the database.
+    """
+    help = 'Rebuilds the SMS dashboard rollups for all seasons, or just the passed in one'
+    option_list = BaseCommand.option_list + (
+        make_option('--season',
+                    type='int',
+                    dest='season',
+                    default=None,
+                    help='The id of the season to rebuild, defaults to all seasons.'),)
+
+    def handle(self, *args, **options):
+        seasons = Season.objects.all().order_by('country__name', 'name')
+        if options['season']:
+            seasons = seasons.filter(pk=options['season'])
+            if not seasons:
+                raise CommandError("No season with id %d" % options['season'])
+
+        # any assumptions we need to create are created by our anonymous user
+        user = User.objects.get(pk=settings.ANONYMOUS_USER_ID)
+
+        for season in seasons:
+            count = WetmillSeasonRollup.rebuild(season, user)
+            self.stdout.write("%s %s: rebuilt %d rollup(s)\n" % (season.country.name, season.name, count))
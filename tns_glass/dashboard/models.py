@@ -1,6 +1,8 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import models, connection, transaction, IntegrityError
+from django.db.models.signals import post_save, post_delete
 from django.utils import timezone
+from django.utils.functional import cached_property
 from guardian.shortcuts import get_objects_for_user
 from lxml.cssselect import CSSSelector
 import requests
@@ -16,6 +18,7 @@ from datetime import date
 from datetime import datetime
 import pytz
 import time
+from bisect import bisect_right
 
 from lxml.html import fromstring
 from django.utils.translation import ugettext_lazy as _
@@ -78,7 +81,9 @@ def calculate_parchment_stats(season, wetmill_ids, until_date=None):
                                                     percent_of_parchment_shipped=percent_of_parchment_shipped)
     return parchment_data
 
-def calculate_parchment_estimates(stock_data, exchange_rate):
+def calculate_parchment_estimates(stock_data, context):
+    price = context.price
+
     for wetmill_data in stock_data:
         if 'parchment_shipped_ytd' in wetmill_data:
             assumptions = wetmill_data['assumptions']
@@ -89,11 +94,9 @@ def calculate_parchment_estimates(stock_data, exchange_rate):
             est_parchment_processed = wetmill_data.get('cherry_ytd', Decimal(0)) / cherry_parchment_ratio
             est_parchment_tabled = est_parchment_processed - shipped- wetmill_data['parchment_in_store']
 
-            # get the latest price
-            price = NYCherryPrice.objects.filter(is_active=True).order_by('-date')
             if price:
-                est_stored_parchment_value = (stored / assumptions.parchment_green_ratio) * (price[0].price + assumptions.green_price_differential) * exchange_rate
-                est_total_parchment_value = (est_parchment_processed/assumptions.parchment_green_ratio) * (price[0].price + assumptions.green_price_differential) * exchange_rate
+                est_stored_parchment_value = (stored / assumptions.parchment_green_ratio) * (price.price + assumptions.green_price_differential) * context.exchange_rate
+                est_total_parchment_value = (est_parchment_processed/assumptions.parchment_green_ratio) * (price.price + assumptions.green_price_differential) * context.exchange_rate
                 wetmill_data['est_stored_parchment_value'] = est_stored_parchment_value
                 wetmill_data['est_total_parchment_value'] = est_total_parchment_value
 
@@ -112,91 +115,13 @@ def find_active_wetmills(season, wetmills):
     return Wetmill.objects.filter(id__in=active_wetmills), Wetmill.objects.filter(id__in=inactive_wetmills)
 
 def load_assumptions_for_wetmills(season, wetmills, user):
-    wetmill_ids = [w.id for w in wetmills]
-    wetmill_assumptions = dict()
-
-    season_assumptions = Assumptions.for_csp(season, None, user)
-
-    # load all our csp assumptions
-    csp_assumptions = dict()
-    for assumption in Assumptions.objects.filter(season=season, wetmill=None).exclude(csp=None):
-        assumption.set_defaults(season_assumptions)
-        csp_assumptions[assumption.csp_id] = assumption
-
-    # cache all our csps for this season
-    wetmill_csp_mappings = dict()
-    for wetmill_csp in WetmillCSPSeason.objects.filter(season=season).select_related('csp', 'wetmill'):
-        wetmill_csp_mappings[wetmill_csp.wetmill.id] = wetmill_csp.csp_id
-
-    # load all our wetmill assumptions
-    for assumption in Assumptions.objects.filter(season=season, wetmill__in=wetmill_ids):
-        csp = wetmill_csp_mappings.get(assumption.wetmill_id, -1)
-        if csp in csp_assumptions:
-            assumption.set_defaults(csp_assumptions[csp])
-        else:
-            assumption.set_defaults(season_assumptions)
-
-        wetmill_assumptions[assumption.wetmill_id] = assumption
-
-    # now fill in the gaps with csp or season assumptions
-    csp_assumptions = dict()
-    for wetmill in wetmills:
-        if wetmill.id not in wetmill_assumptions:
-            csp = wetmill_csp_mappings.get(wetmill.id, -1)
-            if csp in csp_assumptions:
-                assumptions = csp_assumptions[csp]
-            else:
-                assumptions = season_assumptions
-
-            wetmill_assumptions[wetmill.id] = assumptions
-
-    return wetmill_assumptions
+    return DashboardContext(season, user).get_assumptions([w.id for w in wetmills])
 
 def load_assumptions_for_wetmills_by_id(season, wetmill_ids, user):
-    wetmill_assumptions = dict()
-
-    season_assumptions = Assumptions.for_csp(season, None, user)
-
-    # load all our csp assumptions
-    csp_assumptions = dict()
-    for assumption in Assumptions.objects.filter(season=season, wetmill=None).exclude(csp=None):
-        assumption.set_defaults(season_assumptions)
-        csp_assumptions[assumption.csp_id] = assumption
-
-    # cache all our csps for this season
-    wetmill_csp_mappings = dict()
-    for wetmill_csp in WetmillCSPSeason.objects.filter(season=season).select_related('csp', 'wetmill'):
-        wetmill_csp_mappings[wetmill_csp.wetmill.id] = wetmill_csp.csp_id
-
-    # load all our wetmill assumptions
-    for assumption in Assumptions.objects.filter(season=season, wetmill__in=wetmill_ids):
-        csp = wetmill_csp_mappings.get(assumption.wetmill_id, -1)
-        if csp in csp_assumptions:
-            assumption.set_defaults(csp_assumptions[csp])
-        else:
-            assumption.set_defaults(season_assumptions)
-
-        wetmill_assumptions[assumption.wetmill_id] = assumption
-
-    # now fill in the gaps with csp or season assumptions
-    csp_assumptions = dict()
-    for wetmill_id in wetmill_ids:
-        if wetmill_id not in wetmill_assumptions:
-            csp = wetmill_csp_mappings.get(wetmill_id, -1)
-            if csp in csp_assumptions:
-                assumptions = csp_assumptions[csp]
-            else:
-                assumptions = season_assumptions
-
-            wetmill_assumptions[wetmill_id] = assumptions
-
-    return wetmill_assumptions
-
+    return DashboardContext(season, user).get_assumptions(wetmill_ids)
 
-
-def build_stock_data(season, wetmills, today, user):
+def get_stock_fields():
     stock_fields = []
-    stock_data = []
 
     stock_fields.append(dict(slug='cherry_last', label=_("Last Cherry"), help=_("Volume Cherry Purchased according to Last Daily Cherry Report")))
     stock_fields.append(dict(slug='cherry_ytd', label=_("Cherry YTD"), help=_("Total Cherry Purchased according to Daily Cherry Reports")))
@@ -205,21 +130,25 @@ def build_stock_data(season, wetmills, today, user):
     stock_fields.append(dict(slug='est_parchment_tabled', label=_("Est. Parchment on Tables"), help=_("Total Cherry &divide; 5.2 = Est. Total Parchment\n- Parchment Delivered\n- Parchment in Storage\n= Est. Parchment on tables")))
     stock_fields.append(dict(slug='est_parchment_processed', label=_("Est. Parchment Processed"), help=_("Total Cherry &divide; 5.2 = Est. Total Parchment")))
 
+    return stock_fields
+
+def build_stock_data(season, wetmills, today, user, context=None):
+    if context is None:
+        context = DashboardContext(season, user)
+
+    stock_fields = get_stock_fields()
+    stock_data = []
+
     wetmill_ids = [w.pk for w in wetmills]
 
     cherry_last = calculate_cherry_last(season, wetmill_ids)
     cherry_ytd = calculate_cherry_ytd(season, wetmill_ids)
     sitoki_last = calculate_sitoki_last(season, wetmill_ids)
     parchment_ytd = calculate_parchment_stats(season, wetmill_ids)
-    assumptions = load_assumptions_for_wetmills(season, wetmills, user)
-
-    # cache all our csps for this season
-    wetmill_csp_mappings = dict()
-    for wetmill_csp in WetmillCSPSeason.objects.filter(season=season).select_related('csp', 'wetmill'):
-        wetmill_csp_mappings[wetmill_csp.wetmill.id] = wetmill_csp.csp
+    assumptions = context.get_assumptions(wetmill_ids)
 
     for wetmill in wetmills:
-        wetmill_data = dict(wetmill=wetmill, assumptions=assumptions.get(wetmill.id), csp=wetmill_csp_mappings.get(wetmill.id, None))
+        wetmill_data = dict(wetmill=wetmill, assumptions=assumptions.get(wetmill.id), csp=context.get_csp(wetmill.id))
 
         cherry = cherry_last.get(wetmill.pk)
         if cherry:
@@ -239,62 +168,27 @@ def build_stock_data(season, wetmills, today, user):
 
         stock_data.append(wetmill_data)
 
-    calculate_parchment_estimates(stock_data, season.exchange_rate)
-
-    season_assumptions = Assumptions.get_or_create(season, None, None, user)
-    calculate_recommended_prices(season, season_assumptions, stock_data)
+    calculate_parchment_estimates(stock_data, context)
+    calculate_recommended_prices(season, stock_data, context)
 
     return stock_fields, stock_data
 
-def get_attr(obj, field, default):
-    value = getattr(obj, field, None)
-    if value is None:
-        return default
-    else:
-        return value
-
-def calculate_recommended_prices(season, season_assumptions, all_data):
-    # get the latest price
-    price = NYCherryPrice.objects.filter(is_active=True).order_by('-date')
+def calculate_recommended_prices(season, all_data, context):
+    # no price, no recommendations
+    price = context.price
     if not price:
         return
 
-    season_assumptions = Assumptions.objects.get(is_active=True, season=season, csp=None, wetmill=None)
-    csp_assumption_cache = dict()
-    for ass in Assumptions.objects.filter(is_active=True, season=season, wetmill=None).exclude(csp=None):
-        csp_assumption_cache[ass.csp_id] = ass
-
-    price = price[0]
     for wetmill_data in all_data:
-        csp = wetmill_data['csp']
-
-        if csp:
-            csp_assumptions = csp_assumption_cache.get(csp.id, season_assumptions)
-        else:
-            csp_assumptions = season_assumptions
-
-        washing_station_costs = get_attr(csp_assumptions, 'washing_stations_costs', get_attr(season_assumptions, 'washing_station_costs', Decimal("0.74")))
-        milling_costs = get_attr(csp_assumptions, 'milling', get_attr(season_assumptions, 'milling_costs', Decimal("0.40")))
-        working_capital_costs = get_attr(csp_assumptions, 'working_capital_costs', get_attr(season_assumptions, 'working_capital_costs', Decimal("0.16")))
-        capex_costs = get_attr(csp_assumptions, 'capex_costs', get_attr(season_assumptions, 'capex_costs', Decimal("0.18")))
-        fi_costs = get_attr(csp_assumptions, 'fi_costs', get_attr(season_assumptions, 'fi_costs', Decimal("0.16")))
-
         assumptions = wetmill_data['assumptions']
-        production_costs = get_attr(assumptions, 'washing_station_costs', washing_station_costs) + \
-                           get_attr(assumptions, 'milling_costs', milling_costs) + \
-                           get_attr(assumptions, 'working_capital_costs', working_capital_costs) + \
-                           get_attr(assumptions, 'capex_costs', capex_costs) + \
-                           get_attr(assumptions, 'fi_costs', fi_costs)
-
-        cherry_green_ratio = assumptions.cherry_parchment_ratio * assumptions.parchment_green_ratio
 
         wetmill_data['nyc_price'] = price.price
-        wetmill_data['production_costs'] = production_costs
-        wetmill_data['cherry_green_ratio'] = cherry_green_ratio.quantize(Decimal(".01"))
+        wetmill_data['production_costs'] = assumptions.production_costs
+        wetmill_data['cherry_green_ratio'] = assumptions.cherry_green_ratio.quantize(Decimal(".01"))
         wetmill_data['cherry_price_rec'] = price.calculate_recommended_price(assumptions.green_price_differential,
-                                                                             production_costs,
-                                                                             cherry_green_ratio,
-                                                                             season.exchange_rate)
+                                                                             assumptions.production_costs,
+                                                                             assumptions.cherry_green_ratio,
+                                                                             context.exchange_rate)
 
 
 def calculate_sitoki_last(season, wetmill_ids):
@@ -417,10 +311,9 @@ def calculate_estimated_profitability(season, wetmills):
                 working_capital_received_percent = (working_capital / wetmill_data['assumptions'].total_working_capital) * Decimal("100")
                 wetmill_data['working_capital_received_percent'] = working_capital_received_percent
 
-def build_finance_data(season, wetmill_data, wetmills, today, user):
+def get_finance_fields(season):
     is_guatemala = season.country.country_code == 'GT'
 
-    wetmill_ids = [w.id for w in wetmills]
     finance_fields = []
 
     finance_fields.append(dict(slug='cherry_price_ytd', label=_("Avg Cherry Price"), help=_("Average Farmgate Price Paid over season YTD")))
@@ -437,6 +330,12 @@ def build_finance_data(season, wetmill_data, wetmills, today, user):
 
     finance_fields.append(dict(slug='cash_balance', label=_("Cash Balance")))
 
+    return finance_fields
+
+def build_finance_data(season, wetmill_data, wetmills, today, user):
+    wetmill_ids = [w.id for w in wetmills]
+    finance_fields = get_finance_fields(season)
+
     amafaranga_data = calculate_amafaranga_ytd(season, wetmill_ids)
     last_amafaranga_data = calculate_amafaranga_last(season, wetmill_ids)
 
@@ -456,7 +355,7 @@ def build_finance_data(season, wetmill_data, wetmills, today, user):
 
     return finance_fields, wetmill_data
 
-def calculate_ideal_submission_count(season, wetmill, season_start, season_end):
+def calculate_ideal_submission_count(season, wetmill, season_start, season_end, accounting_system=None):
     # we should have at least one submission for ibitumbwe or twakinze per day
     daily_submissions = (season_end - season_start).days + 1
 
@@ -480,56 +379,71 @@ def calculate_ideal_submission_count(season, wetmill, season_start, season_end):
     if last_week_report >= first_week_report:
         weekly_submissions += 2
 
-    accounting_system = wetmill.get_accounting_for_season(season)
+    # look up our accounting system unless we were passed it
+    if accounting_system is None:
+        accounting_system = wetmill.get_accounting_for_season(season)
+
     if accounting_system == '2012' or accounting_system == 'GTWB':
         return daily_submissions + weekly_submissions
     else:
         return daily_submissions
 
+# the temporary table we load the week each wetmill's finance variance is calculated for into
+FINANCE_WINDOW_TABLE = 'dashboard_finance_window'
+
+def drop_temporary_table(cursor, table):
+    # MySQL commits the current transaction on DROP TABLE unless it is told the table is temporary
+    if connection.vendor == 'mysql':
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS %s" % table)
+    else:
+        cursor.execute("DROP TABLE IF EXISTS %s" % table)
+
 def calculate_finance_variance(season, wetmill_ids, wetmill_data, today):
     # we know our last amafaranga message, but now need to load the sum of advances for the week prior in ibitumbwe
-    # messages the dates are different per wetmill however, so we need to build the SQL ourselves
-    from django.db import connection, transaction
-    cursor = connection.cursor()
-
-    ibitumbwe_where_clauses = []
-    amafaranga_where_clauses = []
+    # messages, the dates are different per wetmill so we load each wetmill's week into a temporary table and join
+    # against it, that way we run the same queries no matter how many wetmills we have
+    windows = dict()
     for wetmill in wetmill_data:
         last_amafaranga = wetmill.get('amafaranga_last', None)
         wetmill_id = wetmill['wetmill'].id
 
         if last_amafaranga:
-            start = last_amafaranga
-            end = start + timedelta(days=7)
-            previous = start - timedelta(days=7)
-
-            start_sql = "date('%d-%d-%d')" % (start.year, start.month, start.day)
-            end_sql = "date('%d-%d-%d')" % (end.year, end.month, end.day)
-
-            previous_sql = "date('%d-%d-%d')" % (previous.year, previous.month, previous.day)
-
-            ibitumbwe_where_clauses.append("(wetmill_id = %d and report_day >= %s and report_day < %s and is_active=1)" % (wetmill_id, start_sql, end_sql))
-            amafaranga_where_clauses.append("(wetmill_id = %d and start_of_week = %s and is_active=1)" % (wetmill_id, previous_sql))
+            windows[wetmill_id] = (wetmill_id, last_amafaranga, last_amafaranga + timedelta(days=7),
+                                   last_amafaranga - timedelta(days=7))
 
     # nothing to query, bail
-    if not ibitumbwe_where_clauses:
+    if not windows:
         return
 
-    where_clause = " or ".join(ibitumbwe_where_clauses)
-    sql = "select wetmill_id, sum(cash_advanced) from sms_ibitumbwesubmission where %s group by wetmill_id;" % where_clause
-    cursor.execute(sql)
-    results = cursor.fetchall()
-
-    # convert our results to a map
-    week_advanced = dict()
-    for row in results:
-        week_advanced[row[0]] = row[1]
-
-    # get our previous amafaranga records
-    previous_closes = dict()
-    for af in AmafarangaSubmission.objects.raw("select * from sms_amafarangasubmission where %s" % " or ".join(amafaranga_where_clauses)):
-        previous_closes[af.wetmill_id] = af.opening_balance + af.working_capital + af.other_income - af.advanced - \
-                                         af.full_time_labor - af.casual_labor - af.commission - af.transport - af.other_expenses
+    cursor = connection.cursor()
+    drop_temporary_table(cursor, FINANCE_WINDOW_TABLE)
+
+    try:
+        cursor.execute("CREATE TEMPORARY TABLE %s (wetmill_id integer NOT NULL PRIMARY KEY, week_start date NOT NULL, "
+                       "week_end date NOT NULL, previous_week date NOT NULL)" % FINANCE_WINDOW_TABLE)
+        cursor.executemany("INSERT INTO %s (wetmill_id, week_start, week_end, previous_week) VALUES (%%s, %%s, %%s, %%s)" % FINANCE_WINDOW_TABLE,
+                           windows.values())
+
+        # the cash advanced in the cherry reports for the week of each wetmill's last amafaranga message
+        cursor.execute("SELECT w.wetmill_id, SUM(i.cash_advanced) FROM %s w "
+                       "INNER JOIN sms_ibitumbwesubmission i ON (i.wetmill_id = w.wetmill_id AND i.report_day >= w.week_start AND i.report_day < w.week_end) "
+                       "WHERE i.is_active = %%s GROUP BY w.wetmill_id" % FINANCE_WINDOW_TABLE, [True])
+
+        # convert our results to a map, SQLite gives us back floats for our sums
+        week_advanced = dict()
+        for row in cursor.fetchall():
+            week_advanced[row[0]] = row[1] if isinstance(row[1], Decimal) else Decimal(str(row[1]))
+
+        # get our previous amafaranga records
+        previous_closes = dict()
+        previous = AmafarangaSubmission.objects.raw("SELECT a.* FROM sms_amafarangasubmission a "
+                                                    "INNER JOIN %s w ON (a.wetmill_id = w.wetmill_id AND a.start_of_week = w.previous_week) "
+                                                    "WHERE a.is_active = %%s" % FINANCE_WINDOW_TABLE, [True])
+        for af in previous:
+            previous_closes[af.wetmill_id] = af.opening_balance + af.working_capital + af.other_income - af.advanced - \
+                                             af.full_time_labor - af.casual_labor - af.commission - af.transport - af.other_expenses
+    finally:
+        drop_temporary_table(cursor, FINANCE_WINDOW_TABLE)
 
     # calculate the variance now
     for wetmill in wetmill_data:
@@ -603,53 +517,109 @@ def calculate_performance_alerts(season, wetmill_datas):
                 wetmill_data['cash_balance_alert'] = 'performance-alert'
 
 
-def calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today):
-    # build a set of our wetmill_ids so we know which to calculate for
-    wetmill_id_set = set(wetmill_ids)
+class SubmissionCalendar(object):
+    """
+    The days a wetmill sent each kind of submission on during its season, kept as a bitmap per kind
+    where bit n is set if a submission was received n days after our origin.  Daily messages count
+    from the start of the season, weekly ones from the week before it, so our origin is a week
+    before the season starts.
+    """
+    DAILY = ('ibitumbwe', 'twakinze')
+    WEEKLY = ('amafaranga', 'sitoki')
 
-    # (wetmill=1, report_day__gte=wetmill2.assumptions.season_start) OR (wetmill=2, report_day__gte=wetmill2.assumptions.season_start)
-    day_query = Q(pk__lt=0)
-    week_query = Q(pk__lt=0)
-    for data in wetmill_data:
-        if data['wetmill'].id in wetmill_id_set:
-            day_query |= Q(wetmill=data['wetmill'], report_day__gte=data['assumptions'].season_start, report_day__lte=data['assumptions'].season_end)
-            week_query |= Q(wetmill=data['wetmill'], start_of_week__gte=data['assumptions'].season_start - timedelta(days=7), start_of_week__lte=data['assumptions'].season_end)
+    def __init__(self, season_start, season_end):
+        self.season_start = season_start
+        self.season_end = season_end
+        self.origin = season_start - timedelta(days=7)
+        self.days = dict((kind, 0) for kind in self.DAILY + self.WEEKLY)
+
+    def add(self, kind, day):
+        """
+        Marks a submission of the passed in kind on the passed in day, days outside our season are ignored
+        """
+        first = self.season_start if kind in self.DAILY else self.origin
+        if first <= day <= self.season_end:
+            self.days[kind] |= 1 << (day - self.origin).days
+
+    def count(self, kind):
+        return bin(self.days[kind]).count('1')
+
+    def last(self, kind):
+        """
+        Returns the day of our last submission of the passed in kind, None if we have none
+        """
+        days = self.days[kind]
+        if days:
+            return self.origin + timedelta(days=days.bit_length() - 1)
+        else:
+            return None
 
-    ibitumbwe_submissions = IbitumbweSubmission.objects.filter(Q(season=season, active=True) & day_query).order_by('wetmill').values('wetmill').annotate(Count('wetmill'), Min('report_day'), Max('report_day'))
-    twakinze_submissions = TwakinzeSubmission.objects.filter(Q(season=season, active=True) & day_query).values('wetmill').annotate(Count('wetmill'), Max('report_day'))
+    def get_counts(self):
+        """
+        Returns a dict of the number of submissions of each kind we have and the day of the last one
+        """
+        counts = dict()
+        for kind in self.DAILY + self.WEEKLY:
+            if self.days[kind]:
+                counts['%s_count_ytd' % kind] = self.count(kind)
+                counts['%s_date_last' % kind] = self.last(kind)
 
-    amafaranga_submissions = AmafarangaSubmission.objects.filter(Q(season=season, active=True) & week_query).order_by('wetmill').values('wetmill').annotate(Count('wetmill'), Max('start_of_week'))
-    sitoki_submissions =  SitokiSubmission.objects.filter(Q(season=season, active=True) & week_query).order_by('wetmill').values('wetmill').annotate(Count('wetmill'), Max('start_of_week'))
+        return counts
+
+    @classmethod
+    def load(cls, season, windows):
+        """
+        Builds the calendars for the wetmills in windows, a dict of wetmill id to the (season start,
+        season end) tuple of each.  We run a single query for each kind of submission, no matter how
+        many wetmills we have.  Returns a dict of wetmill id to calendar.
+        """
+        calendars = dict((wetmill_id, cls(start, end)) for wetmill_id, (start, end) in windows.items())
+        if not calendars:
+            return calendars
 
+        wetmill_ids = calendars.keys()
+        first = min(calendar.origin for calendar in calendars.values())
+        last = max(calendar.season_end for calendar in calendars.values())
 
-    sub_data = dict()
-    for wetmill_id in wetmill_ids:
-        sub_data[wetmill_id] = dict()
+        for kind, model, field in (('ibitumbwe', IbitumbweSubmission, 'report_day'),
+                                   ('twakinze', TwakinzeSubmission, 'report_day'),
+                                   ('amafaranga', AmafarangaSubmission, 'start_of_week'),
+                                   ('sitoki', SitokiSubmission, 'start_of_week')):
+            submissions = model.objects.filter(**{'season': season, 'active': True, 'wetmill__in': wetmill_ids,
+                                                  '%s__gte' % field: first, '%s__lte' % field: last})
 
-    for sub in ibitumbwe_submissions:
-        sub_data[sub['wetmill']]['ibitumbwe_count_ytd'] = sub['wetmill__count']
-        sub_data[sub['wetmill']]['ibitumbwe_date_last'] = sub['report_day__max']
+            for wetmill_id, day in submissions.values_list('wetmill', field):
+                calendars[wetmill_id].add(kind, day)
 
-    for sub in twakinze_submissions:
-        sub_data[sub['wetmill']]['twakinze_count_ytd'] = sub['wetmill__count']
-        sub_data[sub['wetmill']]['twakinze_date_last'] = sub['report_day__max']
+        return calendars
 
-    for sub in amafaranga_submissions:
-        sub_data[sub['wetmill']]['amafaranga_count_ytd'] = sub['wetmill__count']
-        sub_data[sub['wetmill']]['amafaranga_date_last'] = sub['start_of_week__max']
+def calculate_submission_counts(season, windows):
+    """
+    Counts the active submissions of each wetmill within its season, passed in as a dict of wetmill
+    id to a (season start, season end) tuple.  Returns a dict of wetmill id to the counts and the
+    date of the last submission of each kind.
+    """
+    calendars = SubmissionCalendar.load(season, windows)
+    return dict((wetmill_id, calendar.get_counts()) for wetmill_id, calendar in calendars.items())
 
-    for sub in sitoki_submissions:
-        sub_data[sub['wetmill']]['sitoki_count_ytd'] = sub['wetmill__count']
-        sub_data[sub['wetmill']]['sitoki_date_last'] = sub['start_of_week__max']
+def calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today, counts=None):
+    # count our submissions, unless we were passed them
+    if counts is None:
+        wetmill_id_set = set(wetmill_ids)
+        windows = dict((data['wetmill'].id, (data['assumptions'].season_start, data['assumptions'].season_end))
+                       for data in wetmill_data if data['wetmill'].id in wetmill_id_set)
+        counts = calculate_submission_counts(season, windows)
 
     for data in wetmill_data:
         wetmill_id = data['wetmill'].id
-        data.update(sub_data[wetmill_id])
+        data.update(counts[wetmill_id])
 
     ideal_week = (get_week_start_before(datetime.today())).date()
     ideal_yesterday = (datetime.today() - timedelta(days=2)).date()
     today = datetime.today().date()
 
+    accounting_systems = Wetmill.get_accounting_for_wetmills(season, [data['wetmill'].id for data in wetmill_data])
+
     # for each wetmill calculate our total submission count and our ideal submission count
     for data in wetmill_data:
         assumptions = data['assumptions']
@@ -659,7 +629,8 @@ def calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today):
         data['season_ideal_last_weekly'] = get_week_start_during(data['season_ideal_last_daily'])
 
         submission_count = data.get('ibitumbwe_count_ytd', 0) + data.get('amafaranga_count_ytd', 0) + data.get('sitoki_count_ytd', 0) + data.get('twakinze_count_ytd', 0)
-        ideal_submission_count = calculate_ideal_submission_count(season, data['wetmill'], data['season_day_start'], data['season_ideal_last_daily'])
+        ideal_submission_count = calculate_ideal_submission_count(season, data['wetmill'], data['season_day_start'], data['season_ideal_last_daily'],
+                                                                  accounting_systems[data['wetmill'].id])
         submission_pct = Decimal(submission_count) * Decimal(100) / ideal_submission_count if ideal_submission_count > 0 else None
 
         data['submission_count'] = submission_count
@@ -683,7 +654,7 @@ def calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today):
             data['amafaranga_current'] = data.get('amafaranga_date_last', ideal_week) >= ideal_week
 
 
-def build_compliance_data(season, wetmill_data, wetmills, today, user):
+def get_compliance_fields(season):
     compliance_fields = []
 
     compliance_fields.append(dict(slug='submission_count', label=_("Reports Submitted/Total Reports Expected")))
@@ -693,13 +664,21 @@ def build_compliance_data(season, wetmill_data, wetmills, today, user):
     if season.country.country_code != 'GT':
         compliance_fields.append(dict(slug='balance_variance_pct', label=_("% Opening Balance Variance"), help=_("Variance opening balance reported this week vs. closing balance calculated last week\nVariance should be 0")))
 
+    return compliance_fields
+
+def build_compliance_data(season, wetmill_data, wetmills, today, user):
+    compliance_fields = get_compliance_fields(season)
+
     wetmill_ids = [w.id for w in wetmills]
     calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today)
     calculate_finance_variance(season, wetmill_ids, wetmill_data, today)
 
     return compliance_fields, wetmill_data
 
-def build_wetmill_data(season, wetmills, user):
+def build_wetmill_data(season, wetmills, user, context=None):
+    if context is None:
+        context = DashboardContext(season, user)
+
     stock_data = []
     wetmill_ids = [w.pk for w in wetmills]
 
@@ -707,7 +686,7 @@ def build_wetmill_data(season, wetmills, user):
     cherry_ytd = calculate_cherry_ytd(season, wetmill_ids)
     sitoki_last = calculate_sitoki_last(season, wetmill_ids)
     parchment_ytd = calculate_parchment_stats(season, wetmill_ids)
-    assumptions = load_assumptions_for_wetmills(season, wetmills, user)
+    assumptions = context.get_assumptions(wetmill_ids)
 
     for wetmill in wetmills:
         wetmill_data = dict(wetmill=wetmill, assumptions=assumptions.get(wetmill.id))
@@ -730,10 +709,261 @@ def build_wetmill_data(season, wetmills, user):
 
         stock_data.append(wetmill_data)
 
-    calculate_parchment_estimates(stock_data, season.exchange_rate)
+    calculate_parchment_estimates(stock_data, context)
 
     return stock_data
 
+def calculate_rollup_values(season, wetmill_ids, windows):
+    """
+    Calculates the values we keep in WetmillSeasonRollup for each of the passed in wetmills, returning
+    a dict of wetmill id to values.  Submission counts are only calculated for the wetmills in windows,
+    a dict of wetmill id to the (season start, season end) tuple to count within.
+    """
+    values = dict((wetmill_id, dict()) for wetmill_id in wetmill_ids)
+
+    # same order as build_stock_data and build_finance_data, our cherry ytd last day wins
+    for calculated in (calculate_cherry_last(season, wetmill_ids), calculate_cherry_ytd(season, wetmill_ids),
+                       calculate_parchment_stats(season, wetmill_ids), calculate_sitoki_last(season, wetmill_ids),
+                       calculate_amafaranga_ytd(season, wetmill_ids), calculate_amafaranga_last(season, wetmill_ids)):
+        for wetmill_id, wetmill_values in calculated.items():
+            values[wetmill_id].update(wetmill_values)
+
+    if windows:
+        for wetmill_id, counts in calculate_submission_counts(season, windows).items():
+            values[wetmill_id].update(counts)
+            values[wetmill_id]['compliance_start'] = windows[wetmill_id][0]
+            values[wetmill_id]['compliance_end'] = windows[wetmill_id][1]
+
+    return values
+
+class WetmillSeasonRollup(models.Model):
+    """
+    The stock, finance and compliance totals for the active submissions of a wetmill in a season, so
+    the SMS dashboard can be built from a single read instead of summing every submission on each
+    page view.
+
+    Rows are refreshed whenever a submission for the wetmill is activated, changed or deactivated.
+    Submission counts depend on the season start and end in the wetmill's assumptions, so we remember
+    the dates we counted within and recount when they change.
+    """
+    wetmill = models.ForeignKey(Wetmill, verbose_name=_("Wetmill"))
+    season = models.ForeignKey(Season, verbose_name=_("Season"))
+
+    # cherry
+    cherry_date_first = models.DateField(null=True)
+    cherry_date_last = models.DateField(null=True)
+    cherry_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cherry_tons_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cherry_spent_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cherry_price_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+
+    cherry_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cash_spent_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    credit_spent_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cherry_spent_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    cherry_price_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+
+    # parchment
+    parchment_tons_stored_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    parchment_stored_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    parchment_shipped_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    parchment_in_store = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    parchment_in_store_tons = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    percent_of_parchment_shipped = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    sitoki_last = models.DateField(null=True)
+
+    # finance
+    working_capital_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    working_capital_op_exp = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    working_capital_million_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    op_exp_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    total_exp_ytd = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+
+    cash_balance = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    amafaranga_last = models.DateField(null=True)
+    advanced_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+    opening_balance_last = models.DecimalField(max_digits=24, decimal_places=8, null=True)
+
+    # compliance, counted between these dates
+    compliance_start = models.DateField(null=True)
+    compliance_end = models.DateField(null=True)
+
+    ibitumbwe_count_ytd = models.IntegerField(null=True)
+    ibitumbwe_date_last = models.DateField(null=True)
+    twakinze_count_ytd = models.IntegerField(null=True)
+    twakinze_date_last = models.DateField(null=True)
+    amafaranga_count_ytd = models.IntegerField(null=True)
+    amafaranga_date_last = models.DateField(null=True)
+    sitoki_count_ytd = models.IntegerField(null=True)
+    sitoki_date_last = models.DateField(null=True)
+
+    modified_on = models.DateTimeField(auto_now=True)
+
+    VALUE_FIELDS = ('cherry_date_first', 'cherry_date_last', 'cherry_ytd', 'cherry_tons_ytd', 'cherry_spent_ytd', 'cherry_price_ytd',
+                    'cherry_last', 'cash_spent_last', 'credit_spent_last', 'cherry_spent_last', 'cherry_price_last',
+                    'parchment_tons_stored_ytd', 'parchment_stored_ytd', 'parchment_shipped_ytd', 'parchment_in_store',
+                    'parchment_in_store_tons', 'percent_of_parchment_shipped', 'sitoki_last',
+                    'working_capital_ytd', 'working_capital_op_exp', 'working_capital_million_ytd', 'op_exp_ytd', 'total_exp_ytd',
+                    'cash_balance', 'amafaranga_last', 'advanced_last', 'opening_balance_last')
+
+    COUNT_FIELDS = ('ibitumbwe_count_ytd', 'ibitumbwe_date_last', 'twakinze_count_ytd', 'twakinze_date_last',
+                    'amafaranga_count_ytd', 'amafaranga_date_last', 'sitoki_count_ytd', 'sitoki_date_last')
+
+    # fields that can be None while the rest of their values are set, and the field that tells us so
+    NULLABLE_FIELDS = dict(cherry_price_ytd='cherry_ytd', working_capital_op_exp='working_capital_ytd')
+
+    class Meta:
+        unique_together = ('wetmill', 'season')
+
+    def set_values(self, values):
+        for field in self.VALUE_FIELDS + self.COUNT_FIELDS + ('compliance_start', 'compliance_end'):
+            setattr(self, field, values.get(field, None))
+
+    def get_values(self, fields):
+        """
+        Returns our values for the passed in fields as a dict, leaving out those we don't have, the
+        same as the dicts returned by the calculate_ methods we are built from.
+        """
+        values = dict()
+        for field in fields:
+            value = getattr(self, field)
+            if value is not None or (field in self.NULLABLE_FIELDS and getattr(self, self.NULLABLE_FIELDS[field]) is not None):
+                values[field] = value
+
+        return values
+
+    def get_counts(self):
+        return self.get_values(self.COUNT_FIELDS)
+
+    def is_counted_for(self, assumptions):
+        """
+        Whether our submission counts were calculated for the season dates of the passed in assumptions
+        """
+        return self.compliance_start == assumptions.season_start and self.compliance_end == assumptions.season_end
+
+    @classmethod
+    def for_wetmills(cls, season, wetmills, assumptions):
+        """
+        Returns a dict of wetmill id to rollup for the passed in wetmills, building any that are missing
+        or were counted for different season dates than those in the passed in assumptions.
+        """
+        rollups = dict((rollup.wetmill_id, rollup) for rollup in cls.objects.filter(season=season, wetmill__in=[w.id for w in wetmills]))
+
+        stale = dict()
+        for wetmill in wetmills:
+            rollup = rollups.get(wetmill.id, None)
+            if not rollup or not rollup.is_counted_for(assumptions[wetmill.id]):
+                stale[wetmill.id] = (assumptions[wetmill.id].season_start, assumptions[wetmill.id].season_end)
+
+        if stale:
+            rollups.update(cls.rebuild_for_wetmills(season, stale))
+
+        return rollups
+
+    @classmethod
+    def rebuild_for_wetmills(cls, season, windows):
+        """
+        Rebuilds the rollups for the wetmills in windows, a dict of wetmill id to the season dates
+        to count their submissions within.  Returns a dict of wetmill id to rollup.
+        """
+        rollups = dict()
+        for wetmill_id, values in calculate_rollup_values(season, windows.keys(), windows).items():
+            rollup, created = cls.objects.get_or_create(wetmill_id=wetmill_id, season=season)
+            rollup.set_values(values)
+            rollup.save()
+            rollups[wetmill_id] = rollup
+
+        return rollups
+
+    @classmethod
+    def rebuild(cls, season, user):
+        """
+        Rebuilds the rollups for all the wetmills with submissions in the passed in season, removing any
+        others.  Returns the number of rollups built.
+        """
+        wetmill_ids = set()
+        for clazz in (IbitumbweSubmission, TwakinzeSubmission, SitokiSubmission, AmafarangaSubmission):
+            wetmill_ids.update([_['wetmill'] for _ in clazz.objects.filter(season=season).order_by('wetmill').values('wetmill').distinct()])
+
+        cls.objects.filter(season=season).exclude(wetmill__in=wetmill_ids).delete()
+        if not wetmill_ids:
+            return 0
+
+        assumptions = load_assumptions_for_wetmills_by_id(season, list(wetmill_ids), user)
+        windows = dict((wetmill_id, (assumptions[wetmill_id].season_start, assumptions[wetmill_id].season_end))
+                       for wetmill_id in wetmill_ids)
+
+        return len(cls.rebuild_for_wetmills(season, windows))
+
+    @classmethod
+    def refresh(cls, wetmill_id, season_id, create=True):
+        """
+        Recalculates the rollup for the passed in wetmill and season after one of its submissions has
+        changed, counting submissions within the same dates as before.  If create is False we only
+        update a rollup that already exists.
+
+        Our row is locked before anything else is read, so concurrent refreshes for the same wetmill
+        take turns, each recalculating from everything the one before it committed.
+        """
+        rollups = cls.objects.select_for_update().filter(wetmill=wetmill_id, season=season_id)
+        if not rollups:
+            if not create:
+                return
+
+            # someone else may create it at the same time, in which case we use theirs
+            sid = transaction.savepoint()
+            try:
+                cls.objects.create(wetmill_id=wetmill_id, season_id=season_id)
+                transaction.savepoint_commit(sid)
+            except IntegrityError:
+                transaction.savepoint_rollback(sid)
+
+            rollups = cls.objects.select_for_update().filter(wetmill=wetmill_id, season=season_id)
+
+        rollup = rollups[0]
+
+        windows = dict()
+        if rollup.compliance_start and rollup.compliance_end:
+            windows[wetmill_id] = (rollup.compliance_start, rollup.compliance_end)
+
+        rollup.set_values(calculate_rollup_values(rollup.season, [wetmill_id], windows)[wetmill_id])
+        rollup.save()
+
+def build_dashboard_data(season, wetmills, today, user, context=None):
+    """
+    Builds the stock, finance and compliance data for the passed in wetmills from their season rollups.
+    This returns the same fields and data as calling build_stock_data, build_finance_data and
+    build_compliance_data in turn.
+    """
+    if context is None:
+        context = DashboardContext(season, user)
+
+    wetmill_ids = [w.id for w in wetmills]
+    assumptions = context.get_assumptions(wetmill_ids)
+    rollups = WetmillSeasonRollup.for_wetmills(season, wetmills, assumptions)
+
+    wetmill_data = []
+    counts = dict()
+    for wetmill in wetmills:
+        data = dict(wetmill=wetmill, assumptions=assumptions.get(wetmill.id), csp=context.get_csp(wetmill.id))
+        data.update(rollups[wetmill.id].get_values(WetmillSeasonRollup.VALUE_FIELDS))
+        counts[wetmill.id] = rollups[wetmill.id].get_counts()
+        wetmill_data.append(data)
+
+    # stock
+    calculate_parchment_estimates(wetmill_data, context)
+    calculate_recommended_prices(season, wetmill_data, context)
+
+    # finance
+    calculate_uncollaterized_working_capital(season, wetmill_data)
+    calculate_estimated_profitability(season, wetmill_data)
+
+    # compliance
+    calculate_compliance_ytd(season, wetmill_ids, wetmill_data, today, counts)
+    calculate_finance_variance(season, wetmill_ids, wetmill_data, today)
+
+    return get_stock_fields(), get_finance_fields(season), get_compliance_fields(season), wetmill_data
+
 class PredictedOutput(SmartModel):
     """
     Represents the predicted cherry volume going through a volume for the week
@@ -858,18 +1088,16 @@ class Assumptions(SmartModel):
         self.defaults = default_assumptions
 
     def __getattribute__(self, name):
+        # get our value normally
+        value = super(Assumptions, self).__getattribute__(name)
 
-        if hasattr(self, 'defaults') and name in Assumptions.DEFAULT_FIELDS:
-            # get our value normally
-            value = super(Assumptions, self).__getattribute__(name)
-
-            # if it is not set, use our default's value
-            if value is None:
-                value = getattr(self.defaults, name)
+        # if it is not set, use our default's value, we only pay for the lookup when a value is missing
+        if value is None and name in DEFAULT_ASSUMPTION_FIELDS:
+            defaults = super(Assumptions, self).__getattribute__('__dict__').get('defaults', None)
+            if defaults is not None:
+                value = getattr(defaults, name)
 
-            return value
-        else:
-            return super(Assumptions, self).__getattribute__(name)
+        return value
 
     @classmethod
     def for_wetmill(cls, season, wetmill, user):
@@ -1023,6 +1251,142 @@ class Assumptions(SmartModel):
     class Meta:
         unique_together = (('season', 'wetmill'), ('season', 'csp'))
 
+DEFAULT_ASSUMPTION_FIELDS = frozenset(Assumptions.DEFAULT_FIELDS)
+
+# the cost per kilo of green in USD of each part of production, and what we use if it isn't set at all
+PRODUCTION_COSTS = (('washing_station_costs', Decimal("0.74")),
+                    ('milling_costs', Decimal("0.40")),
+                    ('working_capital_costs', Decimal("0.16")),
+                    ('capex_costs', Decimal("0.18")),
+                    ('fi_costs', Decimal("0.16")))
+
+class EffectiveAssumptions(object):
+    """
+    The assumptions that apply to a single wetmill with the season, CSP and wetmill cascade already
+    resolved, so reading a value is a plain attribute lookup.  Along with the fields of Assumptions
+    this has the production_costs and cherry_green_ratio used for recommended prices.
+
+    Each wetmill gets its own copy, so changing a value (when converting currencies for example)
+    only changes it for that wetmill.
+    """
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+    @classmethod
+    def flatten(cls, assumptions):
+        """
+        Returns a dict of the effective values of the passed in Assumptions
+        """
+        values = dict((field.attname, getattr(assumptions, field.attname)) for field in Assumptions._meta.fields)
+        values['pk'] = values['id']
+
+        production_costs = Decimal(0)
+        for field, default in PRODUCTION_COSTS:
+            value = values[field]
+            production_costs += default if value is None else value
+
+        values['production_costs'] = production_costs
+
+        if values['cherry_parchment_ratio'] is not None and values['parchment_green_ratio'] is not None:
+            values['cherry_green_ratio'] = values['cherry_parchment_ratio'] * values['parchment_green_ratio']
+        else:
+            values['cherry_green_ratio'] = None
+
+        return values
+
+class DashboardContext(object):
+    """
+    What the dashboard calculations for a season share while building a single page: the latest
+    NYC price, the season's exchange rate and the assumptions of each wetmill.  Each is loaded the
+    first time it is used and then reused, so create a new context for each request.
+    """
+    def __init__(self, season, user):
+        self.season = season
+        self.user = user
+        self.exchange_rate = season.exchange_rate
+
+        # wetmill id -> flattened values of the assumptions that apply to it
+        self.wetmill_values = dict()
+
+        # csp id -> flattened values of the csp's own assumptions
+        self.csp_values = dict()
+
+    @cached_property
+    def price(self):
+        """
+        The latest active NYC price, None if we don't have any
+        """
+        prices = list(NYCherryPrice.objects.filter(is_active=True).order_by('-date')[:1])
+        return prices[0] if prices else None
+
+    @cached_property
+    def season_assumptions(self):
+        return Assumptions.for_csp(self.season, None, self.user)
+
+    @cached_property
+    def season_values(self):
+        return EffectiveAssumptions.flatten(self.season_assumptions)
+
+    @cached_property
+    def csp_assumptions(self):
+        """
+        The assumptions of each CSP that has its own, by CSP id
+        """
+        csp_assumptions = dict()
+        for assumption in Assumptions.objects.filter(season=self.season, wetmill=None).exclude(csp=None):
+            assumption.set_defaults(self.season_assumptions)
+            csp_assumptions[assumption.csp_id] = assumption
+
+        return csp_assumptions
+
+    @cached_property
+    def wetmill_csps(self):
+        """
+        The CSP of each wetmill this season, by wetmill id
+        """
+        return dict((wetmill_csp.wetmill_id, wetmill_csp.csp) for wetmill_csp in
+                    WetmillCSPSeason.objects.filter(season=self.season).select_related('csp'))
+
+    def get_csp(self, wetmill_id):
+        return self.wetmill_csps.get(wetmill_id, None)
+
+    def get_csp_values(self, csp):
+        """
+        Returns the flattened values of the assumptions for the passed in CSP, the season's if it
+        has none of its own
+        """
+        if not csp or csp.id not in self.csp_assumptions:
+            return self.season_values
+
+        if csp.id not in self.csp_values:
+            self.csp_values[csp.id] = EffectiveAssumptions.flatten(self.csp_assumptions[csp.id])
+
+        return self.csp_values[csp.id]
+
+    def get_assumptions(self, wetmill_ids):
+        """
+        Returns a dict of wetmill id to the EffectiveAssumptions for each of the passed in wetmills.
+        Wetmills with their own assumptions default to those of their CSP, or the season's if their
+        CSP has none.  Wetmills without their own assumptions use their CSP's, or the season's if their
+        CSP has none either.
+        """
+        missing = [wetmill_id for wetmill_id in wetmill_ids if wetmill_id not in self.wetmill_values]
+        if missing:
+            for assumption in Assumptions.objects.filter(season=self.season, wetmill__in=missing):
+                csp = self.get_csp(assumption.wetmill_id)
+                if csp and csp.id in self.csp_assumptions:
+                    assumption.set_defaults(self.csp_assumptions[csp.id])
+                else:
+                    assumption.set_defaults(self.season_assumptions)
+
+                self.wetmill_values[assumption.wetmill_id] = EffectiveAssumptions.flatten(assumption)
+
+            for wetmill_id in missing:
+                if wetmill_id not in self.wetmill_values:
+                    self.wetmill_values[wetmill_id] = self.get_csp_values(self.get_csp(wetmill_id))
+
+        return dict((wetmill_id, EffectiveAssumptions(self.wetmill_values[wetmill_id])) for wetmill_id in wetmill_ids)
+
 def remove_current_datapoint(context, actual_key):
     """
     If our data set's last point isn't for a week that has completed yet, remove that point
@@ -1107,25 +1471,10 @@ def calculate_price_chart(season, wetmill_data):
     raw_prices = list(NYCherryPrice.objects.filter(date__gte=current, date__lte=last))
     raw_prices_i = 0
 
-    season_assumptions = Assumptions.objects.get(season=season, csp=None, wetmill=None)
-
-    csp = wetmill_data['wetmill'].get_csp_for_season(season)
-    csp_assumptions = Assumptions.for_csp(season, csp, None)
-
-    washing_station_costs = get_attr(csp_assumptions, 'washing_stations_costs', get_attr(season_assumptions, 'washing_station_costs', Decimal("0.74")))
-    milling_costs = get_attr(csp_assumptions, 'milling', get_attr(season_assumptions, 'milling_costs', Decimal("0.40")))
-    working_capital_costs = get_attr(csp_assumptions, 'working_capital_costs', get_attr(season_assumptions, 'working_capital_costs', Decimal("0.16")))
-    capex_costs = get_attr(csp_assumptions, 'capex_costs', get_attr(season_assumptions, 'capex_costs', Decimal("0.18")))
-    fi_costs = get_attr(csp_assumptions, 'fi_costs', get_attr(season_assumptions, 'fi_costs', Decimal("0.16")))
-
+    # our assumptions already have their production costs resolved
     assumptions = wetmill_data['assumptions']
-    production_costs = get_attr(assumptions, 'washing_station_costs', washing_station_costs) + \
-                       get_attr(assumptions, 'milling_costs', milling_costs) + \
-                       get_attr(assumptions, 'working_capital_costs', working_capital_costs) + \
-                       get_attr(assumptions, 'capex_costs', capex_costs) + \
-                       get_attr(assumptions, 'fi_costs', fi_costs)
-
-    cherry_green_ratio = assumptions.cherry_parchment_ratio * assumptions.parchment_green_ratio
+    production_costs = assumptions.production_costs
+    cherry_green_ratio = assumptions.cherry_green_ratio
 
     while current <= last:
         while raw_prices_i < len(raw_prices) and raw_prices[raw_prices_i].date < current:
@@ -1518,10 +1867,117 @@ def calculate_wetmill_predicted_cherry_curve(start, length, total, outputs):
     return cherry
 
 
-def calculate_estimated_stored_parchment_value_curve(season, wetmill, user):
+def to_report_date(value):
+    """
+    Returns the date the database would compare the passed in value to a date field with, datetimes
+    are converted to our default timezone first.
+    """
+    if isinstance(value, datetime):
+        if settings.USE_TZ and timezone.is_aware(value):
+            value = timezone.make_naive(value, timezone.get_default_timezone())
+        return value.date()
+
+    return value
+
+class CumulativeSeries(object):
+    """
+    Running totals of a set of fields, built in a single pass over rows ordered by day.  Looking up
+    the totals as of any day is then a bisect instead of another Sum() query.
+    """
+    def __init__(self, rows, day_field, fields):
+        self.days = []
+        self.totals = []
+
+        running = dict((field, Decimal(0)) for field in fields)
+        for row in rows:
+            for field in fields:
+                running[field] += row[field]
+
+            # several rows on the same day only give us a single total
+            if self.days and self.days[-1] == row[day_field]:
+                self.totals[-1] = dict(running)
+            else:
+                self.days.append(row[day_field])
+                self.totals.append(dict(running))
+
+    def until(self, day):
+        """
+        Returns the totals for all rows on or before the passed in day, None if there are none
+        """
+        index = bisect_right(self.days, to_report_date(day))
+        if index:
+            return self.totals[index - 1]
+        else:
+            return None
+
+class WetmillTimeSeries(object):
+    """
+    The cumulative cherry, parchment and working capital totals for a single wetmill across a season,
+    used to build the weekly curves on the wetmill dashboard.  Each kind of submission is loaded once,
+    along with the wetmill's assumptions and the latest NYC price, so each week is just a lookup.
+    """
+    CHERRY_FIELDS = ('cherry_purchased', 'cash_spent', 'credit_spent')
+    PARCHMENT_FIELDS = ('grade_a_stored', 'grade_b_stored', 'grade_c_stored',
+                        'grade_a_shipped', 'grade_b_shipped', 'grade_c_shipped')
+    FINANCE_FIELDS = ('working_capital',)
+
+    def __init__(self, season, wetmill, user, context=None):
+        if context is None:
+            context = DashboardContext(season, user)
+
+        self.season = season
+        self.wetmill = wetmill
+        self.context = context
+        self.assumptions = context.get_assumptions([wetmill.id])[wetmill.id]
+
+        cherry = IbitumbweSubmission.objects.filter(season=season, active=True, wetmill=wetmill).order_by('report_day')
+        self.cherry = CumulativeSeries(cherry.values('report_day', *self.CHERRY_FIELDS), 'report_day', self.CHERRY_FIELDS)
+
+        parchment = SitokiSubmission.objects.filter(season=season, active=True, wetmill=wetmill).order_by('start_of_week')
+        self.parchment = CumulativeSeries(parchment.values('start_of_week', *self.PARCHMENT_FIELDS), 'start_of_week', self.PARCHMENT_FIELDS)
 
-    assumptions = load_assumptions_for_wetmills(season, [wetmill, ], user)
-    assumptions = assumptions.get(wetmill.id)
+        finance = AmafarangaSubmission.objects.filter(season=season, wetmill=wetmill).order_by('start_of_week')
+        self.finance = CumulativeSeries(finance.values('start_of_week', *self.FINANCE_FIELDS), 'start_of_week', self.FINANCE_FIELDS)
+
+    def stock_data(self, until_date):
+        """
+        Returns the cherry and parchment totals for our wetmill as of the passed in date, along
+        with the estimated parchment values calculated from them.
+        """
+        wetmill_data = dict(wetmill=self.wetmill, assumptions=self.assumptions)
+
+        cherry = self.cherry.until(until_date)
+        if cherry:
+            wetmill_data['cherry_ytd'] = cherry['cherry_purchased']
+
+        parchment = self.parchment.until(until_date)
+        if parchment:
+            stored = parchment['grade_a_stored'] + parchment['grade_b_stored'] + parchment['grade_c_stored']
+            shipped = parchment['grade_a_shipped'] + parchment['grade_b_shipped'] + parchment['grade_c_shipped']
+
+            wetmill_data['parchment_stored_ytd'] = stored
+            wetmill_data['parchment_shipped_ytd'] = shipped
+            wetmill_data['parchment_in_store'] = stored - shipped
+
+        calculate_parchment_estimates([wetmill_data], self.context)
+        return wetmill_data
+
+    def working_capital(self, until_date):
+        """
+        Returns the working capital received by our wetmill as of the passed in date, None if it
+        hasn't sent any cash reports by then.
+        """
+        finance = self.finance.until(until_date)
+        if finance:
+            return finance['working_capital']
+        else:
+            return None
+
+def calculate_estimated_stored_parchment_value_curve(season, wetmill, user, series=None):
+    if series is None:
+        series = WetmillTimeSeries(season, wetmill, user)
+
+    assumptions = series.assumptions
     season_start = assumptions.season_start
     season_length = (assumptions.season_end - season_start).days
 
@@ -1540,18 +1996,18 @@ def calculate_estimated_stored_parchment_value_curve(season, wetmill, user):
         while day <= length and (current.date() <= datetime.now().date() and current.date() <= assumptions.season_end):
             # this is a full week?
             if day % 7 == 0:
-                est_stored_parchment_this_week = calculate_weekly_wetmill_data(season=season, wetmill=wetmill, user=user, until_date=current)
-                if est_stored_parchment_this_week[0].get('est_stored_parchment_value'):
-                    parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_stored_parchment_this_week[0]['est_stored_parchment_value']))
+                est_stored_parchment_this_week = series.stock_data(current)
+                if est_stored_parchment_this_week.get('est_stored_parchment_value'):
+                    parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_stored_parchment_this_week['est_stored_parchment_value']))
                 current = current + timedelta(days=7)
 
             day += 1
 
         # extra day to add?
         if (day - 1) % 7 != 0:
-            est_stored_parchment_this_week = calculate_weekly_wetmill_data(season=season, wetmill=wetmill, user=user, until_date=current)
-            if est_stored_parchment_this_week[0].get('est_stored_parchment_value'):
-                parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_stored_parchment_this_week[0]['est_stored_parchment_value']))
+            est_stored_parchment_this_week = series.stock_data(current)
+            if est_stored_parchment_this_week.get('est_stored_parchment_value'):
+                parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_stored_parchment_this_week['est_stored_parchment_value']))
             current = current + timedelta(days=7)
 
         wm_curve = []
@@ -1561,34 +2017,11 @@ def calculate_estimated_stored_parchment_value_curve(season, wetmill, user):
         return wm_curve
 
 
-def calculate_weekly_wetmill_data(season, wetmill, user, until_date):
-    stock_data = []
-    wetmill_id = wetmill.pk
-
-    cherry_ytd = calculate_cherry_ytd(season, wetmill_id, until_date)
-    parchment_ytd = calculate_parchment_stats(season, wetmill_id, until_date)
-    assumptions = load_assumptions_for_wetmills(season, [wetmill, ], user)
-
-    wetmill_data = dict(wetmill=wetmill, assumptions=assumptions.get(wetmill.id))
-
-    cherry = cherry_ytd.get(wetmill.pk)
-    if cherry:
-        wetmill_data.update(cherry)
+def calculate_estimated_total_parchment_value_curve(season, wetmill, user, series=None):
+    if series is None:
+        series = WetmillTimeSeries(season, wetmill, user)
 
-    parchment = parchment_ytd.get(wetmill.pk)
-    if parchment:
-        wetmill_data.update(parchment)
-
-    stock_data.append(wetmill_data)
-
-    calculate_parchment_estimates(stock_data, season.exchange_rate)
-
-    return stock_data
-
-
-def calculate_estimated_total_parchment_value_curve(season, wetmill, user):
-    assumptions = load_assumptions_for_wetmills(season, [wetmill, ], user)
-    assumptions = assumptions.get(wetmill.id)
+    assumptions = series.assumptions
     season_start = assumptions.season_start
     season_length = (assumptions.season_end - season_start).days
 
@@ -1606,18 +2039,18 @@ def calculate_estimated_total_parchment_value_curve(season, wetmill, user):
         # this is a full week?
 
         # append our week's haul
-        est_total_parchment_this_week = calculate_weekly_wetmill_data(season=season, wetmill=wetmill, user=user, until_date=current)
-        if est_total_parchment_this_week[0].get('est_total_parchment_value'):
-            parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_total_parchment_this_week [0]['est_total_parchment_value']))
+        est_total_parchment_this_week = series.stock_data(current)
+        if est_total_parchment_this_week.get('est_total_parchment_value'):
+            parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_total_parchment_this_week['est_total_parchment_value']))
         current = current + timedelta(days=7)
 
         day += 1
 
     # extra day to add?
     if (day - 1) % 7 != 0:
-        est_total_parchment_this_week = calculate_weekly_wetmill_data(season=season, wetmill=wetmill, user=user, until_date=current)
-        if est_total_parchment_this_week[0].get('est_total_parchment_value'):
-            parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_total_parchment_this_week [0]['est_total_parchment_value']))
+        est_total_parchment_this_week = series.stock_data(current)
+        if est_total_parchment_this_week.get('est_total_parchment_value'):
+            parchment_est.append((int(time.mktime(current.timetuple())) * 1000, est_total_parchment_this_week['est_total_parchment_value']))
         current = current + timedelta(days=7)
 
     wm_curve = []
@@ -1627,9 +2060,11 @@ def calculate_estimated_total_parchment_value_curve(season, wetmill, user):
     return wm_curve
 
 
-def calculate_working_capital_curve(season, wetmill, user):
-    assumptions = load_assumptions_for_wetmills(season, [wetmill, ], user)
-    assumptions = assumptions.get(wetmill.id)
+def calculate_working_capital_curve(season, wetmill, user, series=None):
+    if series is None:
+        series = WetmillTimeSeries(season, wetmill, user)
+
+    assumptions = series.assumptions
     season_start = assumptions.season_start
     season_length = (assumptions.season_end - season_start).days
 
@@ -1647,18 +2082,18 @@ def calculate_working_capital_curve(season, wetmill, user):
         # this is a full week?
         if day % 7 == 0:
             # append our week's haul
-            total_working_capital_this_week = calculate_amafaranga_ytd(season, [wetmill.pk, ], current)
-            if total_working_capital_this_week.get(wetmill.pk):
-                working_capital.append((int(time.mktime(current.timetuple())) * 1000, total_working_capital_this_week.get(wetmill.pk)['working_capital_ytd']))
+            total_working_capital_this_week = series.working_capital(current)
+            if total_working_capital_this_week is not None:
+                working_capital.append((int(time.mktime(current.timetuple())) * 1000, total_working_capital_this_week))
             current = current + timedelta(days=7)
 
         day += 1
 
     # extra day to add?
     if (day - 1) % 7 != 0:
-        total_working_capital_this_week = calculate_amafaranga_ytd(season, [wetmill.pk, ], current)
-        if total_working_capital_this_week.get(wetmill.pk):
-            working_capital.append((int(time.mktime(current.timetuple())) * 1000, total_working_capital_this_week.get(wetmill.pk)['working_capital_ytd']))
+        total_working_capital_this_week = series.working_capital(current)
+        if total_working_capital_this_week is not None:
+            working_capital.append((int(time.mktime(current.timetuple())) * 1000, total_working_capital_this_week))
         current = current + timedelta(days=7)
 
     wm_curve = []
@@ -1725,4 +2160,23 @@ class NYCherryPrice(SmartModel):
 
         return profit_per_kilo * exchange_rate
 
+def refresh_submission_rollup(sender, instance, created=False, **kwargs):
+    # new submissions waiting to be approved don't count towards anything yet
+    if created and not instance.active:
+        return
+
+    WetmillSeasonRollup.refresh(instance.wetmill_id, instance.season_id)
+
+def remove_submission_rollup(sender, instance, **kwargs):
+    # our wetmill or season may be on its way out too, so only update rollups which exist
+    WetmillSeasonRollup.refresh(instance.wetmill_id, instance.season_id, create=False)
+
+post_save.connect(refresh_submission_rollup, sender=IbitumbweSubmission, dispatch_uid="refresh_ibitumbwe_rollup")
+post_save.connect(refresh_submission_rollup, sender=TwakinzeSubmission, dispatch_uid="refresh_twakinze_rollup")
+post_save.connect(refresh_submission_rollup, sender=SitokiSubmission, dispatch_uid="refresh_sitoki_rollup")
+post_save.connect(refresh_submission_rollup, sender=AmafarangaSubmission, dispatch_uid="refresh_amafaranga_rollup")
 
+post_delete.connect(remove_submission_rollup, sender=IbitumbweSubmission, dispatch_uid="remove_ibitumbwe_rollup")
+post_delete.connect(remove_submission_rollup, sender=TwakinzeSubmission, dispatch_uid="remove_twakinze_rollup")
+post_delete.connect(remove_submission_rollup, sender=SitokiSubmission, dispatch_uid="remove_sitoki_rollup")
+post_delete.connect(remove_submission_rollup, sender=AmafarangaSubmission, dispatch_uid="remove_amafaranga_rollup")
@@ -250,6 +250,69 @@ class DashboardTest(TNSTestCase):
         # but has the same values as our season assumptions
         self.assertEquals(wetmill_assumptions.target, csp_assumptions.target)
 
+    def test_dashboard_context(self):
+        season = self.rwanda_2010
+
+        season_assumptions = Assumptions.get_or_create(season, None, None, self.admin)
+        season_assumptions.target = 2000
+        season_assumptions.save()
+
+        csp_assumptions = Assumptions.get_or_create(season, self.rtc, None, self.admin)
+        csp_assumptions.target = 3000
+        csp_assumptions.milling_costs = Decimal("0.50")
+        csp_assumptions.save()
+
+        wetmill_assumptions = Assumptions.get_or_create(season, self.rtc, self.nasho, self.admin)
+        wetmill_assumptions.fi_costs = Decimal("0.20")
+        wetmill_assumptions.save()
+
+        self.nasho.set_csp_for_season(season, self.rtc)
+        self.coko.set_csp_for_season(season, self.rtc)
+
+        NYCherryPrice.objects.create(date=date(2012, 1, 1), price=Decimal("3.50"),
+                                     created_by=self.admin, modified_by=self.admin)
+        NYCherryPrice.objects.create(date=date(2012, 1, 2), price=Decimal("3.60"),
+                                     created_by=self.admin, modified_by=self.admin)
+
+        context = DashboardContext(season, self.admin)
+        self.assertEquals(self.rtc, context.get_csp(self.nasho.id))
+        self.assertEquals(Decimal("3.60"), context.price.price)
+
+        assumptions = context.get_assumptions([self.nasho.id, self.coko.id])
+
+        # nasho has its own assumptions, defaulting to those of its csp
+        nasho = assumptions[self.nasho.id]
+        self.assertEquals(wetmill_assumptions.pk, nasho.pk)
+        self.assertEquals(3000, nasho.target)
+        self.assertEquals(Decimal("0.50"), nasho.milling_costs)
+        self.assertEquals(Decimal("0.20"), nasho.fi_costs)
+        self.assertDecimalEquals("1.78", nasho.production_costs)
+        self.assertDecimalEquals("13", nasho.cherry_green_ratio)
+
+        # coko has none of its own, so uses its csp's
+        coko = assumptions[self.coko.id]
+        self.assertEquals(csp_assumptions.pk, coko.pk)
+        self.assertEquals(3000, coko.target)
+        self.assertEquals(Decimal("0.50"), coko.milling_costs)
+        self.assertDecimalEquals("1.78", coko.production_costs)
+
+        # and a wetmill with no csp of its own for the season uses the season's
+        self.coko.set_csp_for_season(season, None)
+        context = DashboardContext(season, self.admin)
+        coko = context.get_assumptions([self.coko.id])[self.coko.id]
+        self.assertEquals(season_assumptions.pk, coko.pk)
+        self.assertEquals(2000, coko.target)
+        self.assertDecimalEquals("1.64", coko.production_costs)
+
+        # everything is loaded now, so asking again doesn't hit the database
+        with self.assertNumQueries(0):
+            context.price
+            again = context.get_assumptions([self.nasho.id])
+
+        # but each call gets its own copy
+        again[self.nasho.id].total_working_capital = Decimal("100")
+        self.assertEquals(None, nasho.total_working_capital)
+
     def test_calculated_week(self):
         """
         Tests our projected cherry calculations.
@@ -452,6 +515,242 @@ class DashboardTest(TNSTestCase):
         self.assertDecimalEquals('125', curve[6][1])
         self.assertDecimalEquals('0', curve[7][1])
 
+    def test_weekly_curves(self):
+        self.create_connections()
+        self.season = self.rwanda_2010
+        self.accountant = Accountant.objects.create(connection=self.conn2, name="Nic", wetmill=self.nasho)
+
+        NYCherryPrice.objects.create(date=date(2012, 1, 1), price=Decimal("3.50"),
+                                     created_by=self.admin, modified_by=self.admin)
+
+        # two cherry reports on the same day, one the next week
+        for report_day in (date(2011, 11, 2), date(2011, 11, 2), date(2011, 11, 10)):
+            self.create_ibitumbwe(self.nasho, report_day, Decimal(0), Decimal(0), Decimal(1000), Decimal(0),
+                                  Decimal(100), Decimal(0))
+
+        self.create_sitoki(self.nasho, date(2011, 11, 4), Decimal(10), Decimal(5), Decimal(0),
+                           Decimal(2), Decimal(0), Decimal(0))
+        self.create_sitoki(self.nasho, date(2011, 11, 11), Decimal(10), Decimal(0), Decimal(0),
+                           Decimal(5), Decimal(0), Decimal(0))
+
+        for start_of_week in (date(2011, 11, 4), date(2011, 11, 18)):
+            AmafarangaSubmission.objects.create(accountant=self.accountant, wetmill=self.nasho, season=self.season,
+                                                start_of_week=start_of_week, opening_balance=Decimal(0),
+                                                working_capital=Decimal(5000), other_income=Decimal(0),
+                                                advanced=Decimal(0), full_time_labor=Decimal(0), casual_labor=Decimal(0),
+                                                commission=Decimal(0), transport=Decimal(0), other_expenses=Decimal(0))
+
+        series = WetmillTimeSeries(self.season, self.nasho, self.admin)
+
+        # nothing before our first reports
+        self.assertEquals(None, series.working_capital(date(2011, 11, 1)))
+        self.assertFalse('cherry_ytd' in series.stock_data(date(2011, 11, 1)))
+
+        # our totals should match what we get querying as of each day
+        for day in (date(2011, 11, 2), date(2011, 11, 5), date(2011, 11, 12), datetime(2011, 11, 19, 0, 0, 0, 0, pytz.utc)):
+            stock = series.stock_data(day)
+            cherry = calculate_cherry_ytd(self.season, self.nasho.pk, day)[self.nasho.pk]
+            self.assertEquals(cherry['cherry_ytd'], stock['cherry_ytd'])
+
+            parchment = calculate_parchment_stats(self.season, self.nasho.pk, day).get(self.nasho.pk)
+            if parchment:
+                self.assertEquals(parchment['parchment_stored_ytd'], stock['parchment_stored_ytd'])
+                self.assertEquals(parchment['parchment_in_store'], stock['parchment_in_store'])
+                self.assertTrue(stock['est_stored_parchment_value'] > 0)
+            else:
+                self.assertFalse('est_stored_parchment_value' in stock)
+
+            finance = calculate_amafaranga_ytd(self.season, [self.nasho.pk], day).get(self.nasho.pk)
+            self.assertEquals(finance['working_capital_ytd'] if finance else None, series.working_capital(day))
+
+        self.assertEquals(Decimal(300), series.stock_data(date(2011, 11, 12))['cherry_ytd'])
+        self.assertEquals(Decimal(25), series.stock_data(date(2011, 11, 12))['parchment_stored_ytd'])
+        self.assertEquals(Decimal(10000), series.working_capital(date(2011, 11, 18)))
+
+        # our curves come out of the same series, one point a week once we have data
+        curve = calculate_working_capital_curve(self.season, self.nasho, self.admin, series)
+        self.assertEquals([Decimal(5000), Decimal(5000), Decimal(10000)], [point[1] for point in curve[:3]])
+        self.assertEquals(Decimal(10000), curve[-1][1])
+
+        curve = calculate_estimated_total_parchment_value_curve(self.season, self.nasho, self.admin, series)
+        self.assertTrue(curve[0][1] < curve[1][1])
+
+        curve = calculate_estimated_stored_parchment_value_curve(self.season, self.nasho, self.admin)
+        self.assertTrue(curve[0][1] < curve[1][1])
+
+    def test_finance_variance(self):
+        self.create_connections()
+        self.season = self.rwanda_2010
+        self.accountant = Accountant.objects.create(connection=self.conn2, name="Nic", wetmill=self.nasho)
+
+        base = date(2011, 5, 6)
+        wetmill_data = []
+
+        # a few hundred wetmills, each sending its last cash report in one of three different weeks
+        for i in range(250):
+            wetmill = Wetmill.objects.create(name="Wetmill %d" % i, sms_name="wetmill%d" % i, country=self.rwanda,
+                                             province=self.gitega, year_started=2008,
+                                             created_by=self.admin, modified_by=self.admin)
+
+            # every tenth wetmill hasn't sent any cash reports
+            if i % 10 == 9:
+                wetmill_data.append(dict(wetmill=wetmill))
+                continue
+
+            last = base + timedelta(days=7 * (i % 3))
+
+            # our previous cash report closes with 900 + i
+            AmafarangaSubmission.objects.create(accountant=self.accountant, wetmill=wetmill, season=self.season,
+                                                start_of_week=last - timedelta(days=7), opening_balance=Decimal(1000),
+                                                working_capital=Decimal(i), other_income=Decimal(0),
+                                                advanced=Decimal(100), full_time_labor=Decimal(0), casual_labor=Decimal(0),
+                                                commission=Decimal(0), transport=Decimal(0), other_expenses=Decimal(0))
+
+            # one cherry report in the week of our last cash report, one after it which shouldn't be counted
+            self.create_ibitumbwe(wetmill, last + timedelta(days=1), Decimal(100 + i), Decimal(0), Decimal(0), Decimal(0),
+                                  Decimal(10), Decimal(0))
+            self.create_ibitumbwe(wetmill, last + timedelta(days=7), Decimal(1000), Decimal(0), Decimal(0), Decimal(0),
+                                  Decimal(10), Decimal(0))
+
+            wetmill_data.append(dict(wetmill=wetmill, amafaranga_last=last, advanced_last=Decimal(100),
+                                     opening_balance_last=Decimal(900 + i)))
+
+        wetmill_ids = [data['wetmill'].id for data in wetmill_data]
+
+        # we run the same queries no matter how many wetmills we have
+        with self.assertNumQueries(6):
+            calculate_finance_variance(self.season, wetmill_ids[:5], wetmill_data[:5], base)
+
+        with self.assertNumQueries(6):
+            calculate_finance_variance(self.season, wetmill_ids, wetmill_data, base)
+
+        for i, data in enumerate(wetmill_data):
+            if i % 10 == 9:
+                self.assertFalse('advanced_variance' in data)
+                self.assertFalse('balance_variance' in data)
+                continue
+
+            self.assertDecimalEquals(100 + i, data['advanced_week'])
+            self.assertDecimalEquals(i, data['advanced_variance'])
+            self.assertDecimalEquals(Decimal(i), data['advanced_variance_pct'])
+            self.assertDecimalEquals(900 + i, data['balance_previous_close'])
+            self.assertDecimalEquals(0, data['balance_variance'])
+            self.assertDecimalEquals(0, data['balance_variance_pct'])
+
+        # nothing to calculate, no queries
+        with self.assertNumQueries(0):
+            calculate_finance_variance(self.season, [], [], base)
+
+    def test_rollups(self):
+        self.create_connections()
+        self.season = self.rwanda_2010
+        self.accountant = Accountant.objects.create(connection=self.conn2, name="Nic", wetmill=self.nasho)
+
+        assumptions = Assumptions.get_or_create(self.season, None, None, self.admin)
+        assumptions.season_start = date(2011, 5, 1)
+        assumptions.season_end = date(2011, 8, 1)
+        assumptions.save()
+
+        self.create_ibitumbwe(self.nasho, date(2011, 5, 7), Decimal(0), Decimal(0), Decimal(5000), Decimal(1000),
+                              Decimal(100), Decimal(0))
+        self.create_ibitumbwe(self.nasho, date(2011, 5, 8), Decimal(0), Decimal(0), Decimal(3000), Decimal(0),
+                              Decimal(50), Decimal(0))
+        self.create_ibitumbwe(self.coko, date(2011, 5, 7), Decimal(0), Decimal(0), Decimal(2000), Decimal(0),
+                              Decimal(40), Decimal(0))
+        self.create_sitoki(self.nasho, date(2011, 5, 6), Decimal(10), Decimal(5), Decimal(0),
+                           Decimal(2), Decimal(0), Decimal(0))
+
+        # saving active submissions keeps our rollups up to date
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals("150", rollup.cherry_ytd)
+        self.assertDecimalEquals("50", rollup.cherry_last)
+        self.assertDecimalEquals("15", rollup.parchment_stored_ytd)
+        self.assertEquals(date(2011, 5, 8), rollup.cherry_date_last)
+        self.assertEquals(date(2011, 5, 6), rollup.sitoki_last)
+        self.assertEquals(None, rollup.working_capital_ytd)
+
+        # but we haven't counted submissions for any season dates yet
+        self.assertEquals(None, rollup.ibitumbwe_count_ytd)
+
+        wetmills = [self.coko, self.nasho]
+        today = date(2011, 5, 9)
+
+        # our dashboard data should be the same as building it from our submissions
+        (stock_fields, finance_fields, compliance_fields, data) = build_dashboard_data(self.season, wetmills, today, self.admin)
+
+        (expected_stock_fields, expected) = build_stock_data(self.season, wetmills, today, self.admin)
+        (expected_finance_fields, expected) = build_finance_data(self.season, expected, wetmills, today, self.admin)
+        (expected_compliance_fields, expected) = build_compliance_data(self.season, expected, wetmills, today, self.admin)
+
+        self.assertEquals([f['slug'] for f in expected_stock_fields], [f['slug'] for f in stock_fields])
+        self.assertEquals([f['slug'] for f in expected_finance_fields], [f['slug'] for f in finance_fields])
+        self.assertEquals([f['slug'] for f in expected_compliance_fields], [f['slug'] for f in compliance_fields])
+
+        for (actual, truth) in zip(data, expected):
+            self.assertEquals(set(truth.keys()), set(actual.keys()))
+            for key, value in truth.items():
+                if isinstance(value, Decimal):
+                    self.assertDecimalEquals(value, actual[key])
+                else:
+                    self.assertEquals(value, actual[key])
+
+        # we've now counted submissions within our season
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertEquals(2, rollup.ibitumbwe_count_ytd)
+        self.assertEquals(1, rollup.sitoki_count_ytd)
+        self.assertEquals(date(2011, 5, 1), rollup.compliance_start)
+
+        # a new submission for the same day replaces the old one
+        self.create_ibitumbwe(self.nasho, date(2011, 5, 8), Decimal(0), Decimal(0), Decimal(1000), Decimal(0),
+                              Decimal(20), Decimal(0))
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals("120", rollup.cherry_ytd)
+        self.assertDecimalEquals("20", rollup.cherry_last)
+        self.assertEquals(2, rollup.ibitumbwe_count_ytd)
+
+        # pending submissions don't count until they are approved
+        self.create_ibitumbwe(self.nasho, date(2011, 5, 9), Decimal(0), Decimal(0), Decimal(1000), Decimal(0),
+                              Decimal(30), Decimal(0))
+        pending = IbitumbweSubmission.objects.get(wetmill=self.nasho, report_day=date(2011, 5, 9))
+        pending.active = False
+        pending.save()
+
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals("120", rollup.cherry_ytd)
+        self.assertEquals(date(2011, 5, 8), rollup.cherry_date_last)
+
+        # removing submissions also updates us
+        SitokiSubmission.objects.filter(wetmill=self.nasho).delete()
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertEquals(None, rollup.parchment_stored_ytd)
+        self.assertEquals(None, rollup.sitoki_count_ytd)
+
+        # changing our season dates recounts our submissions
+        assumptions.season_start = date(2011, 5, 8)
+        assumptions.save()
+        (stock_fields, finance_fields, compliance_fields, data) = build_dashboard_data(self.season, wetmills, today, self.admin)
+        self.assertEquals(1, data[1]['ibitumbwe_count_ytd'])
+        self.assertEquals(1, WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season).ibitumbwe_count_ytd)
+
+        # rebuilding gets us the same rollup
+        WetmillSeasonRollup.objects.filter(wetmill=self.nasho).update(cherry_ytd=None)
+        self.assertEquals(2, WetmillSeasonRollup.rebuild(self.season, self.admin))
+
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals("120", rollup.cherry_ytd)
+        self.assertEquals(1, rollup.ibitumbwe_count_ytd)
+
+        # sales replace the ibitumbwe sent the day they were made, that updates us too
+        sale = IgurishaSubmission.objects.create(accountant=self.accountant, wetmill=self.nasho, season=self.season,
+                                                 buyer="RTC", sales_date=date(2011, 5, 8), grade="A", volume=Decimal(10),
+                                                 price=Decimal(1000), currency="R", exchange_rate=Decimal(600), sale_type='FOT')
+        IgurishaSubmission.objects.filter(pk=sale.pk).update(created=datetime(2011, 5, 8, 12, 0))
+        IgurishaSubmission.objects.get(pk=sale.pk).save()
+
+        rollup = WetmillSeasonRollup.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals("100", rollup.cherry_ytd)
+        self.assertEquals(date(2011, 5, 7), rollup.cherry_date_last)
+
     def test_ideal_submission_count(self):
         season_start = date(day=27, month=2, year=2013)
         today = date(day=6, month=3, year=2013)
@@ -459,6 +758,71 @@ class DashboardTest(TNSTestCase):
 
         self.assertEquals(10, calculate_ideal_submission_count(self.season, self.nasho, season_start, today))
 
+    def test_submission_calendar(self):
+        calendar = SubmissionCalendar(date(2011, 5, 1), date(2011, 5, 31))
+
+        # daily messages only count within the season, weekly ones from the week before it
+        calendar.add('ibitumbwe', date(2011, 4, 30))
+        calendar.add('ibitumbwe', date(2011, 5, 1))
+        calendar.add('ibitumbwe', date(2011, 5, 3))
+        calendar.add('ibitumbwe', date(2011, 5, 3))
+        calendar.add('ibitumbwe', date(2011, 6, 1))
+        calendar.add('sitoki', date(2011, 4, 23))
+        calendar.add('sitoki', date(2011, 4, 24))
+
+        self.assertEquals(2, calendar.count('ibitumbwe'))
+        self.assertEquals(date(2011, 5, 3), calendar.last('ibitumbwe'))
+        self.assertEquals(1, calendar.count('sitoki'))
+        self.assertEquals(0, calendar.count('twakinze'))
+        self.assertEquals(None, calendar.last('twakinze'))
+
+        self.assertEquals(dict(ibitumbwe_count_ytd=2, ibitumbwe_date_last=date(2011, 5, 3),
+                               sitoki_count_ytd=1, sitoki_date_last=date(2011, 4, 24)), calendar.get_counts())
+
+    def test_compliance_ytd(self):
+        self.create_connections()
+        self.season = self.rwanda_2010
+        self.accountant = Accountant.objects.create(connection=self.conn2, name="Nic", wetmill=self.nasho)
+
+        # our season runs from 2011-11-01, cherry before then doesn't count
+        self.create_ibitumbwe(self.nasho, date(2011, 11, 2), Decimal(0), Decimal(0), Decimal(0), Decimal(0),
+                              Decimal(10), Decimal(0))
+        self.create_ibitumbwe(self.nasho, date(2011, 11, 3), Decimal(0), Decimal(0), Decimal(0), Decimal(0),
+                              Decimal(10), Decimal(0))
+        self.create_ibitumbwe(self.coko, date(2011, 10, 30), Decimal(0), Decimal(0), Decimal(0), Decimal(0),
+                              Decimal(10), Decimal(0))
+        self.create_ibitumbwe(self.coko, date(2011, 11, 2), Decimal(0), Decimal(0), Decimal(0), Decimal(0),
+                              Decimal(10), Decimal(0))
+
+        AmafarangaSubmission.objects.create(accountant=self.accountant, wetmill=self.nasho, season=self.season,
+                                            start_of_week=date(2011, 10, 28), opening_balance=Decimal(0),
+                                            working_capital=Decimal(0), other_income=Decimal(0),
+                                            advanced=Decimal(0), full_time_labor=Decimal(0), casual_labor=Decimal(0),
+                                            commission=Decimal(0), transport=Decimal(0), other_expenses=Decimal(0))
+
+        wetmills = [self.nasho, self.coko]
+        assumptions = load_assumptions_for_wetmills(self.season, wetmills, self.admin)
+        wetmill_data = [dict(wetmill=wetmill, assumptions=assumptions[wetmill.id]) for wetmill in wetmills]
+
+        # one query for each kind of submission and one for our accounting systems
+        with self.assertNumQueries(5):
+            calculate_compliance_ytd(self.season, [w.id for w in wetmills], wetmill_data, date.today())
+
+        (nasho, coko) = wetmill_data
+        self.assertEquals(2, nasho['ibitumbwe_count_ytd'])
+        self.assertEquals(1, nasho['amafaranga_count_ytd'])
+        self.assertEquals(date(2011, 11, 3), nasho['ibitumbwe_date_last'])
+        self.assertEquals(3, nasho['submission_count'])
+        self.assertEquals(1, coko['submission_count'])
+
+        # nasho uses the 2012 accounting system so also needs to send weekly messages, coko doesn't
+        for data in wetmill_data:
+            ideal = calculate_ideal_submission_count(self.season, data['wetmill'], data['season_day_start'], data['season_ideal_last_daily'])
+            self.assertEquals(ideal, data['ideal_submission_count'])
+            self.assertEquals(ideal - data['submission_count'], data['missing_count'])
+
+        self.assertTrue(nasho['ideal_submission_count'] > coko['ideal_submission_count'])
+
     def test_nyc_price(self):
         price = NYCherryPrice.lookup_nyc_price()
 
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
 from csps.models import CSP
-from dashboard.models import build_wetmill_data, calculate_cp_chart, calculate_expenses_chart, Assumptions, build_stock_data, build_finance_data, build_compliance_data, calculate_totals, calculate_predicted_cherry_curve, convert_weekly_to_total, PredictedOutput, calculate_actual_cherry_curve, calculate_price_chart, calculate_estimated_total_parchment_value_curve, calculate_estimated_stored_parchment_value_curve, calculate_working_capital_curve, remove_current_datapoint, convert_to_usd, calculate_performance_alerts, adjust_currency_per_weight_values
+from dashboard.models import build_wetmill_data, calculate_cp_chart, calculate_expenses_chart, Assumptions, build_stock_data, build_finance_data, build_compliance_data, calculate_totals, calculate_predicted_cherry_curve, convert_weekly_to_total, PredictedOutput, calculate_actual_cherry_curve, calculate_price_chart, calculate_estimated_total_parchment_value_curve, calculate_estimated_stored_parchment_value_curve, calculate_working_capital_curve, WetmillTimeSeries, DashboardContext, build_dashboard_data, remove_current_datapoint, convert_to_usd, calculate_performance_alerts, adjust_currency_per_weight_values
 from django.core.urlresolvers import reverse
 from django import forms
 from django.http import HttpResponseRedirect, HttpResponse
@@ -378,7 +378,9 @@ class DashboardCRUDL(SmartCRUDL):
             wetmills = Wetmill.objects.filter(pk__in=wetmills)
             csp = wetmill.get_csp_for_season(season)
 
-            season_data = build_wetmill_data(season, wetmills, self.request.user)
+            # the price, assumptions and csps shared by all our calculations
+            dashboard_context = DashboardContext(season, self.request.user)
+            season_data = build_wetmill_data(season, wetmills, self.request.user, dashboard_context)
 
             context['active_tab'] = self.request.REQUEST.get('active_tab', None)
 
@@ -412,9 +414,11 @@ class DashboardCRUDL(SmartCRUDL):
 
             (context['wetmill_prices'], context['nyc_prices']) = calculate_price_chart(season, wetmill_data[0])
 
-            context['wetmill_parchment_estimated_total_values'] = calculate_estimated_total_parchment_value_curve(season, wetmill, self.request.user)
-            context['wetmill_parchment_estimated_stored_values'] = calculate_estimated_stored_parchment_value_curve(season, wetmill, self.request.user)
-            context['wetmill_working_capital_values'] = calculate_working_capital_curve(season, wetmill, self.request.user)
+            # our weekly curves all come from the same submissions, load them once
+            series = WetmillTimeSeries(season, wetmill, self.request.user, dashboard_context)
+            context['wetmill_parchment_estimated_total_values'] = calculate_estimated_total_parchment_value_curve(season, wetmill, self.request.user, series)
+            context['wetmill_parchment_estimated_stored_values'] = calculate_estimated_stored_parchment_value_curve(season, wetmill, self.request.user, series)
+            context['wetmill_working_capital_values'] = calculate_working_capital_curve(season, wetmill, self.request.user, series)
 
             context['newline'] = '\n'
             context['local'] = season.country.currency
@@ -431,7 +435,7 @@ class DashboardCRUDL(SmartCRUDL):
 
             single_wetmill = [_ for _ in wetmills if _.pk == wetmill.pk]
 
-            (stock_fields, wetmill_data) = build_stock_data(season, single_wetmill, today, self.request.user)
+            (stock_fields, wetmill_data) = build_stock_data(season, single_wetmill, today, self.request.user, dashboard_context)
             (finance_fields, wetmill_data) = build_finance_data(season, wetmill_data, single_wetmill, today, self.request.user)
             (compliance_fields, wetmill_data) = build_compliance_data(season, wetmill_data, single_wetmill, today, self.request.user)
 
@@ -606,21 +610,20 @@ class DashboardCRUDL(SmartCRUDL):
             wetmills = all_wetmills.filter(pk__in=active_wetmills)
             inactive_wetmills = all_wetmills.exclude(pk__in=active_wetmills)
 
-            wetmill_csp_mappings = dict()
-            for wetmill_csp in WetmillCSPSeason.objects.filter(season=season).select_related('csp', 'wetmill'):
-                wetmill_csp_mappings[wetmill_csp.wetmill.id] = wetmill_csp.csp
+            # the price, assumptions and csps shared by all our calculations
+            dashboard_context = DashboardContext(season, self.request.user)
             for inactive in inactive_wetmills:
-                if inactive.id in wetmill_csp_mappings:
-                    inactive.csp = wetmill_csp_mappings[inactive.id]
+                csp = dashboard_context.get_csp(inactive.id)
+                if csp:
+                    inactive.csp = csp
 
             context['object_list'] = wetmills
             context['wetmills'] = wetmills
             context['inactive'] = inactive_wetmills
             context['full_wetmill_count'] = len(wetmills) + len(inactive_wetmills)
 
-            (stock_fields, wetmill_data) = build_stock_data(season, context['object_list'], today, self.request.user)
-            (finance_fields, wetmill_data) = build_finance_data(season, wetmill_data, context['object_list'], today, self.request.user)
-            (compliance_fields, wetmill_data) = build_compliance_data(season, wetmill_data, context['object_list'], today, self.request.user)
+            # our totals come from the season rollups of our wetmills
+            (stock_fields, finance_fields, compliance_fields, wetmill_data) = build_dashboard_data(season, list(context['object_list']), today, self.request.user, dashboard_context)
             calculate_performance_alerts(season, wetmill_data)
 
 
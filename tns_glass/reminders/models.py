@@ -1,6 +1,6 @@
 from datetime import timedelta
-from rapidsms_httprouter.router import get_router
-from django.utils.translation import trans_real
+from functools import partial
+from util.outbox import Outbox
 
 from sms.models import *
 from wetmills.models import WetmillSeasonAccountingSystem
@@ -42,28 +42,33 @@ def get_wetmills_needing_weekly_reminder(week_start, objects):
     return active_wetmills - compliant_wetmills
 
 def send_reminders_for_wetmills(xform, wetmills, context, default_text):
-    router = get_router()
+    outbox = Outbox()
+
+    # look up everybody we need to remind at once
+    accountants = dict()
+    for accountant in Accountant.objects.filter(wetmill__in=wetmills):
+        accountants.setdefault(accountant.wetmill_id, []).append(accountant)
+
+    observers = dict()
+    for observer in WetmillObserver.objects.filter(wetmill__in=wetmills):
+        observers.setdefault(observer.wetmill_id, []).append(observer)
 
     # for each wetmill
     for wetmill in wetmills:
-        context['wetmill'] = wetmill
-
-        # send to all accountants
-        for accountant in Accountant.objects.filter(wetmill=wetmill):
-            # activate our language if there is one
-            trans_real.activate(accountant.language)
-            text = Blurb.get(xform, 'accountant-reminder', context, default_text)
+        wetmill_context = dict(context, wetmill=wetmill)
 
-            # and send it off
-            router.add_outgoing(accountant.connection, text)
+        # send to all accountants, in their language
+        for accountant in accountants.get(wetmill.id, []):
+            outbox.add(accountant.connection,
+                       partial(Blurb.get, xform, 'accountant-reminder', wetmill_context, default_text),
+                       accountant.language)
 
         # and all observers
-        for observer in WetmillObserver.objects.filter(wetmill=wetmill):
-            # activate our language if there is one
-            trans_real.activate(observer.language)
-            text = Blurb.get(xform, 'observer-reminder', context, default_text)
+        for observer in observers.get(wetmill.id, []):
+            outbox.add(observer.connection,
+                       partial(Blurb.get, xform, 'observer-reminder', wetmill_context, default_text),
+                       observer.language)
 
-            # and send it off
-            router.add_outgoing(observer.connection, text)
+    outbox.send()
 
     activate('en-us')
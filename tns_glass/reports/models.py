@@ -1,21 +1,117 @@
+import os
 from django.db import models
 from smartmin.models import *
 from wetmills.models import Wetmill
-from seasons.models import Season
+from seasons.models import Season, filter_season_tree
 from grades.models import Grade
 from expenses.models import Expense
-from locales.models import Currency
+from locales.models import Currency, Weight
 from cashuses.models import CashUse
 from cashsources.models import CashSource
 from farmerpayments.models import FarmerPayment
 from decimal import Decimal
+from datetime import datetime
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils._os import safe_join
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
+from .tasks import export_reports
 
 class ReportFinalizeException(Exception):
     def __init__(self, fields):
         msg = 'Unable to finalize report due to missing field values. Please fill out these fields and try again: %s' % ", ".join(fields)
         super(ReportFinalizeException, self).__init__(msg)
 
+class ReportSnapshot(object):
+    """
+    Everything needed to build the boxes for a report: its season's configuration, its entries
+    and its sales.  Each piece is loaded with a single query the first time it is used, so
+    building a report no longer runs a query for each configured expense, grade or payment.
+
+    Snapshots are meant to be short lived, create a new one if the report changes.
+    """
+    def __init__(self, report):
+        self.report = report
+
+    @cached_property
+    def expense_tree(self):
+        return self.report.season.get_expense_tree()
+
+    @cached_property
+    def grade_tree(self):
+        return self.report.season.get_grade_tree()
+
+    def get_grade_tree(self, kind=None):
+        """
+        Returns our grade tree, optionally only including the top level grades of the passed in kind
+        and their children.
+        """
+        if not kind:
+            return self.grade_tree
+
+        return filter_season_tree(self.grade_tree, lambda grade: grade.kind == kind)
+
+    @cached_property
+    def cash_uses(self):
+        return self.report.season.get_cash_uses()
+
+    @cached_property
+    def cash_sources(self):
+        return self.report.season.get_cash_sources()
+
+    @cached_property
+    def farmer_payments(self):
+        return self.report.season.get_farmer_payments()
+
+    @cached_property
+    def expense_entries(self):
+        return dict((entry.expense_id, entry) for entry in self.report.expenses.all())
+
+    @cached_property
+    def production(self):
+        return dict((production.grade_id, production.volume) for production in self.report.production.all())
+
+    @cached_property
+    def cash_use_entries(self):
+        return dict((entry.cash_use_id, entry) for entry in self.report.cash_uses.all())
+
+    @cached_property
+    def cash_source_entries(self):
+        return dict((entry.cash_source_id, entry) for entry in self.report.cash_sources.all())
+
+    @cached_property
+    def farmer_payment_entries(self):
+        return dict((entry.farmer_payment_id, entry) for entry in self.report.farmer_payments.all())
+
+    @cached_property
+    def grades(self):
+        """
+        All our grades by id, with their parents set so walking up the tree doesn't hit the database.
+        """
+        grades = dict((grade.id, grade) for grade in Grade.objects.all())
+        parent_cache = Grade._meta.get_field('parent').get_cache_name()
+        for grade in grades.values():
+            setattr(grade, parent_cache, grades.get(grade.parent_id, None))
+
+        return grades
+
+    @cached_property
+    def sales(self):
+        return list(self.report.sales.all())
+
+    @cached_property
+    def sale_components(self):
+        components = dict()
+        for component in SaleComponent.objects.filter(sale__report=self.report):
+            component.grade = self.grades[component.grade_id]
+            components.setdefault(component.sale_id, []).append(component)
+
+        return components
+
+    def get_sale_components(self, sale):
+        return self.sale_components.get(sale.id, [])
+
 class Report(SmartModel):
     season = models.ForeignKey(Season, related_name='reports', verbose_name=_("Season"),
                                help_text=_("The season this report is summarizing"))
@@ -110,87 +206,81 @@ class Report(SmartModel):
         else:
             return None
 
-    def entries_for_season_expenses(self):
+    def entries_for_season_expenses(self, snapshot=None):
         """
         Returns a list containing a list for each top level category of expense for this report season.
         """
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
+
         season_expenses = []
 
-        for expense in self.season.get_expense_tree():
+        for expense in snapshot.expense_tree:
             expense_entry = dict(expense=expense, value=None, exchange_rate=None)
-            report_entry = self.expenses.filter(expense=expense)
+            report_entry = snapshot.expense_entries.get(expense.id, None)
             if report_entry:
-                expense_entry['value'] = report_entry[0].value
-                expense_entry['exchange_rate'] = report_entry[0].exchange_rate
+                expense_entry['value'] = report_entry.value
+                expense_entry['exchange_rate'] = report_entry.exchange_rate
 
             season_expenses.append(expense_entry)
 
         return season_expenses
 
-    def cash_uses_for_season(self):
+    def cash_uses_for_season(self, snapshot=None):
         """
         Returns a list containing all the configured cashuses for our season, each with an additional 'entry'
         attribute is set to the entry for this report
         """
-        cashuses = self.season.get_cash_uses()
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
+
+        cashuses = snapshot.cash_uses
         for cashuse in cashuses:
-            entry = self.cash_uses.filter(cash_use=cashuse)
-            if entry:
-                cashuse.entry = entry[0]
-            else:
-                cashuse.entry = None
+            cashuse.entry = snapshot.cash_use_entries.get(cashuse.id, None)
 
         return cashuses
 
 
-    def cash_sources_for_season(self):
+    def cash_sources_for_season(self, snapshot=None):
         """
         Returns a list containing all the configured cash sources for our season, each with an additional 'entry'
         attribute is set to the entry for this report
         """
-        cashsources = self.season.get_cash_sources()
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
+
+        cashsources = snapshot.cash_sources
         for cashsource in cashsources:
-            entry = self.cash_sources.filter(cash_source=cashsource)
-            if entry:
-                cashsource.entry = entry[0]
-            else:
-                cashsource.entry = None
+            cashsource.entry = snapshot.cash_source_entries.get(cashsource.id, None)
 
         return cashsources
 
-    def farmer_payments_for_season(self):
+    def farmer_payments_for_season(self, snapshot=None):
         """
         Returns a list containing all the configured farmer payments for our season, each with an additional 'entry'
         attribute is set to the entry for this report
         """
-        payments = self.season.get_farmer_payments()
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
+
+        payments = snapshot.farmer_payments
         for payment in payments:
-            entry = self.farmer_payments.filter(farmer_payment=payment)
-            if entry:
-                payment.entry = entry[0]
-            else:
-                payment.entry = None
+            payment.entry = snapshot.farmer_payment_entries.get(payment.id, None)
 
         return payments
 
-    def production_for_season_grades(self, kind=None):
+    def production_for_season_grades(self, kind=None, snapshot=None):
         """
         Returns a list of dicts which contain the grade and volume set for all grades configured
         for this report's season
         """
-        season_production = []
-
-        if kind:
-            season_grades = self.season.get_grade_tree(kind=kind)
-        else:
-            season_grades = self.season.get_grade_tree()
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
 
-        for grade in season_grades:
-            grade_production = dict(grade=grade, volume=None)
-            report_production = self.production.filter(grade=grade)
-            if report_production:
-                grade_production['volume'] = report_production[0].volume
+        season_production = []
 
+        for grade in snapshot.get_grade_tree(kind):
+            grade_production = dict(grade=grade, volume=snapshot.production.get(grade.id, None))
             season_production.append(grade_production)
 
         return season_production
@@ -224,12 +314,12 @@ class Report(SmartModel):
 
         return cherry_production - self.cherry_production_by_members
 
-    def calculate_metrics(self):
+    def calculate_metrics(self, snapshot=None):
         """
         Calculates the metrics for this report.  To do this the report must be finalized or raise
         an exception.
         """
-        self.build_report_boxes(self.season.country.currency)
+        self.build_report_boxes(self.season.country.currency, snapshot)
         exchange = self.season.exchange_rate
 
         self.farmer_price = self.farmer_box.farmer_price.as_local(exchange)
@@ -237,7 +327,7 @@ class Report(SmartModel):
         self.production_cost = self.expenses_box.production_cost.as_local(exchange)
         self.cherry_to_green_ratio = self.production_box.cherry_to_green_ratio
 
-    def build_report_boxes(self, currency):
+    def build_report_boxes(self, currency, snapshot=None):
         from reports.pdf.production import ProductionBox
         from reports.pdf.sales import SalesBox
         from reports.pdf.expenses import ExpenseBox
@@ -245,14 +335,19 @@ class Report(SmartModel):
         from reports.pdf.cash import CashBox
         from reports.models import Report
 
-        self.production_box = ProductionBox(self)
-        self.sales_box = SalesBox(self, currency)
-        self.expenses_box = ExpenseBox(self, self.production_box, self.sales_box, currency)
-        self.cash_box = CashBox(self, self.production_box, self.sales_box, self.expenses_box, currency)
-        self.farmer_box = FarmerBox(self, self.production_box, self.sales_box, self.expenses_box, self.cash_box, currency)
+        # all our boxes share the same data
+        if snapshot is None:
+            snapshot = ReportSnapshot(self)
+
+        self.production_box = ProductionBox(self, snapshot)
+        self.sales_box = SalesBox(self, currency, snapshot)
+        self.expenses_box = ExpenseBox(self, self.production_box, self.sales_box, currency, snapshot)
+        self.cash_box = CashBox(self, self.production_box, self.sales_box, self.expenses_box, currency, snapshot)
+        self.farmer_box = FarmerBox(self, self.production_box, self.sales_box, self.expenses_box, self.cash_box, currency, snapshot)
 
     def finalize(self):
         empty_fields = []
+        snapshot = ReportSnapshot(self)
 
         if self.farmers is None:
             empty_fields.append('Number of farmers')
@@ -260,15 +355,15 @@ class Report(SmartModel):
         if self.capacity is None:
             empty_fields.append("Capacity")
 
-        for cashsource in self.cash_sources_for_season():
+        for cashsource in self.cash_sources_for_season(snapshot):
             if cashsource.entry is None and cashsource.calculated_from == 'NONE':
                 empty_fields.append(cashsource.name)
 
-        for cashuse in self.cash_uses_for_season():
+        for cashuse in self.cash_uses_for_season(snapshot):
             if cashuse.entry is None and cashuse.calculated_from == 'NONE':
                 empty_fields.append(cashuse.name)
 
-        for payment in self.farmer_payments_for_season():
+        for payment in self.farmer_payments_for_season(snapshot):
             missing = True
             entry = payment.entry
 
@@ -285,16 +380,16 @@ class Report(SmartModel):
             if missing:
                 empty_fields.append(payment.name)
 
-        for entry in self.entries_for_season_expenses():
+        for entry in self.entries_for_season_expenses(snapshot):
             expense = entry['expense']
             if not expense.is_parent and expense.calculated_from == 'NONE' and entry['value'] is None:
                 empty_fields.append(entry['expense'].name)
 
-        for entry in self.production_for_season_grades():
+        for entry in self.production_for_season_grades(snapshot=snapshot):
             if not entry['grade'].is_parent and entry['volume'] is None:
                 empty_fields.append(entry['grade'].name)
 
-        if len(self.sales.all()) < 1:
+        if len(snapshot.sales) < 1:
             empty_fields.append("Add at least one sale")
 
         # more than one missing value, raise an exception
@@ -303,7 +398,7 @@ class Report(SmartModel):
 
         # ok, all good, mark ourselves as finalized and calculate our metrics
         self.is_finalized = True
-        self.calculate_metrics()
+        self.calculate_metrics(snapshot)
 
     def __unicode__(self):
         return "%s %s" % (self.wetmill.name, self.season.name)
@@ -426,4 +521,54 @@ class SaleComponent(SmartModel):
     class Meta:
         ordering = ('grade__name',)
 
+class ReportExportStorage(FileSystemStorage):
+    """
+    Stores report exports in REPORT_EXPORT_DIR.  That is outside MEDIA_ROOT on purpose, exports are
+    only ever handed out through ReportExportCRUDL.Download, which checks permissions.
+    """
+    def path(self, name):
+        return safe_join(os.path.abspath(settings.REPORT_EXPORT_DIR), name)
 
+class ReportExport(SmartModel):
+    REPORT_MODE_CHOICES = (('TR', _("Transparency Sheet")),
+                           ('CR', _("Credit Report")))
+
+    season = models.ForeignKey(Season, verbose_name=_("Season"),
+                               help_text=_("The season whose finalized reports will be exported"))
+    currency = models.ForeignKey(Currency, verbose_name=_("Currency"),
+                                 help_text=_("The currency the reports will be rendered in"))
+    weight = models.ForeignKey(Weight, verbose_name=_("Weight"),
+                               help_text=_("The weight the reports will be rendered in"))
+    language = models.CharField(max_length=8, choices=settings.LANGUAGES, default='en_us', verbose_name=_("Language"),
+                                help_text=_("The language the reports will be rendered in"))
+    report_mode = models.CharField(max_length=2, choices=REPORT_MODE_CHOICES, default='TR', verbose_name=_("Report Type"),
+                                   help_text=_("The type of report to render"))
+    export_file = models.FileField(upload_to="report_exports", storage=ReportExportStorage(), null=True, blank=True, verbose_name=_("Export File"),
+                                   help_text=_("The zip file containing the PDF for each report"))
+    task_log = models.TextField(verbose_name=_("Task Log"), help_text=_("Any logging collected while exporting these reports"))
+    task_id = models.CharField(null=True, max_length=64, verbose_name=_("Task Id"))
+
+    def __unicode__(self):
+        return "Report Export for %s %s" % (self.season.country.name, self.season.name)
+
+    def start(self): # pragma: no cover
+        result = export_reports.delay(self)
+        self.task_id = result.task_id
+        self.task_log = "Queuing reports for export.\n"
+        self.save()
+
+    def get_status(self):
+        status = 'PENDING'
+        if self.task_id: # pragma: no cover
+            result = export_reports.AsyncResult(self.task_id)
+            status = result.state
+
+        return status
+
+    def log(self, message):
+        self.task_log += "%s\n" % message
+        self.modified_on = datetime.now()
+        self.save()
+
+    class Meta:
+        ordering = ('-modified_on',)
@@ -0,0 +1,123 @@
+import os
+import tempfile
+from hashlib import sha1
+from django.conf import settings
+from django.db.models import Max, Count
+
+def get_report_version(report, include_previous=False):
+    """
+    Returns a hash of everything that goes into the PDF for the passed in report: the report itself,
+    all its entries and their exchange rates, its wetmill, its season, the last time the season was
+    finalized and the last edit to any of the expenses, grades, currencies and the like named in it.
+    Any change to those gives us a new version.
+
+    Credit reports also include the two previous seasons, pass include_previous to take those into account.
+    """
+    from aggregates.models import FinalizeTask
+    from reports.models import Report, SaleComponent
+    from expenses.models import Expense
+    from grades.models import Grade
+    from cashuses.models import CashUse
+    from cashsources.models import CashSource
+    from farmerpayments.models import FarmerPayment
+    from locales.models import Currency, Weight
+
+    season = report.season
+    parts = [report.pk, report.modified_on, report.wetmill.modified_on, season.pk, season.modified_on, season.exchange_rate]
+
+    # our entries, deleted entries change our count, new or edited ones our last modified
+    for entries in (report.expenses.all(), report.production.all(), report.cash_uses.all(), report.cash_sources.all(),
+                    report.farmer_payments.all(), report.sales.all(), SaleComponent.objects.filter(sale__report=report)):
+        stamp = entries.order_by().aggregate(Max('modified_on'), Count('id'))
+        parts += [stamp['modified_on__max'], stamp['id__count']]
+
+    # the exchange rates our expenses and sales were entered with
+    for entries in (report.expenses.all(), report.sales.all()):
+        parts.append(",".join([unicode(rate) for rate in entries.order_by('pk').values_list('exchange_rate', flat=True)]))
+
+    # the names, ordering and formatting of everything shown in the report
+    for model in (Expense, Grade, CashUse, CashSource, FarmerPayment, Currency, Weight):
+        parts.append(model.objects.aggregate(Max('modified_on'))['modified_on__max'])
+
+    # our aggregates are rebuilt each time the season is finalized
+    parts.append(FinalizeTask.objects.filter(season=season).aggregate(Max('modified_on'))['modified_on__max'])
+
+    if include_previous:
+        for previous in season.get_previous_two_seasons() or []:
+            previous_report = Report.load_for_wetmill_season(report.wetmill, previous)
+            if previous_report:
+                parts.append(get_report_version(previous_report))
+
+    return sha1("|".join([unicode(part) for part in parts]).encode('utf-8')).hexdigest()
+
+class PDFCache(object):
+    """
+    An on disk cache of rendered report PDFs.  Files are stored by report, named by the version of
+    the report and a hash of the options they were rendered with, so a changed report simply
+    stops matching its old files.  Those are cleaned up the next time a PDF for the report is saved.
+    """
+    def __init__(self, directory=None):
+        self.directory = directory
+
+    def get_directory(self):
+        return self.directory if self.directory else settings.REPORT_PDF_CACHE_DIR
+
+    def get_key(self, report, **options):
+        """
+        Returns the key for the PDF of the passed in report rendered with the passed in options.  This
+        is also the ETag we serve the PDF with.
+        """
+        version = get_report_version(report, include_previous=options.get('report_mode', None) == 'CR')
+        options = sha1("|".join(["%s=%s" % (name, options[name]) for name in sorted(options.keys())])).hexdigest()
+        return "%s-%s" % (version[:20], options[:20])
+
+    def get_path(self, report, key):
+        return os.path.join(self.get_directory(), str(report.pk), "%s.pdf" % key)
+
+    def get(self, report, key):
+        """
+        Returns the path to the cached PDF for the passed in report and key, None if we don't have one
+        """
+        path = self.get_path(report, key)
+        if os.path.exists(path):
+            return path
+        else:
+            return None
+
+    def put(self, report, key, render):
+        """
+        Calls render with a file to write the PDF for the passed in report and key to, returning the
+        path it ends up at.  The file is only moved into place once it is complete, so readers never
+        see a partial PDF.
+        """
+        path = self.get_path(report, key)
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            try:
+                os.makedirs(directory)
+            except OSError: # pragma: no cover
+                # someone else beat us to it
+                pass
+
+        (fd, temp_path) = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as output:
+                render(output)
+
+            os.rename(temp_path, path)
+        except:
+            os.remove(temp_path)
+            raise
+
+        # remove any PDFs for older versions of this report
+        version = key.split('-')[0]
+        for filename in os.listdir(directory):
+            if filename.endswith('.pdf') and not filename.startswith(version):
+                try:
+                    os.remove(os.path.join(directory, filename))
+                except OSError: # pragma: no cover
+                    pass
+
+        return path
+
+pdf_cache = PDFCache()
@@ -1,5 +1,6 @@
 from decimal import Decimal
 from reports.pdf.currencyvalue import CurrencyValue as CV, CV_ZERO
+from reports.models import ReportSnapshot
 
 class UseRow(object):
 
@@ -23,8 +24,9 @@ class SourceRow(object):
 
 class CashBox(object):
 
-    def __init__(self, report, production, sales, expenses, currency):
+    def __init__(self, report, production, sales, expenses, currency, snapshot=None):
         self.report = report
+        self.snapshot = snapshot if snapshot else ReportSnapshot(report)
         self.production = production
         self.sales = sales
         self.expenses = expenses
@@ -40,7 +42,7 @@ class CashBox(object):
 
     def build_sources(self):
         self.sources = []
-        for source in self.report.cash_sources_for_season():
+        for source in self.report.cash_sources_for_season(self.snapshot):
             total = None
             
             if source.entry:
@@ -50,7 +52,7 @@ class CashBox(object):
 
     def build_uses(self):
         self.uses = []
-        for cashuse in self.report.cash_uses_for_season():
+        for cashuse in self.report.cash_uses_for_season(self.snapshot):
             total = None
 
             if cashuse.entry:
@@ -1,3 +1,4 @@
+import operator
 from decimal import Decimal
 
 ZERO = Decimal("0")
@@ -10,18 +11,23 @@ class CurrencyValue(object):
     final value only calculated at the very last minute.
 
     It also takes care of ignoring values which are None.
+
+    US dollar values are kept as a total per exchange rate, so adding values together never grows
+    them, and values only have the two slots, as report boxes create thousands of these.
     """
+    __slots__ = ('local_value', 'usd')
+
     def __init__(self, value=None, exchange=None):
         """
         Creates a new value.  If an exchange rate is passed in, then the value is assumed to be in 
         US dollars and that exchange will be used when convering to a local currency.
         """
-        self.usd_values = []
+        self.usd = dict()
 
         if isinstance(value, CurrencyValue):
             if exchange is None:
                 self.local_value = value.local_value
-                self.usd_values = value.usd_values
+                self.usd.update(value.usd)
                 return
             else:
                 raise Exception("Invalid arguments to constructor, passing in CurrencyValue and exchange rate")
@@ -34,9 +40,22 @@ class CurrencyValue(object):
         else:
             self.local_value = None
             
-            # so add this value / exchange pair to our list of usd values
+            # so this is our usd value at that exchange
             if not value is None:
-                self.usd_values.append([value, exchange])
+                self.usd[exchange] = value
+
+    def __getstate__(self):
+        return (self.local_value, self.usd)
+
+    def __setstate__(self, state):
+        (self.local_value, self.usd) = state
+
+    @property
+    def usd_values(self):
+        """
+        Our usd values as a list of [value, exchange] pairs, ordered by exchange rate
+        """
+        return [[self.usd[exchange], exchange] for exchange in sorted(self.usd.keys())]
 
     def forex_loss(self, exchange):
         """
@@ -44,14 +63,14 @@ class CurrencyValue(object):
         """
         loss = Decimal("0")
 
-        for usd_value in self.usd_values:
-            loss -= usd_value[0] * (usd_value[1] - exchange)
+        for usd_exchange, usd_value in self.usd.iteritems():
+            loss -= usd_value * (usd_exchange - exchange)
 
         return CurrencyValue(loss)
 
     def as_local(self, exchange):
         # no local or usd values?  then return None
-        if self.local_value is None and not self.usd_values:
+        if self.local_value is None and not self.usd:
             return None
 
         # first add in our local value
@@ -61,8 +80,8 @@ class CurrencyValue(object):
             local = Decimal("0")
 
         # then for each of our usd values, calculate our total
-        for usd_value in self.usd_values:
-            local += usd_value[0] * exchange
+        for usd_value in self.usd.itervalues():
+            local += usd_value * exchange
 
         return local
 
@@ -71,7 +90,7 @@ class CurrencyValue(object):
             raise Exception("Must specify an exchange rate when getting the value as USD")
 
         # no local or usd values?  then return None
-        if self.local_value is None and not self.usd_values:
+        if self.local_value is None and not self.usd:
             return None
 
         # convert any local value to USD using the passed in exchange
@@ -81,51 +100,58 @@ class CurrencyValue(object):
             usd = Decimal("0")
 
         # add up all our local usd values
-        for usd_value in self.usd_values:
-            usd += usd_value[0]
+        for usd_value in self.usd.itervalues():
+            usd += usd_value
 
         return usd
 
-    def negate(self):
-        local_value = None
+    def scaled(self, op, operand):
+        """
+        Returns a new value with op applied to our local value and each of our usd values
+        """
+        scaled = CurrencyValue(self.local_value)
         if self.local_value:
-            local_value = self.local_value * Decimal("-1")
+            scaled.local_value = op(self.local_value, operand)
 
-        negated = CurrencyValue(local_value)
+        for usd_exchange, usd_value in self.usd.iteritems():
+            scaled.usd[usd_exchange] = op(usd_value, operand)
 
-        for usd_value in self.usd_values:
-            negated.usd_values.append([usd_value[0] * Decimal("-1"), usd_value[1]])
+        return scaled
 
-        return negated
-
-    @classmethod
-    def add(cls, left, right):
-        if right is None and not left is None:
-            return left
+    def negate(self):
+        return self.scaled(operator.mul, Decimal("-1"))
 
-        # both are not none at this point
-        local_total = left.local_value
+    def accumulate(self, other):
+        """
+        Adds other to this value in place, returning ourselves.  This saves creating a new value for
+        each step when adding up totals, but should only be used on values you created yourself, as
+        anything else holding on to this value will see the change.
+        """
+        if other is None:
+            return self
 
-        if not right.local_value is None:
-            if local_total is None:
-                local_total = right.local_value
+        if not other.local_value is None:
+            if self.local_value is None:
+                self.local_value = other.local_value
             else:
-                local_total += right.local_value
+                self.local_value += other.local_value
 
-        # our usd values
-        usd_values = []
-        
-        for usd_value in left.usd_values:
-            usd_values.append(usd_value)
+        usd = self.usd
+        for usd_exchange, usd_value in other.usd.iteritems():
+            if usd_exchange in usd:
+                usd[usd_exchange] += usd_value
+            else:
+                usd[usd_exchange] = usd_value
 
-        for usd_value in right.usd_values:
-            usd_values.append(usd_value)
+        return self
 
-        combined = CurrencyValue(local_total)
-        for usd_value in usd_values:
-            combined.usd_values.append(usd_value)
+    @classmethod
+    def add(cls, left, right):
+        if right is None and not left is None:
+            return left
 
-        return combined
+        # both are not none at this point
+        return CurrencyValue(left).accumulate(right)
 
     @classmethod
     def sub(cls, left, right):
@@ -150,15 +176,8 @@ class CurrencyValue(object):
             cv = left
         else:
             raise Exception("Multiplication of CurrencyValue objects is only supposed with Decimal objects") # pragma: no cover
-        
-        combined = CurrencyValue(cv.local_value)
-        if cv.local_value:
-            combined.local_value = cv.local_value * dec
 
-        for usd_value in cv.usd_values:
-            combined.usd_values.append([usd_value[0] * dec, usd_value[1]])
-
-        return combined
+        return cv.scaled(operator.mul, dec)
 
     @classmethod
     def div(cls, left, right):
@@ -173,14 +192,7 @@ class CurrencyValue(object):
         if right == ZERO:
             return CurrencyValue(ZERO)
 
-        combined = CurrencyValue(left.local_value)
-        if left.local_value:
-            combined.local_value = left.local_value / right
-
-        for usd_value in left.usd_values:
-            combined.usd_values.append([usd_value[0] / right, usd_value[1]])
-
-        return combined
+        return left.scaled(operator.div, right)
 
     def __str__(self):
         as_str = "%s - [" % self.local_value
@@ -1,5 +1,6 @@
 from decimal import Decimal, ROUND_HALF_UP
 from reports.pdf.currencyvalue import CurrencyValue as CV, CV_ZERO
+from reports.models import ReportSnapshot
 
 class ExpenseRow(object):
 
@@ -9,11 +10,11 @@ class ExpenseRow(object):
 
         if children:
             self.children = children
-            self.value = CV_ZERO
-            self.advance_value = CV_ZERO
+            self.value = CV(Decimal("0"))
+            self.advance_value = CV(Decimal("0"))
             for child in self.children:
-                self.value += child.value
-                self.advance_value += child.advance_value
+                self.value.accumulate(child.value)
+                self.advance_value.accumulate(child.advance_value)
 
         else:
             self.value = value
@@ -48,8 +49,9 @@ class ExpenseRow(object):
 
 class ExpenseBox(object):
 
-    def __init__(self, report, production_box, sales_box, currency):
+    def __init__(self, report, production_box, sales_box, currency, snapshot=None):
         self.report = report
+        self.snapshot = snapshot if snapshot else ReportSnapshot(report)
         self.production_box = production_box
         self.sales_box = sales_box
         self.currency = currency
@@ -78,8 +80,8 @@ class ExpenseBox(object):
 
         # calculate our overall advance
         for category in self.categories:
-            self.total += category.value
-            self.total_advance += category.advance_value
+            self.total.accumulate(category.value)
+            self.total_advance.accumulate(category.advance_value)
 
         # total forex loss
         self.total_forex_loss = self.total_revenue.forex_loss(self.exchange) - self.total.forex_loss(self.exchange)
@@ -139,7 +141,7 @@ class ExpenseBox(object):
     def build_category_rows(self):
         categories = []
 
-        entries = self.report.entries_for_season_expenses()
+        entries = self.report.entries_for_season_expenses(self.snapshot)
         for (index, entry) in enumerate(entries):
             # if this is a category, build our rollup for it
             if entry['expense'].depth == 0:
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import zipfile
+from django.conf import settings
+from django.utils.translation import activate
+from reports.models import Report
+from .cache import pdf_cache
+from .render import PDFReport
+
+def render_report(report, currency, weight, report_mode, lang, directory):
+    """
+    Renders the PDF for the passed in report, returning the path to it and whether it is a temporary
+    file that should be removed once used.  PDFs for finalized seasons are taken from, and saved to,
+    our PDF cache, so they are shared with the PDFs downloaded from the site.
+    """
+    def render(output):
+        activate(lang)
+        try:
+            pdf_report = PDFReport(report, currency, weight, report_mode=report_mode, show_buyers=False)
+            pdf_report.render(output)
+        finally:
+            # back to english
+            activate('en_us')
+
+    if report.is_finalized and report.season.is_finalized:
+        key = pdf_cache.get_key(report, currency=currency.currency_code, weight=weight.abbreviation,
+                                report_mode=report_mode, show_buyers=False, lang=lang)
+        path = pdf_cache.get(report, key)
+        if not path:
+            path = pdf_cache.put(report, key, render)
+
+        return path, False
+
+    else:
+        (fd, path) = tempfile.mkstemp(suffix='.pdf', dir=directory)
+        with os.fdopen(fd, 'wb') as output:
+            render(output)
+
+        return path, True
+
+def get_export_directory():
+    # this is deliberately outside MEDIA_ROOT, exports are only served by ReportExportCRUDL.Download
+    return settings.REPORT_EXPORT_DIR
+
+def export_season(export, log=None):
+    """
+    Renders the PDFs for all the finalized reports in the season of the passed in export and writes
+    them to a zip file, setting it as the export's file.  Returns the number of reports exported.
+    """
+    if not log:
+        log = lambda message: None
+
+    reports = list(Report.objects.filter(season=export.season, is_finalized=True).select_related('wetmill', 'season')
+                   .order_by('wetmill__name'))
+    log("Rendering PDFs for %d report(s)." % len(reports))
+
+    directory = get_export_directory()
+    if not os.path.exists(directory):
+        try:
+            os.makedirs(directory)
+        except OSError: # pragma: no cover
+            # someone else beat us to it
+            pass
+
+    # our PDFs are named the same as when downloaded from the site, unless two wetmills share a name
+    names = dict()
+    used = set()
+    for report in reports:
+        name = "%s_%s.pdf" % (report.wetmill.name.lower(), export.currency.currency_code.lower())
+        if name in used:
+            name = "%s_%d_%s.pdf" % (report.wetmill.name.lower(), report.wetmill.pk, export.currency.currency_code.lower())
+        names[report.pk] = name
+        used.add(name)
+
+    (fd, temp_path) = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    os.close(fd)
+
+    try:
+        # PDFs are already compressed, no use deflating them again
+        archive = zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_STORED, allowZip64=True)
+
+        for index, report in enumerate(reports):
+            (path, temporary) = render_report(report, export.currency, export.weight, export.report_mode,
+                                              export.language, directory)
+            try:
+                archive.write(path, names[report.pk])
+            finally:
+                if temporary:
+                    os.remove(path)
+
+            if (index + 1) % 25 == 0:
+                log("Rendered %d of %d report(s)." % (index + 1, len(reports)))
+
+        archive.close()
+
+        filename = "%s_%s_%d.zip" % (export.season.country.name.lower(), export.season.name.lower(), export.pk)
+        os.rename(temp_path, os.path.join(directory, filename))
+
+    except:
+        os.remove(temp_path)
+        raise
+
+    export.export_file.name = filename
+    export.save()
+
+    log("Rendered %d of %d report(s)." % (len(reports), len(reports)))
+    return len(reports)
@@ -1,6 +1,7 @@
 from decimal import Decimal
 from django.utils.translation import ugettext as _
 from reports.pdf.currencyvalue import CurrencyValue as CV, CV_ZERO
+from reports.models import ReportSnapshot
 
 class FarmerRow(object):
 
@@ -16,8 +17,9 @@ class FarmerRow(object):
 
 class FarmerBox(object):
 
-    def __init__(self, report, production, sales, expenses, cash, currency):
+    def __init__(self, report, production, sales, expenses, cash, currency, snapshot=None):
         self.report = report
+        self.snapshot = snapshot if snapshot else ReportSnapshot(report)
         self.production = production
         self.sales = sales
         self.expenses = expenses
@@ -104,7 +106,7 @@ class FarmerBox(object):
         # build our advance payment
         self.rows.append(FarmerRow(_("Advance Payment"), 'advance_payment', 'ALL', self.expenses.total_advance))
 
-        for payment in self.report.farmer_payments_for_season():
+        for payment in self.report.farmer_payments_for_season(self.snapshot):
             total = None
             entry = payment.entry
             row_for = None
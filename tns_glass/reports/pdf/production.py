@@ -1,4 +1,5 @@
 from decimal import Decimal, ROUND_HALF_UP
+from reports.models import ReportSnapshot
 
 class ProductionRow(object):
 
@@ -22,8 +23,9 @@ class ProductionRow(object):
 
 class ProductionBox(object):
 
-    def __init__(self, report):
+    def __init__(self, report, snapshot=None):
         self.report = report
+        self.snapshot = snapshot if snapshot else ReportSnapshot(report)
         self.categories = self.build_category_rows()
         self.build_ratios()
 
@@ -39,7 +41,7 @@ class ProductionBox(object):
     def calculate_top_grade_stats(self):
         # first, do we have a top grade?
         self.has_top_grade = False
-        for grade in self.report.season.get_grade_tree():
+        for grade in self.snapshot.grade_tree:
             if grade.is_top_grade:
                 self.has_top_grade = True
                 break
@@ -72,11 +74,7 @@ class ProductionBox(object):
         return self.categories
     
     def get_grade_volume(self, grade):
-        output = self.report.production.filter(grade=grade)
-        if output:
-            return output[0].volume
-        else:
-            return Decimal("0")
+        return self.snapshot.production.get(grade.id, Decimal("0"))
 
     def calculate_ratio(self, numerator, denominator):
         if denominator > Decimal("0"):
@@ -153,7 +151,7 @@ class ProductionBox(object):
         rows = []
 
         # get our tree of grades for this season
-        grade_tree = self.report.season.get_grade_tree()
+        grade_tree = self.snapshot.grade_tree
 
         # for each top level grade, build a row
         for (index, grade) in enumerate(grade_tree):
@@ -11,10 +11,10 @@ from datetime import datetime
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase.pdfmetrics import stringWidth, getAscent, getDescent
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 from canvas.page import PDFPage
-from reports.models import Report
+from reports.models import Report, ReportSnapshot
 
 from decimal import Decimal, ROUND_HALF_UP
 import os
@@ -23,8 +23,78 @@ from django.conf import settings
 from django.utils.translation import ugettext as _
 from django.utils.translation import activate
 
+def with_width(cols, width):
+    """
+    Returns a copy of the passed in column specs with the width of the first column set to width
+    """
+    return ((width,) + tuple(cols[0][1:]),) + tuple(cols[1:])
+
+class ReportLayout(object):
+    """
+    The calculated widths of the boxes and columns of a PDFReport.  These only depend on the
+    constants of the report class, so they are calculated once and shared by every report.  Layouts
+    can't be modified, so any number of reports can be rendered at once.
+    """
+    __slots__ = ('HISTORICAL_SECTION_BOX_WIDTH', 'HISTORICAL_SECTION_BOX_HEADER_COLS', 'HISTORICAL_SECTION_BOX_COLS',
+                 'HISTORICAL_SECTION_BOX_COLS_HDR', 'HISTORICAL_SECTION_BOX_COLS_CUR',
+                 'SALES_BOX_WIDTH', 'SALES_BOX_HEADER_COLS', 'SALES_BOX_COLS', 'SALES_BOX_TOTAL_COLS',
+                 'LOCAL_SALES_BOX_HEADER_COLS', 'LOCAL_SALES_BOX_COLS', 'LOCAL_SALES_BOX_TOTAL_COLS',
+                 'WORKING_CAPITAL_WIDTH', 'WORKING_CAPITAL_COLS',
+                 'EXPENSE_BOX_WIDTH', 'EXPENSE_BOX_COLS', 'EXPENSE_HEADER1_COLS', 'EXPENSE_HEADER2_COLS',
+                 'EXPENSE_TOTAL_COLS', 'EXPENSE_CATEGORY_COLS', 'EXPENSE_CATEGORY_TOTAL_COLS', 'EXPENSE_ROW_COLS',
+                 'CASH_COLS', 'FARMER_COLS', 'FARMER_TOTAL_COLS', 'FARMER_SUMMARY_COLS')
+
+    def __init__(self, report_class):
+        r = report_class
+        set = lambda name, value: object.__setattr__(self, name, value)
+
+        set('HISTORICAL_SECTION_BOX_WIDTH', r.WIDTH - r.PAGE_MARGIN * 2 - r.SECTION_MARGIN)
+        historical_width = self.HISTORICAL_SECTION_BOX_WIDTH - 3 * r.HISTORICAL_SECTION_BOX_HEADER_COLS[2][0] - r.HISTORICAL_SECTION_BOX_HEADER_COLS[1][0]
+        set('HISTORICAL_SECTION_BOX_HEADER_COLS', with_width(r.HISTORICAL_SECTION_BOX_HEADER_COLS, historical_width))
+        set('HISTORICAL_SECTION_BOX_COLS', with_width(r.HISTORICAL_SECTION_BOX_COLS, historical_width))
+        set('HISTORICAL_SECTION_BOX_COLS_HDR', with_width(r.HISTORICAL_SECTION_BOX_COLS_HDR, historical_width))
+        set('HISTORICAL_SECTION_BOX_COLS_CUR', with_width(r.HISTORICAL_SECTION_BOX_COLS_CUR, historical_width))
+
+        set('SALES_BOX_WIDTH', r.WIDTH - r.PAGE_MARGIN * 2 - r.PROD_BOX_WIDTH - r.SECTION_MARGIN)
+        sales_width = self.SALES_BOX_WIDTH - 3 * r.SALES_BOX_HEADER_COLS[2][0] - r.SALES_BOX_HEADER_COLS[1][0]
+        set('SALES_BOX_HEADER_COLS', with_width(r.SALES_BOX_HEADER_COLS, sales_width))
+        set('SALES_BOX_COLS', with_width(r.SALES_BOX_COLS, sales_width))
+        set('SALES_BOX_TOTAL_COLS', with_width(r.SALES_BOX_TOTAL_COLS, sales_width))
+
+        local_sales_width = self.SALES_BOX_WIDTH - 2 * r.LOCAL_SALES_BOX_HEADER_COLS[2][0] - r.SALES_BOX_HEADER_COLS[1][0]
+        set('LOCAL_SALES_BOX_HEADER_COLS', with_width(r.LOCAL_SALES_BOX_HEADER_COLS, local_sales_width))
+        set('LOCAL_SALES_BOX_COLS', with_width(r.LOCAL_SALES_BOX_COLS, local_sales_width))
+        set('LOCAL_SALES_BOX_TOTAL_COLS', with_width(r.LOCAL_SALES_BOX_TOTAL_COLS, local_sales_width))
+
+        set('WORKING_CAPITAL_WIDTH', self.SALES_BOX_WIDTH)
+        set('WORKING_CAPITAL_COLS', with_width(r.WORKING_CAPITAL_COLS, self.WORKING_CAPITAL_WIDTH - r.WORKING_CAPITAL_COLS[1][0]))
+
+        set('EXPENSE_BOX_WIDTH', r.WIDTH - 2 * r.PAGE_MARGIN)
+        expense_width = self.EXPENSE_BOX_WIDTH - 3 * r.EXPENSE_BOX_COLS[2][0] - r.EXPENSE_BOX_COLS[1][0]
+        set('EXPENSE_BOX_COLS', with_width(r.EXPENSE_BOX_COLS, expense_width))
+        set('EXPENSE_HEADER1_COLS', with_width(r.EXPENSE_HEADER1_COLS, expense_width))
+        set('EXPENSE_HEADER2_COLS', with_width(r.EXPENSE_HEADER2_COLS, expense_width))
+
+        set('EXPENSE_TOTAL_COLS', with_width(r.EXPENSE_TOTAL_COLS, expense_width))
+        set('EXPENSE_CATEGORY_COLS', with_width(r.EXPENSE_CATEGORY_COLS, expense_width - r.EXPENSE_CATEGORY_MARGIN))
+        set('EXPENSE_CATEGORY_TOTAL_COLS', with_width(r.EXPENSE_CATEGORY_TOTAL_COLS, expense_width - r.EXPENSE_ROW_MARGIN))
+        set('EXPENSE_ROW_COLS', with_width(r.EXPENSE_ROW_COLS, expense_width - r.EXPENSE_ROW_MARGIN))
+
+        set('CASH_COLS', with_width(r.CASH_COLS, expense_width - r.EXPENSE_CATEGORY_MARGIN))
+
+        set('FARMER_COLS', with_width(r.FARMER_COLS, expense_width))
+        set('FARMER_TOTAL_COLS', with_width(r.FARMER_TOTAL_COLS, expense_width))
+
+        set('FARMER_SUMMARY_COLS', with_width(r.FARMER_SUMMARY_COLS, r.WIDTH - 2 * r.PAGE_MARGIN))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Report layouts can't be modified")
+
 class PDFReport(PDFPage):
 
+    # calculated layouts by report class
+    _layouts = dict()
+
     PROD_BOX_WIDTH = 150
     PROD_BOX_HEADER_COLS = ((80, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                             (40, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
@@ -45,13 +115,13 @@ class PDFReport(PDFPage):
 
     SALES_BOX_WIDTH = 0
 
-    SALES_BOX_HEADER_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    SALES_BOX_HEADER_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                              (30, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                              (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                              (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                              (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT))
 
-    SALES_BOX_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    SALES_BOX_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                       (30, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.WEIGHT),
                       (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
                       (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
@@ -59,52 +129,52 @@ class PDFReport(PDFPage):
 
     SALES_BOX_FOT_COLS = ((200, PDFPage.BOX_ITALIC, PDFPage.LEFT),)
 
-    SALES_BOX_TOTAL_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    SALES_BOX_TOTAL_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                             (30, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.WEIGHT),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN))
 
-    LOCAL_SALES_BOX_HEADER_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    LOCAL_SALES_BOX_HEADER_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                                    (30, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                                    (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                                    (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT))
 
-    LOCAL_SALES_BOX_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    LOCAL_SALES_BOX_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                             (30, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.WEIGHT),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN, PDFPage.PER_WEIGHT_KILO))
 
-    LOCAL_SALES_BOX_TOTAL_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    LOCAL_SALES_BOX_TOTAL_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                                   (30, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.WEIGHT),
                                   (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_KILO),
                                   (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN, PDFPage.PER_WEIGHT_KILO))
 
     WORKING_CAPITAL_WIDTH = 0
 
-    WORKING_CAPITAL_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    WORKING_CAPITAL_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                             (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN))
 
     EXPENSE_BOX_WIDTH = 0
 
-    EXPENSE_BOX_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    EXPENSE_BOX_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                         (50, PDFPage.BOX_FONT, PDFPage.RIGHT),
                         (90, PDFPage.BOX_FONT, PDFPage.RIGHT),
                         (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
                         (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_BEST))
 
-    EXPENSE_HEADER1_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    EXPENSE_HEADER1_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                             (140, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER),
                             (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                             (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT))
 
-    EXPENSE_HEADER2_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    EXPENSE_HEADER2_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                             (50, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                             (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                             (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT),
                             (90, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT))
 
-    EXPENSE_TOTAL_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    EXPENSE_TOTAL_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                           (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                           (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_UNIT_GREEN),
                           (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
@@ -112,13 +182,13 @@ class PDFReport(PDFPage):
 
     EXPENSE_CATEGORY_MARGIN = 10
 
-    EXPENSE_CATEGORY_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    EXPENSE_CATEGORY_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                              (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                              (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_UNIT_GREEN),
                              (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
                              (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_BEST))
 
-    EXPENSE_CATEGORY_TOTAL_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT],
+    EXPENSE_CATEGORY_TOTAL_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT),
                                    (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                                    (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_UNIT_GREEN),
                                    (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
@@ -126,7 +196,7 @@ class PDFReport(PDFPage):
 
     EXPENSE_ROW_MARGIN = 20
 
-    EXPENSE_ROW_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    EXPENSE_ROW_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                         (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                         (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_UNIT_GREEN),
                         (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
@@ -134,25 +204,25 @@ class PDFReport(PDFPage):
 
     EXPENSE_FOT_COLS = ((300, PDFPage.BOX_ITALIC, PDFPage.LEFT),)
 
-    FARMER_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT, PDFPage.RAW, PDFPage.RAW],
+    FARMER_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT, PDFPage.RAW, PDFPage.RAW),
                    (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.LOCAL, PDFPage.PER_WEIGHT_UNIT_CHERRY),
                    (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_GREEN_RATIO),
                    (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
                    (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_BEST))
 
-    FARMER_TOTAL_COLS = ([60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW, PDFPage.RAW],
+    FARMER_TOTAL_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW, PDFPage.RAW),
                          (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.LOCAL, PDFPage.PER_WEIGHT_UNIT_CHERRY),
                          (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_GREEN_RATIO),
                          (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
                          (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_BEST))
 
-    CASH_COLS = ([60, PDFPage.BOX_FONT, PDFPage.LEFT],
+    CASH_COLS = ((60, PDFPage.BOX_FONT, PDFPage.LEFT),
                  (50, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                  (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR, PDFPage.PER_WEIGHT_UNIT_CHERRY),
                  (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_AVERAGE),
                  (90, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_CONVERT, PDFPage.AGGREGATE_BEST))
 
-    FARMER_SUMMARY_COLS = ([100, PDFPage.BOX_FONT, PDFPage.CENTER],)
+    FARMER_SUMMARY_COLS = ((100, PDFPage.BOX_FONT, PDFPage.CENTER),)
 
     GAUGE_MARGIN = 5
     GAUGE_DIAL = os.path.join(settings.RESOURCES_DIR, 'gauge_dial.png')
@@ -161,26 +231,26 @@ class PDFReport(PDFPage):
 
     FARMER_PAYMENT_BOX_WIDTH = 290
     FARMER_PAYMENT_BOX_HEADER_COLS = ((60, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER, PDFPage.CURR_EVEN),
-                                      [170, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER],
+                                      (170, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER),
                                       (60, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER, PDFPage.CURR_EVEN))
 
     HISTORICAL_SECTION_BOX_WIDTH = 0
-    HISTORICAL_SECTION_BOX_HEADER_COLS = ([140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW],
+    HISTORICAL_SECTION_BOX_HEADER_COLS = ((140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT_BOLD, PDFPage.CENTER, PDFPage.RAW))
 
-    HISTORICAL_SECTION_BOX_COLS = ([140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW],
+    HISTORICAL_SECTION_BOX_COLS = ((140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.RAW),
                                           (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.RAW))
 
-    HISTORICAL_SECTION_BOX_COLS_CUR = ([140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW],
+    HISTORICAL_SECTION_BOX_COLS_CUR = ((140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW),
                                        (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                                        (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN),
                                        (80, PDFPage.BOX_FONT, PDFPage.RIGHT, PDFPage.CURR_EVEN))
 
-    HISTORICAL_SECTION_BOX_COLS_HDR = ([140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW],
+    HISTORICAL_SECTION_BOX_COLS_HDR = ((140, PDFPage.BOX_FONT_BOLD, PDFPage.LEFT, PDFPage.RAW),
                                        (80, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT, PDFPage.RAW),
                                        (80, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT, PDFPage.RAW),
                                        (80, PDFPage.BOX_FONT_BOLD, PDFPage.RIGHT, PDFPage.RAW))
@@ -224,11 +294,12 @@ class PDFReport(PDFPage):
         self.kilos = Weight.objects.get(abbreviation__iexact="Kg")
         self.weight_ratio = weight.ratio_to_kilogram
 
-        self.production = ProductionBox(self.report)
-        self.sales = SalesBox(self.report, self.report_currency)
-        self.expenses = ExpenseBox(self.report, self.production, self.sales, self.report_currency)
-        self.cash = CashBox(self.report, self.production, self.sales, self.expenses, self.report_currency)
-        self.farmer = FarmerBox(self.report, self.production, self.sales, self.expenses, self.cash, self.report_currency)
+        snapshot = ReportSnapshot(self.report)
+        self.production = ProductionBox(self.report, snapshot)
+        self.sales = SalesBox(self.report, self.report_currency, snapshot)
+        self.expenses = ExpenseBox(self.report, self.production, self.sales, self.report_currency, snapshot)
+        self.cash = CashBox(self.report, self.production, self.sales, self.expenses, self.report_currency, snapshot)
+        self.farmer = FarmerBox(self.report, self.production, self.sales, self.expenses, self.cash, self.report_currency, snapshot)
 
         # get the aggregates for this season
         from aggregates.models import SeasonAggregate
@@ -243,51 +314,27 @@ class PDFReport(PDFPage):
         self.calculate_metrics()
         
     def calculate_metrics(self):
-        self.HEADER_ASCENT = getAscent(self.HEADER_FONT, self.HEADER_SIZE)
-        self.HEADER_DESCENT = -getDescent(self.HEADER_FONT, self.HEADER_SIZE)
-        self.HEADER_HEIGHT = self.HEADER_ASCENT + self.HEADER_DESCENT + self.HEADER_PADDING * 2
-
-        self.BOX_ASCENT = getAscent(self.BOX_FONT, self.BOX_SIZE)
-        self.BOX_DESCENT = -getDescent(self.BOX_FONT, self.BOX_SIZE)
-        self.BOX_HEIGHT = self.BOX_ASCENT + self.BOX_DESCENT + self.BOX_PADDING * 2
+        self.calculate_font_metrics()
 
         self.NO_DIGITS = Decimal("1")
         self.TWO_DIGITS = Decimal(".01")
 
-        self.HISTORICAL_SECTION_BOX_WIDTH = self.WIDTH - self.PAGE_MARGIN * 2 - self.SECTION_MARGIN
-        self.HISTORICAL_SECTION_BOX_HEADER_COLS[0][0] = self.HISTORICAL_SECTION_BOX_WIDTH - 3 * self.HISTORICAL_SECTION_BOX_HEADER_COLS[2][0] - self.HISTORICAL_SECTION_BOX_HEADER_COLS[1][0]
-        self.HISTORICAL_SECTION_BOX_COLS[0][0] = self.HISTORICAL_SECTION_BOX_HEADER_COLS[0][0]
-        self.HISTORICAL_SECTION_BOX_COLS_HDR[0][0] = self.HISTORICAL_SECTION_BOX_COLS[0][0]
-        self.HISTORICAL_SECTION_BOX_COLS_CUR[0][0] = self.HISTORICAL_SECTION_BOX_COLS[0][0]
-
-        self.SALES_BOX_WIDTH = self.WIDTH - self.PAGE_MARGIN * 2 - self.PROD_BOX_WIDTH - self.SECTION_MARGIN
-        self.SALES_BOX_HEADER_COLS[0][0]= self.SALES_BOX_WIDTH - 3 * self.SALES_BOX_HEADER_COLS[2][0] - self.SALES_BOX_HEADER_COLS[1][0]
-        self.SALES_BOX_COLS[0][0]= self.SALES_BOX_HEADER_COLS[0][0]
-        self.SALES_BOX_TOTAL_COLS[0][0]= self.SALES_BOX_HEADER_COLS[0][0]
-
-        self.LOCAL_SALES_BOX_HEADER_COLS[0][0] = self.SALES_BOX_WIDTH - 2 * self.LOCAL_SALES_BOX_HEADER_COLS[2][0]- self.SALES_BOX_HEADER_COLS[1][0]
-        self.LOCAL_SALES_BOX_COLS[0][0]= self.LOCAL_SALES_BOX_HEADER_COLS[0][0]
-        self.LOCAL_SALES_BOX_TOTAL_COLS[0][0]= self.LOCAL_SALES_BOX_HEADER_COLS[0][0]
-
-        self.WORKING_CAPITAL_WIDTH = self.SALES_BOX_WIDTH
-        self.WORKING_CAPITAL_COLS[0][0] = self.WORKING_CAPITAL_WIDTH - self.WORKING_CAPITAL_COLS[1][0]
+        # our column widths are shared by all reports, set them on ourselves
+        layout = self.get_layout()
+        for name in layout.__slots__:
+            setattr(self, name, getattr(layout, name))
 
-        self.EXPENSE_BOX_WIDTH = self.WIDTH - 2 * self.PAGE_MARGIN
-        self.EXPENSE_BOX_COLS[0][0] = self.EXPENSE_BOX_WIDTH - 3 * self.EXPENSE_BOX_COLS[2][0] - self.EXPENSE_BOX_COLS[1][0]
-        self.EXPENSE_HEADER1_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0]
-        self.EXPENSE_HEADER2_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0]
-
-        self.EXPENSE_TOTAL_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0]
-        self.EXPENSE_CATEGORY_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0] - self.EXPENSE_CATEGORY_MARGIN
-        self.EXPENSE_CATEGORY_TOTAL_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0] - self.EXPENSE_ROW_MARGIN
-        self.EXPENSE_ROW_COLS[0][0] = self.EXPENSE_BOX_COLS[0][0] - self.EXPENSE_ROW_MARGIN
-
-        self.CASH_COLS[0][0] = self.EXPENSE_CATEGORY_COLS[0][0]
-
-        self.FARMER_COLS[0][0] = self.EXPENSE_TOTAL_COLS[0][0]
-        self.FARMER_TOTAL_COLS[0][0] = self.EXPENSE_TOTAL_COLS[0][0]
+    @classmethod
+    def get_layout(cls):
+        """
+        Returns the layout for this class of report, calculating it the first time it is asked for
+        """
+        layout = cls._layouts.get(cls, None)
+        if layout is None:
+            layout = ReportLayout(cls)
+            cls._layouts[cls] = layout
 
-        self.FARMER_SUMMARY_COLS[0][0] = self.WIDTH - 2 * self.PAGE_MARGIN
+        return layout
 
     def decimal_to_string(self, n, force_even=False):
         """Converts a number to a nicely formatted string.
@@ -700,9 +747,10 @@ class PDFReport(PDFPage):
                 self.report.working_capital_one_season_ago = CV(one_season_ago_report.working_capital)
                 self.report.working_capital_repaid_pct_one_season_ago = self.decimal_to_string(one_season_ago_report.working_capital_repaid/one_season_ago_report.working_capital*100, True) + '%'
 
-                one_season_ago_production = ProductionBox(one_season_ago_report)
-                one_season_ago_sales = SalesBox(one_season_ago_report, self.report_currency)
-                one_season_ago_expenses = ExpenseBox(one_season_ago_report, one_season_ago_production, one_season_ago_sales, self.report_currency)
+                one_season_ago_snapshot = ReportSnapshot(one_season_ago_report)
+                one_season_ago_production = ProductionBox(one_season_ago_report, one_season_ago_snapshot)
+                one_season_ago_sales = SalesBox(one_season_ago_report, self.report_currency, one_season_ago_snapshot)
+                one_season_ago_expenses = ExpenseBox(one_season_ago_report, one_season_ago_production, one_season_ago_sales, self.report_currency, one_season_ago_snapshot)
                 
                 one_season_ago_local_rows = one_season_ago_sales.get_local_rows()
                 one_season_ago_export_rows = one_season_ago_sales.get_export_rows()
@@ -721,9 +769,10 @@ class PDFReport(PDFPage):
                 self.report.working_capital_two_seasons_ago = CV(two_seasons_ago_report.working_capital)
                 self.report.working_capital_repaid_pct_two_seasons_ago = self.decimal_to_string(two_seasons_ago_report.working_capital_repaid/two_seasons_ago_report.working_capital*100, True) + '%'
 
-                two_seasons_ago_production = ProductionBox(two_seasons_ago_report)
-                two_seasons_ago_sales = SalesBox(two_seasons_ago_report, self.report_currency)
-                two_seasons_ago_expenses = ExpenseBox(two_seasons_ago_report, two_seasons_ago_production, two_seasons_ago_sales, self.report_currency)
+                two_seasons_ago_snapshot = ReportSnapshot(two_seasons_ago_report)
+                two_seasons_ago_production = ProductionBox(two_seasons_ago_report, two_seasons_ago_snapshot)
+                two_seasons_ago_sales = SalesBox(two_seasons_ago_report, self.report_currency, two_seasons_ago_snapshot)
+                two_seasons_ago_expenses = ExpenseBox(two_seasons_ago_report, two_seasons_ago_production, two_seasons_ago_sales, self.report_currency, two_seasons_ago_snapshot)
 
                 two_seasons_ago_local_rows = two_seasons_ago_sales.get_local_rows()
                 two_seasons_ago_export_rows = two_seasons_ago_sales.get_export_rows()
@@ -838,7 +887,7 @@ class PDFReport(PDFPage):
         # draw the gauge background image according to the canvas size
         c.saveState()
         c.scale(1.0,-1.0)
-        c.drawImage(self.GAUGE_BG, 0, -BG_HEIGHT, mask='auto')
+        c.drawImage(self.get_image(self.GAUGE_BG), 0, -BG_HEIGHT, mask='auto')
         c.restoreState()
 
         # anything drawn below will be postioned at the bottom center
@@ -859,12 +908,12 @@ class PDFReport(PDFPage):
             c.rotate(float(degree))
             c.saveState()
             c.scale(1.0,-1.0)
-            c.drawImage(self.GAUGE_DIAL, -dial_mid_width,0, mask='auto')
+            c.drawImage(self.get_image(self.GAUGE_DIAL), -dial_mid_width,0, mask='auto')
             c.restoreState()
 
             c.saveState()
             c.scale(1.0,-1.0)
-            c.drawImage(self.GAUGE_DIAL_CAP, -dial_cap_mid_width,-dial_cap_mid_height, mask='auto')
+            c.drawImage(self.get_image(self.GAUGE_DIAL_CAP), -dial_cap_mid_width,-dial_cap_mid_height, mask='auto')
             c.restoreState()
     
         # restore the current positioning
@@ -872,7 +921,7 @@ class PDFReport(PDFPage):
 
         min_max_offset = width/10
 
-        gauge_height = scale*BG_HEIGHT - 2 * getDescent(self.BOX_FONT_BOLD, primary_font_size)
+        gauge_height = scale*BG_HEIGHT - 2 * self.get_font_descent(self.BOX_FONT_BOLD, primary_font_size)
         self.set_font(c, self.BOX_FONT_BOLD, primary_font_size)
 
         # handle different behavior of the gauge values
@@ -897,14 +946,14 @@ class PDFReport(PDFPage):
                 maximum = self.round_value(maximum)
                 value = self.round_value(value)
             
-        label_y = y + gauge_height + getAscent(self.BOX_FONT_BOLD, primary_font_size)
+        label_y = y + gauge_height + self.get_font_ascent(self.BOX_FONT_BOLD, primary_font_size)
 
         c.drawCentredString(x+min_max_offset, label_y, minimum)
         c.drawCentredString(x+width-min_max_offset, label_y, maximum)
 
-        label_y = y + gauge_height + scale*dial_cap_mid_height - getDescent(self.BOX_FONT_BOLD, secondary_font_size) + getAscent(self.BOX_FONT_BOLD, secondary_font_size)
+        label_y = y + gauge_height + scale*dial_cap_mid_height - self.get_font_descent(self.BOX_FONT_BOLD, secondary_font_size) + self.get_font_ascent(self.BOX_FONT_BOLD, secondary_font_size)
 
-        line_height = getAscent(self.BOX_FONT_BOLD, secondary_font_size) - 2 * getDescent(self.BOX_FONT_BOLD, secondary_font_size)
+        line_height = self.get_font_ascent(self.BOX_FONT_BOLD, secondary_font_size) - 2 * self.get_font_descent(self.BOX_FONT_BOLD, secondary_font_size)
         
         self.set_font(c, self.BOX_FONT_BOLD, secondary_font_size)        
         c.drawCentredString(x+width/2, label_y, subtitle)
@@ -956,7 +1005,7 @@ class PDFReport(PDFPage):
         # draw the country map
         c.saveState()
         c.scale(1.0,-1.0)
-        country_coordinates = c.drawImage(country_map, 0, -BG_HEIGHT, mask='auto')
+        country_coordinates = c.drawImage(self.get_image(country_map), 0, -BG_HEIGHT, mask='auto')
         c.restoreState()
 
         country_width = country_coordinates[0]
@@ -1337,7 +1386,7 @@ class PDFReport(PDFPage):
         c.setFillColorRGB(color_value, color_value,color_value)
         length = 5
         limit = 150
-        y += self.get_ascent() - getDescent(self.BOX_FONT_BOLD, self.BOX_SIZE)
+        y += self.get_ascent() - self.get_font_descent(self.BOX_FONT_BOLD, self.BOX_SIZE)
         c.rect(x, y, length, length, fill=True, stroke=False)
         c.setFillColorRGB(0,0,0)
         y += self.wrap_word(c, x+length+self.PAGE_MARGIN, y, limit, "left", title)
@@ -1349,7 +1398,7 @@ class PDFReport(PDFPage):
         NORMAL_PADDING = 10
         RECT_WIDTH = 30
         
-        text_height = self.get_ascent() - getDescent(self.BOX_FONT_BOLD, 6)
+        text_height = self.get_ascent() - self.get_font_descent(self.BOX_FONT_BOLD, 6)
         minimum_y = y
 
         # print value are adjusted when the value string doesn't fit in the stack
@@ -1,4 +1,4 @@
-from ..models import Report
+from ..models import Report, ReportSnapshot
 from decimal import Decimal
 from reports.pdf.currencyvalue import CurrencyValue as CV, CV_ZERO
 
@@ -53,9 +53,10 @@ class SalesRow(object):
 
 class SalesBox(object):
 
-    def __init__(self, report, currency):
+    def __init__(self, report, currency, snapshot=None):
         self.report = report
         self.currency = currency
+        self.snapshot = snapshot if snapshot else ReportSnapshot(report)
 
         self.build_export_rows()
         self.build_local_rows()
@@ -90,11 +91,11 @@ class SalesBox(object):
 
         for row in rows:
             total_volume += row.volume
-            total_revenue += row.revenue
-            total_freight += row.freight
+            total_revenue.accumulate(row.revenue)
+            total_freight.accumulate(row.freight)
 
-            total_fob += (row.volume * row.fob_price)
-            total_fot += (row.volume * row.fot_price)
+            total_fob.accumulate(row.volume * row.fob_price)
+            total_fot.accumulate(row.volume * row.fot_price)
 
         fot_price = total_fot / total_volume
         fob_price = total_fob / total_volume
@@ -139,11 +140,11 @@ class SalesBox(object):
         return SalesRow(buyer, grades, sale_type, volume, price, fot_price, fob_price, freight, revenue)        
     
     def build_export_rows(self):
-        self.export_rows = self.build_rows(self.report.sales.exclude(sale_type='LOC'))
+        self.export_rows = self.build_rows([sale for sale in self.snapshot.sales if sale.sale_type != 'LOC'])
         self.export_rows.append(self.build_total_row(self.export_rows))
 
     def build_local_rows(self):
-        self.local_rows = self.build_rows(self.report.sales.filter(sale_type='LOC'))
+        self.local_rows = self.build_rows([sale for sale in self.snapshot.sales if sale.sale_type == 'LOC'])
         self.local_rows.append(self.build_total_row(self.local_rows))
 
     def build_rows(self, sales):
@@ -157,10 +158,11 @@ class SalesBox(object):
 
             # whether all the grades in this sale are depth 2.. if so, then this sale
             # will be combined with other sales that are all depth2 if by the same buyer
-            can_be_combined = sale.components.count() > 0
+            components = self.snapshot.get_sale_components(sale)
+            can_be_combined = len(components) > 0
             depth1_parent = -1
 
-            for component in sale.components.all():
+            for component in components:
                 grade = component.grade
                 if not grade.parent or not grade.parent.parent:
                     can_be_combined = False
@@ -197,9 +199,9 @@ class SalesBox(object):
 
         for sales in depth2_buyers.values():
             total_volume = Decimal(0)
-            total_fot_revenue = CV_ZERO
-            total_fob_revenue = CV_ZERO
-            total_freight = CV_ZERO
+            total_fot_revenue = CV(Decimal("0"))
+            total_fob_revenue = CV(Decimal("0"))
+            total_freight = CV(Decimal("0"))
             depth1_grade = None
 
             fot_price = CV_ZERO
@@ -207,9 +209,9 @@ class SalesBox(object):
 
             for sale in sales:
                 total_volume += sale.volume
-                total_fot_revenue += (sale.volume * sale.fot_price)
-                total_fob_revenue += (sale.volume * sale.fob_price)
-                total_freight += sale.freight
+                total_fot_revenue.accumulate(sale.volume * sale.fot_price)
+                total_fob_revenue.accumulate(sale.volume * sale.fob_price)
+                total_freight.accumulate(sale.freight)
 
                 if depth1_grade is None:
                     for grade in sale.grades:
@@ -0,0 +1,40 @@
+from celery.decorators import task
+from datetime import datetime
+
+@task(track_started=True)
+def export_reports(task):  #pragma: no cover
+    from .pdf.export import export_season
+    from django.db import transaction
+    from util.progress import get_progress_logger
+
+    transaction.enter_transaction_management()
+    transaction.managed()
+
+    try:
+        task.task_id = export_reports.request.id
+        task.task_log = "Started export at %s\n" % datetime.now()
+        task.save()
+
+        transaction.commit()
+
+        # our progress is saved on its own connection so it can be seen while we are still working
+        report_count = export_season(task, log=get_progress_logger(task))
+
+        task.log("Export finished at %s\n" % datetime.now())
+        task.log("%d report(s) included in export." % report_count)
+
+        transaction.commit()
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+
+        task.log("Error: %s" % e)
+        transaction.commit()
+
+        raise e
+
+    finally:
+        transaction.leave_transaction_management()
+
+    return task
@@ -244,3 +244,28 @@ class CurrencyValueTestCase(TestCase):
 
 
     
+
+    def test_accumulate(self):
+        val = CV(Decimal("1"), Decimal("500"))
+        total = CV(Decimal("0"))
+
+        # accumulating changes our total in place
+        self.assertIs(total, total.accumulate(val))
+        total.accumulate(CV(Decimal("2"), Decimal("500")))
+        total.accumulate(CV(Decimal("1"), Decimal("250")))
+        total.accumulate(None)
+
+        # usd values are kept as one total per exchange rate
+        self.assertEquals([[Decimal("1"), Decimal("250")], [Decimal("3"), Decimal("500")]], total.usd_values)
+        self.assertEquals("0 - [1 (250), 3 (500)]", str(total))
+        self.assertEquals(Decimal("2000"), total.as_local(Decimal("500")))
+        self.assertEquals(Decimal("250"), total.forex_loss(Decimal("500")).as_local(Decimal("500")))
+
+        # but the values added to it are left alone
+        self.assertEquals(Decimal("500"), val.as_local(Decimal("500")))
+
+        # and regular addition still gives us a new value
+        other = total
+        other += CV(Decimal("1000"))
+        self.assertEquals(Decimal("2000"), total.as_local(Decimal("500")))
+        self.assertEquals(Decimal("3000"), other.as_local(Decimal("500")))
@@ -1,4 +1,5 @@
 from tns_glass.reports.pdf.render import PDFReport
+from tns_glass.reports.models import ReportSnapshot
 from .base import PDFTestCase
 from decimal import Decimal
 
@@ -49,3 +50,14 @@ class MetricsTest(PDFTestCase):
         self.report.farmer_price = None
         self.assertIsNone(self.report.farmer_price_usd())
 
+    def test_snapshot(self):
+        snapshot = ReportSnapshot(self.report)
+        self.report.calculate_metrics(snapshot)
+        self.assertDecimalEquals("6.22", self.report.cherry_to_green_ratio)
+
+        # everything our boxes need has been loaded, so building them again doesn't touch the database
+        with self.assertNumQueries(0):
+            self.report.calculate_metrics(snapshot)
+
+        self.assertDecimalEquals("874.58", self.report.production_cost)
+        self.assertEquals(len(self.report.entries_for_season_expenses()), len(self.report.entries_for_season_expenses(snapshot)))
@@ -411,6 +411,33 @@ class RenderTest(PDFTestCase):
         self.render_report()
 
 
+    def test_layout(self):
+        first = PDFReport(self.report, self.currency)
+        second = PDFReport(self.report, self.currency)
+
+        # our calculated widths are shared, and our class column specs are left alone
+        self.assertIs(first.EXPENSE_ROW_COLS, second.EXPENSE_ROW_COLS)
+        self.assertEquals(60, PDFReport.EXPENSE_ROW_COLS[0][0])
+        self.assertEquals(first.EXPENSE_BOX_COLS[0][0] - PDFReport.EXPENSE_ROW_MARGIN, first.EXPENSE_ROW_COLS[0][0])
+        self.assertEquals(PDFReport.EXPENSE_ROW_COLS[1:], first.EXPENSE_ROW_COLS[1:])
+
+        # and can't be changed
+        with self.assertRaises(AttributeError):
+            PDFReport.get_layout().CASH_COLS = ()
+
+    def test_resources(self):
+        from canvas.page import resources
+
+        pdf_report = PDFReport(self.report, self.currency)
+
+        # our images are only decoded once and then shared
+        logo = resources.get_image(PDFReport.TNS_LOGO)
+        self.assertIs(logo, pdf_report.get_image(PDFReport.TNS_LOGO))
+
+        # as are our font metrics
+        self.assertTrue(pdf_report.BOX_ASCENT > 0)
+        self.assertEquals(pdf_report.BOX_ASCENT, resources.get_metrics(PDFReport.BOX_FONT, PDFReport.BOX_SIZE)[0])
+
     def test_round_value(self):
         test_buffer = StringIO()
         pdf_report = PDFReport(self.report, self.currency)
@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 from django.test import TestCase
 from tns_glass.tests import TNSTestCase
@@ -366,6 +367,156 @@ class ReportTestCase(PDFTestCase):
         # everybody! open the doors and pay respect to the admin
         self.assertEquals(200, response.status_code)
 
+        # our PDF is streamed out
+        self.assertTrue(response.streaming)
+        content = "".join(response.streaming_content)
+        self.assertTrue(content.startswith("%PDF"))
+        self.assertEquals(str(len(content)), response['Content-Length'])
+
+    def test_pdf_cache(self):
+        import tempfile, shutil
+        from django.test.utils import override_settings
+
+        self.setupExpenses()
+        self.login(self.admin)
+        pdf_url = reverse('reports.report_pdf', args=[self.report.id])
+
+        # not finalized, so not cached
+        response = self.client.get(pdf_url)
+        self.assertEquals(200, response.status_code)
+        self.assertFalse(response.has_header('ETag'))
+
+        self.report.is_finalized = True
+        self.report.save()
+        self.rwanda_2010.is_finalized = True
+        self.rwanda_2010.save()
+
+        cache_dir = tempfile.mkdtemp()
+        try:
+            with override_settings(REPORT_PDF_CACHE_DIR=cache_dir):
+                response = self.client.get(pdf_url)
+                self.assertEquals(200, response.status_code)
+                etag = response['ETag']
+                self.assertEquals(1, len(os.listdir(os.path.join(cache_dir, str(self.report.id)))))
+
+                # served from our cache the second time around
+                cached = self.client.get(pdf_url)
+                self.assertEquals(etag, cached['ETag'])
+                self.assertEquals("".join(response.streaming_content), "".join(cached.streaming_content))
+
+                # and not at all if they already have it
+                response = self.client.get(pdf_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEquals(304, response.status_code)
+
+                # other options are cached separately
+                response = self.client.get(pdf_url + "?currency=RWF")
+                self.assertNotEquals(etag, response['ETag'])
+                self.assertEquals(2, len(os.listdir(os.path.join(cache_dir, str(self.report.id)))))
+
+                # changing our report gives us a new version, old ones get cleaned up
+                self.report.expenses.create(expense=self.expense_taxes, value=Decimal("10"), created_by=self.admin, modified_by=self.admin)
+                response = self.client.get(pdf_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEquals(200, response.status_code)
+                self.assertNotEquals(etag, response['ETag'])
+                self.assertEquals(1, len(os.listdir(os.path.join(cache_dir, str(self.report.id)))))
+
+                # as does editing anything named in it
+                etag = response['ETag']
+                self.expense_taxes.name = "Taxes and Fees"
+                self.expense_taxes.save()
+                response = self.client.get(pdf_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEquals(200, response.status_code)
+
+                # or changing the exchange rate of one of our entries
+                etag = response['ETag']
+                self.report.expenses.update(exchange_rate=Decimal("600"))
+                response = self.client.get(pdf_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEquals(200, response.status_code)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_export(self):
+        import tempfile, shutil, zipfile
+        from django.conf import settings
+        from django.test.utils import override_settings
+        from reports.models import ReportExport
+        from reports.pdf.export import export_season
+
+        self.setupExpenses()
+        self.report.is_finalized = True
+        self.report.save()
+
+        create_url = reverse('reports.reportexport_create')
+        response = self.client.get(create_url)
+        self.assertRedirect(response, reverse('users.user_login'))
+        self.login(self.admin)
+
+        post_data = dict(season=self.rwanda_2010.id, currency=self.usd.id, weight=self.kilogram.id, language='en_us', report_mode='TR')
+        self.assertPost(create_url, post_data)
+        export = ReportExport.objects.get()
+        self.assertEquals("Report Export for Rwanda 2010", unicode(export))
+
+        response = self.client.get(reverse('reports.reportexport_list'))
+        self.assertContains(response, "2010")
+
+        # nothing to download yet
+        download_url = reverse('reports.reportexport_download', args=[export.id])
+        self.assertRedirect(self.client.get(download_url), reverse('reports.reportexport_read', args=[export.id]))
+
+        cache_dir = tempfile.mkdtemp()
+        export_dir = tempfile.mkdtemp()
+        try:
+            with override_settings(REPORT_PDF_CACHE_DIR=cache_dir, REPORT_EXPORT_DIR=export_dir):
+                # season isn't finalized, so our PDF isn't cached
+                messages = []
+                self.assertEquals(1, export_season(export, log=messages.append))
+                self.assertEquals("Rendering PDFs for 1 report(s).", messages[0])
+                self.assertEquals([], os.listdir(cache_dir))
+
+                # our zip is written outside of our media directory
+                self.assertEquals(export_dir, os.path.dirname(export.export_file.path))
+                self.assertFalse(export.export_file.path.startswith(os.path.abspath(settings.MEDIA_ROOT)))
+
+                archive = zipfile.ZipFile(export.export_file.path)
+                self.assertEquals(["nasho_usd.pdf"], archive.namelist())
+                self.assertTrue(archive.read("nasho_usd.pdf").startswith("%PDF"))
+                archive.close()
+
+                response = self.client.get(download_url)
+                self.assertEquals('application/zip', response['Content-Type'])
+                response.close()
+                os.remove(export.export_file.path)
+
+                # once it is, the PDFs we render are shared with our downloads
+                self.rwanda_2010.is_finalized = True
+                self.rwanda_2010.save()
+
+                export = ReportExport.objects.get()
+                self.assertEquals(1, export_season(export))
+                self.assertEquals(1, len(os.listdir(os.path.join(cache_dir, str(self.report.id)))))
+                os.remove(export.export_file.path)
+
+                # every finalized report ends up in our archive
+                self.coko.set_csp_for_season(self.rwanda_2010, self.rtc)
+                coko_report = Report.get_for_wetmill_season(self.coko, self.rwanda_2010, self.admin)
+                coko_report.farmers = 50
+                coko_report.capacity = Decimal("5000")
+                coko_report.is_finalized = True
+                coko_report.save()
+
+                export = ReportExport.objects.get()
+                self.assertEquals(2, export_season(export))
+                self.assertEquals(1, len(os.listdir(os.path.join(cache_dir, str(coko_report.id)))))
+
+                archive = zipfile.ZipFile(export.export_file.path)
+                self.assertEquals(["coko_usd.pdf", "nasho_usd.pdf"], archive.namelist())
+                self.assertTrue(archive.read("coko_usd.pdf").startswith("%PDF"))
+                archive.close()
+                os.remove(export.export_file.path)
+        finally:
+            shutil.rmtree(cache_dir)
+            shutil.rmtree(export_dir)
+
     def test_local_sales(self):
         self.report = Report.get_for_wetmill_season(self.nasho, self.rwanda_2010, self.admin)
         self.login(self.admin)
@@ -2,3 +2,4 @@ from .views import *
 
 urlpatterns = ReportCRUDL().as_urlpatterns()
 urlpatterns += SaleCRUDL().as_urlpatterns()
+urlpatterns += ReportExportCRUDL().as_urlpatterns()
@@ -1,3 +1,4 @@
+import os
 from smartmin.views import *
 from .models import *
 from wetmills.models import Wetmill, WetmillCSPSeason, WetmillSeasonAccountingSystem
@@ -5,8 +6,10 @@ from seasons.models import Season
 from public.models import get_report_currencies, get_report_weights
 from locales.models import Currency, Weight
 from perms.models import has_wetmill_permission, has_country_permission, get_wetmills_with_permission
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseNotModified
 from .pdf.render import PDFReport
+from .pdf.cache import pdf_cache
+from canvas.views import render_pdf_response, open_pdf_response
 from django.http import HttpResponseRedirect
 from util.fields import TreeModelChoiceField
 from django.utils.translation import ugettext_lazy as _
@@ -133,31 +136,45 @@ class ReportCRUDL(SmartCRUDL):
             weight_abbreviation = self.request.REQUEST.get('weight', 'Kg')
             weight = Weight.objects.get(abbreviation__iexact=weight_abbreviation)
 
-            try:
-                from cStringIO import StringIO
-            except ImportError: # pragma: no cover
-                from StringIO import StringIO
+            report_mode = self.request.REQUEST.get('report_mode', 'CR')
+            lang = self.request.REQUEST.get('lang', 'en_us')
+            show_buyers = has_wetmill_permission(self.request.user, self.object.wetmill, 'report_edit')
 
-            response = HttpResponse(mimetype='application/pdf')
-            response['Content-Disposition'] = 'attachment; filename=%s_%s.pdf' % (self.object.wetmill.name.lower(), 
-                                                                                  currency.currency_code.lower())
+            def render(output):
+                # activate our local
+                activate(lang)
 
-            show_buyers = has_wetmill_permission(self.request.user, self.object.wetmill, 'report_edit')
+                try:
+                    pdf_report = PDFReport(self.object, currency, weight, report_mode=report_mode, show_buyers=show_buyers)
+                    pdf_report.render(output)
+                finally:
+                    # back to english
+                    activate('en_us')
 
-            # activate our local
-            activate(self.request.REQUEST.get('lang', 'en_us'))
+            # finalized reports for finalized seasons don't change, so we can cache them
+            etag = None
+            if self.object.is_finalized and self.object.season.is_finalized:
+                etag = pdf_cache.get_key(self.object, currency=currency.currency_code, weight=weight.abbreviation,
+                                         report_mode=report_mode, show_buyers=show_buyers, lang=lang)
 
-            output_buffer = StringIO()
+                # they already have this version
+                if self.request.META.get('HTTP_IF_NONE_MATCH', None) == '"%s"' % etag:
+                    response = HttpResponseNotModified()
+                    response['ETag'] = '"%s"' % etag
+                    return response
 
-            pdf_report = PDFReport(self.object, currency, weight, report_mode=self.request.REQUEST.get('report_mode', 'CR'),
-                                   show_buyers=show_buyers)
-            pdf_report.render(output_buffer)
+            filename = '%s_%s.pdf' % (self.object.wetmill.name.lower(), currency.currency_code.lower())
 
-            response.write(output_buffer.getvalue())
-            output_buffer.close()
+            if etag:
+                path = pdf_cache.get(self.object, etag)
+                if not path:
+                    path = pdf_cache.put(self.object, etag, render)
 
-            # back to english
-            activate('en_us')
+                response = open_pdf_response(path, filename)
+                response['ETag'] = '"%s"' % etag
+
+            else:
+                response = render_pdf_response(render, filename)
 
             return response
 
@@ -182,11 +199,14 @@ class ReportCRUDL(SmartCRUDL):
 
             context['cherry_production'] = self.object.production_for_kind('CHE')
 
-            wetmill_production = self.object.production_for_season_grades('PAR')
-            wetmill_production += self.object.production_for_season_grades('GRE')
+            # load everything for our report once
+            snapshot = ReportSnapshot(self.object)
+
+            wetmill_production = self.object.production_for_season_grades('PAR', snapshot)
+            wetmill_production += self.object.production_for_season_grades('GRE', snapshot)
             context['wetmill_production'] = wetmill_production
 
-            expenses = self.object.entries_for_season_expenses()
+            expenses = self.object.entries_for_season_expenses(snapshot)
             halfway = len(expenses) / 2
             while (halfway >= 0 and len(expenses) > 0):
                 if expenses[halfway]['expense'].depth == 0:
@@ -197,9 +217,9 @@ class ReportCRUDL(SmartCRUDL):
             context['halfway_point'] = halfway
             context['dollars'] = Currency.objects.get(currency_code='USD')
 
-            context['cashuses'] = self.object.cash_uses_for_season()
-            context['cashsources'] = self.object.cash_sources_for_season()
-            context['payments'] = self.object.farmer_payments_for_season()
+            context['cashuses'] = self.object.cash_uses_for_season(snapshot)
+            context['cashsources'] = self.object.cash_sources_for_season(snapshot)
+            context['payments'] = self.object.farmer_payments_for_season(snapshot)
 
             context['sales'] = self.object.sales.all()
 
@@ -289,7 +309,10 @@ class ReportCRUDL(SmartCRUDL):
             curr = self.object.season.country.currency.currency_code
 
             self.cashsource_fields = []
-            for cashsource in self.object.season.get_cash_sources().filter(calculated_from='NONE'):
+            for cashsource in self.object.season.get_cash_sources():
+                if cashsource.calculated_from != 'NONE':
+                    continue
+
                 field_name = 'cashsource__%d' % cashsource.id
                 field = forms.DecimalField(label=_("%s Total") % cashsource.name, required=False,
                                            help_text=_("The total amount distributed as a %s, in the local currency") % cashsource.name)
@@ -299,7 +322,10 @@ class ReportCRUDL(SmartCRUDL):
                 self.cashsource_fields.append(cashsource)
 
             self.cashuse_fields = []
-            for cashuse in self.object.season.get_cash_uses().filter(calculated_from='NONE'):
+            for cashuse in self.object.season.get_cash_uses():
+                if cashuse.calculated_from != 'NONE':
+                    continue
+
                 field_name = 'cashuse__%d' % cashuse.id
                 field = forms.DecimalField(label=_("%s Total") % cashuse.name, required=False,
                                            help_text=_("The total amount spent on the %s, in the local currency") % cashuse.name)
@@ -868,3 +894,55 @@ class SaleCRUDL(SmartCRUDL):
             """
             wetmill = Sale.objects.get(pk=kwargs['pk']).report.wetmill
             return has_wetmill_permission(request.user, wetmill, 'report_edit')
+
+class ReportExportCRUDL(SmartCRUDL):
+    model = ReportExport
+    actions = ('create', 'list', 'read', 'export', 'download')
+    permissions = True
+
+    class List(SmartListView):
+        fields = ('season', 'status', 'currency', 'language', 'created_on', 'created_by')
+
+        def get_status(self, obj):
+            return obj.get_status()
+
+    class Read(SmartReadView):
+        def derive_title(self):
+            return _("Export %s Reports") % (self.object.season.name)
+
+        def derive_refresh(self):
+            if self.object.get_status() == 'STARTED' or self.object.get_status() == 'PENDING':
+                return 2000
+            else: # pragma: no cover
+                return 0
+
+    class Export(SmartReadView):
+        def pre_process(self, request, *args, **kwargs):
+            try:
+                self.get_object().start()
+            except Exception as e: # pragma: no cover
+                task = self.get_object()
+                task.log("Couldn't queue export, contact administrator.")
+            return HttpResponseRedirect(reverse('reports.reportexport_read', args=[self.get_object().pk]))
+
+    class Download(SmartReadView):
+        def render_to_response(self, context, **kwargs):
+            from django.core.servers.basehttp import FileWrapper
+            from django.http import StreamingHttpResponse
+
+            # exports made before they were moved out of MEDIA_ROOT won't be found, those need to be run again
+            if not self.object.export_file or not self.object.export_file.storage.exists(self.object.export_file.name):
+                return HttpResponseRedirect(reverse('reports.reportexport_read', args=[self.object.pk]))
+
+            # stream our zip out instead of reading it all in memory
+            export_file = open(self.object.export_file.path, 'rb')
+            response = StreamingHttpResponse(FileWrapper(export_file), content_type='application/zip')
+            response['Content-Length'] = os.path.getsize(self.object.export_file.path)
+            response['Content-Disposition'] = 'attachment; filename=%s' % os.path.basename(self.object.export_file.name)
+            return response
+
+    class Create(SmartCreateView):
+        title = _("Export Season Reports")
+        success_url = "id@reports.reportexport_export"
+        fields = ('season', 'currency', 'weight', 'language', 'report_mode')
+        submit_button_name = _("Export")
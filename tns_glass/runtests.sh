@@ -1 +1 @@
-python manage.py test dashboard broadcasts sms locales wetmills csps expenses grades standards tns_users translate public seasons reminders reports cashuses scorecards reportimports aggregates scorecardimports photos --noinput --with-coverage --cover-package=reminders,dashboard,broadcasts,sms,locales,wetmills,csps,expenses,grades,standards,tns_users,translate,public,seasons,reports,cashuses,scorecards,reportimports,aggregates,scorecardimports,photos --cover-html-dir=../coverage-report --cover-html
+python manage.py test dashboard broadcasts sms locales wetmills csps expenses grades standards tns_users translate public seasons reminders reports cashuses scorecards reportimports aggregates scorecardimports photos util --noinput --with-coverage --cover-package=reminders,dashboard,broadcasts,sms,locales,wetmills,csps,expenses,grades,standards,tns_users,translate,public,seasons,reports,cashuses,scorecards,reportimports,aggregates,scorecardimports,photos,util --cover-html-dir=../coverage-report --cover-html
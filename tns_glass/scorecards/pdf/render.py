@@ -2,7 +2,7 @@ import os
 from datetime import datetime
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase.pdfmetrics import stringWidth, getAscent, getDescent
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 from canvas.page import PDFPage
 
@@ -45,13 +45,7 @@ class PDFScorecard(PDFPage):
         self.calculate_metrics()
 
     def calculate_metrics(self):
-        self.HEADER_ASCENT = getAscent(self.HEADER_FONT, self.HEADER_SIZE)
-        self.HEADER_DESCENT = -getDescent(self.HEADER_FONT, self.HEADER_SIZE)
-        self.HEADER_HEIGHT = self.HEADER_ASCENT + self.HEADER_DESCENT + self.HEADER_PADDING * 2
-
-        self.BOX_ASCENT = getAscent(self.BOX_FONT, self.BOX_SIZE)
-        self.BOX_DESCENT = -getDescent(self.BOX_FONT, self.BOX_SIZE)
-        self.BOX_HEIGHT = self.BOX_ASCENT + self.BOX_DESCENT + self.BOX_PADDING * 2
+        self.calculate_font_metrics()
 
         self.SUMMARY_BOX_WIDTH = self.WIDTH - self.PAGE_MARGIN * 2
 
@@ -122,7 +116,7 @@ class PDFScorecard(PDFPage):
         c.saveState()
         c.translate(x, y+self.TNS_LOGO_HEIGHT)
         c.scale(1.0,-1.0)
-        (width, height) = c.drawImage(self.TNS_LOGO, 0, 0, 
+        (width, height) = c.drawImage(self.get_image(self.TNS_LOGO), 0, 0, 
                                       width=self.TNS_LOGO_WIDTH, height=self.TNS_LOGO_HEIGHT,
                                       mask='auto', preserveAspectRatio=True, anchor='nw')
         c.restoreState()
@@ -133,7 +127,7 @@ class PDFScorecard(PDFPage):
         c.translate(self.WIDTH-self.PAGE_MARGIN-self.AWARD_WIDTH, y+self.AWARD_HEIGHT)
         c.scale(1.0,-1.0)
         award_file_name = '%s.png' % award
-        (width, height) = c.drawImage(os.path.join(settings.RESOURCES_DIR, award_file_name), 0, 0, 
+        (width, height) = c.drawImage(self.get_image(os.path.join(settings.RESOURCES_DIR, award_file_name)), 0, 0, 
                                       width=self.AWARD_WIDTH, height=self.AWARD_HEIGHT,
                                       mask='auto', preserveAspectRatio=True, anchor='nw')
         c.restoreState()
@@ -216,7 +210,7 @@ class PDFScorecard(PDFPage):
             else:
                 file_name = 'na.png'
             
-            c.drawImage(os.path.join(settings.RESOURCES_DIR, file_name), graph_x-BAR_WIDTH-TICKED_SIZE/2, y+bar_height+max_height+self.PAGE_MARGIN*2, 
+            c.drawImage(self.get_image(os.path.join(settings.RESOURCES_DIR, file_name)), graph_x-BAR_WIDTH-TICKED_SIZE/2, y+bar_height+max_height+self.PAGE_MARGIN*2, 
                                       width=TICKED_SIZE, height=TICKED_SIZE,
                                       mask='auto', preserveAspectRatio=True, anchor='c')
 
@@ -1,6 +1,7 @@
 from smartmin.views import *
 from .models import *
 from .pdf.render import PDFScorecard
+from canvas.views import render_pdf_response
 from standards.models import StandardCategory, Standard
 
 from perms.models import has_wetmill_permission
@@ -61,22 +62,8 @@ class ScorecardCRUDL(SmartCRUDL):
     class Pdf(SmartReadView):
         
         def render_to_response(self, context, **kwargs):
-            try:
-                from cStringIO import StringIO
-            except ImportError: # pragma: no cover
-                from StringIO import StringIO
-
-            response = HttpResponse(mimetype='application/pdf')
-            response['Content-Disposition'] = 'attachment; filename=%s.pdf' % self.object.wetmill.name.lower()
-
-            output_buffer = StringIO()
             scorecard = PDFScorecard(self.object)
-            scorecard.render(output_buffer)
-
-            response.write(output_buffer.getvalue())
-            output_buffer.close()
-
-            return response
+            return render_pdf_response(scorecard.render, '%s.pdf' % self.object.wetmill.name.lower())
 
         def has_permission(self, request, *args, **kwargs):
             """
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from smartmin.models import SmartModel
 from locales.models import *
 from expenses.models import *
@@ -12,6 +14,138 @@ import requests
 from lxml.html import fromstring
 from lxml.cssselect import CSSSelector
 import re
+import threading
+
+def build_season_tree(items):
+    """
+    Builds the tree for the passed in expenses or grades configured for a season, ordered
+    depth first.  Only items whose parents are also configured for the season are included.
+
+    Each item has its depth set and whether it has children in the context of this season.
+    """
+    children = dict()
+    for item in sorted(items, key=lambda item: item.order):
+        children.setdefault(item.parent_id, []).append(item)
+
+    tree = []
+    def add_children(parent_id, depth):
+        for item in children.get(parent_id, []):
+            item.depth = depth
+            tree.append(item)
+            add_children(item.id, depth + 1)
+
+    for item in children.get(None, []):
+        item.depth = 0
+        tree.append(item)
+        add_children(item.id, 1)
+
+    for i in range(len(tree)):
+        tree[i].is_parent = i+1 < len(tree) and tree[i+1].depth > tree[i].depth
+
+    return tree
+
+def filter_season_tree(tree, include):
+    """
+    Filters the passed in season tree down to the top level items that include returns True for,
+    along with all their children.
+    """
+    filtered = []
+    included = False
+    for item in tree:
+        if item.depth == 0:
+            included = include(item)
+
+        if included:
+            filtered.append(item)
+
+    return filtered
+
+class SeasonTreeNode(object):
+    """
+    An immutable node in one of our cached season trees.  We only keep the field values and
+    any extra attributes for each item, a fresh model instance is built every time the node is
+    handed out so callers are free to annotate it.
+    """
+    __slots__ = ('model', 'values', 'attrs')
+
+    def __init__(self, item, attrs):
+        object.__setattr__(self, 'model', item.__class__)
+        object.__setattr__(self, 'values', tuple(getattr(item, field.attname) for field in item._meta.fields))
+        object.__setattr__(self, 'attrs', tuple((attr, getattr(item, attr)) for attr in attrs))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Season tree nodes can't be modified")
+
+    def build(self):
+        item = self.model(*self.values)
+        item._state.adding = False
+        item._state.db = 'default'
+
+        for attr, value in self.attrs:
+            setattr(item, attr, value)
+
+        return item
+
+class SeasonTreeCache(object):
+    """
+    A process local cache of the configuration trees for each season, its expenses, grades, cash
+    uses and sources and farmer payments.  These are needed for every report in a season but only
+    change when the season is edited, so we build them once per season.
+
+    Every tree is stamped with the config_version of the season it was built for.  Configuration
+    changes bump that version in the database, so other processes rebuild their trees as soon as
+    they load the season again.  Our own entries are also thrown away right away, as the season
+    we were handed may have been loaded before the change.
+    """
+    def __init__(self):
+        self.trees = dict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, season, name, loader, attrs=()):
+        """
+        Returns the tree with the passed in name for the passed in season, calling loader to build
+        it if we don't have it yet.  The listed attrs are kept for each item in the tree.
+        """
+        key = (season.pk, name)
+
+        nodes = None
+        with self.lock:
+            entry = self.trees.get(key, None)
+            if entry and entry[0] == season.config_version:
+                self.hits += 1
+                nodes = entry[1]
+
+        if nodes is None:
+            nodes = tuple(SeasonTreeNode(item, attrs) for item in loader())
+
+            with self.lock:
+                self.misses += 1
+                self.trees[key] = (season.config_version, nodes)
+
+        return [node.build() for node in nodes]
+
+    def invalidate_season(self, season_id):
+        """
+        Throws away all the trees we have for the season with the passed in id
+        """
+        with self.lock:
+            for key in self.trees.keys():
+                if key[0] == season_id:
+                    del self.trees[key]
+
+    def invalidate(self, sender=None, **kwargs):
+        """
+        Throws away everything we have cached, can be used directly as a signal receiver.
+        """
+        with self.lock:
+            self.trees = dict()
+
+    def get_stats(self):
+        return dict(size=len(self.trees), hits=self.hits, misses=self.misses)
+
+season_trees = SeasonTreeCache()
 
 class Season(SmartModel):
     name = models.CharField(max_length=16, verbose_name=_("Name"),
@@ -49,6 +183,8 @@ class Season(SmartModel):
                                        help_text=_("The uses of cash that are active for this season"))
     is_finalized = models.BooleanField(default=False, verbose_name=_("Is Finalized"),
                                        help_text=_("Whether this season has been finalized at least once"))
+    config_version = models.IntegerField(default=0, verbose_name=_("Configuration Version"),
+                                         help_text=_("Incremented every time the expenses, grades or payments for this season change"))
 
     farmer_payment_left = models.DecimalField(max_digits=16, decimal_places=4, default=0, verbose_name=_("Farmer Payment Left"),
                                              help_text=_("The left value for the farmer payment gauge, in the local currency per kilo of cherry"))
@@ -70,6 +206,15 @@ class Season(SmartModel):
     sale_price_right = models.DecimalField(max_digits=16, decimal_places=4, default=10, verbose_name=_("Sale Price Right"),
                                          help_text=_("The right value for the sale price gauge, in the local currency per kilo of green (FOT)"))
 
+    def save(self, *args, **kwargs):
+        # our configuration version is only ever changed by bump_config_version, never write it back
+        # from what may be a stale copy of this season
+        if self.pk and not kwargs.get('force_insert') and not kwargs.get('update_fields'):
+            kwargs['update_fields'] = [field.name for field in self._meta.fields
+                                       if not field.primary_key and field.name != 'config_version']
+
+        return super(Season, self).save(*args, **kwargs)
+
     @classmethod
     def get_last_country_season(cls, country, exclude_season=None):
         previous = Season.objects.filter(country=country)
@@ -161,19 +306,22 @@ class Season(SmartModel):
         return standard_categories
 
     def get_cash_uses(self):
-        return self.cash_uses.all()
+        return season_trees.get(self, 'cash_uses', lambda: self.cash_uses.all())
 
     def get_cash_sources(self):
-        return self.cash_sources.all()
+        return season_trees.get(self, 'cash_sources', lambda: self.cash_sources.all())
 
     def get_farmer_payments(self):
-        season_payments = []
-        for farmer_payment in SeasonFarmerPayment.objects.filter(season=self):
-            payment = farmer_payment.farmer_payment
-            payment.applies_to = farmer_payment.applies_to
-            season_payments.append(payment)
+        def load_payments():
+            season_payments = []
+            for farmer_payment in SeasonFarmerPayment.objects.filter(season=self).select_related('farmer_payment'):
+                payment = farmer_payment.farmer_payment
+                payment.applies_to = farmer_payment.applies_to
+                season_payments.append(payment)
+
+            return season_payments
 
-        return season_payments
+        return season_trees.get(self, 'farmer_payments', load_payments, ('applies_to',))
 
     def get_expenses(self):
         return SeasonExpense.objects.filter(season=self)
@@ -202,45 +350,40 @@ class Season(SmartModel):
         return self.standards.all() if category is None else self.standards.filter(category=category)
 
     def get_expense_tree(self):
-        season_ids = [expense.id for expense in self.expenses.all()]
-        season_expenses = []
-        for top_expense in self.expenses.filter(parent=None):
-            top_expense.depth = 0
-            season_expenses.append(top_expense)
-            season_expenses += top_expense.get_child_tree(id__in=season_ids)
-
-        # now figure out for each expense whether it has children in the context of this season
-        for i in range(len(season_expenses)):
-            if i+1 < len(season_expenses) and season_expenses[i+1].depth > season_expenses[i].depth:
-                season_expenses[i].is_parent = True
-            else:
-                season_expenses[i].is_parent = False
-
-            # and set whether it should be collapsed
-            season_expense = SeasonExpense.objects.get(season=self, expense=season_expenses[i])
-            season_expenses[i].collapse = season_expense.collapse
-
-        return season_expenses
+        def load_tree():
+            season_expenses = []
+            for season_expense in SeasonExpense.objects.filter(season=self).select_related('expense'):
+                # set whether it should be collapsed
+                expense = season_expense.expense
+                expense.collapse = season_expense.collapse
+                season_expenses.append(expense)
+
+            return build_season_tree(season_expenses)
+
+        return season_trees.get(self, 'expenses', load_tree, ('depth', 'is_parent', 'collapse'))
 
     def get_grade_tree(self, **kwargs):
-        season_ids = [grade.id for grade in self.grades.all()]
-        season_grades = []
-        for top_grade in self.grades.filter(parent=None, **kwargs):
-            top_grade.depth = 0
-            season_grades.append(top_grade)
-            season_grades += top_grade.get_child_tree(id__in=season_ids)
-            
-        # figure out for each grade wheter it has children in the context of this season
-        for i in range(len(season_grades)):
-            if i+1 < len(season_grades) and season_grades[i+1].depth > season_grades[i].depth:
-                season_grades[i].is_parent = True
-            else:
-                season_grades[i].is_parent = False
-
-            # and set whether it is a top grade
-            season_grade = SeasonGrade.objects.get(season=self, grade=season_grades[i])
-            season_grades[i].is_top_grade = season_grade.is_top_grade
-                
+        def load_tree():
+            season_grades = []
+            for season_grade in SeasonGrade.objects.filter(season=self).select_related('grade'):
+                # set whether it is a top grade
+                grade = season_grade.grade
+                grade.is_top_grade = season_grade.is_top_grade
+                season_grades.append(grade)
+
+            season_grades = build_season_tree(season_grades)
+            for grade in season_grades:
+                grade.has_children = grade.is_parent
+
+            return season_grades
+
+        season_grades = season_trees.get(self, 'grades', load_tree, ('depth', 'is_parent', 'has_children', 'is_top_grade'))
+
+        # any filters only apply to our top level grades
+        if kwargs:
+            top_ids = set(self.grades.filter(parent=None, **kwargs).values_list('id', flat=True))
+            season_grades = filter_season_tree(season_grades, lambda grade: grade.id in top_ids)
+
         return season_grades
 
     def has_unprocessed_grades(self):
@@ -323,3 +466,46 @@ class SeasonFarmerPayment(models.Model):
         ordering = ('farmer_payment__order',)
         unique_together = ('season', 'farmer_payment')
 
+def bump_config_version(season_id=None):
+    """
+    Increments the configuration version of the season with the passed in id, or of every season if
+    none is passed in, letting every process know their trees for it are out of date.
+    """
+    seasons = Season.objects.all() if season_id is None else Season.objects.filter(pk=season_id)
+    seasons.update(config_version=F('config_version') + 1)
+
+def invalidate_season_trees(sender, instance, **kwargs):
+    season_trees.invalidate_season(instance.season_id)
+    bump_config_version(instance.season_id)
+
+def invalidate_season_m2m_trees(sender, instance, action, reverse, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        if reverse:
+            season_trees.invalidate()
+            bump_config_version()
+        else:
+            season_trees.invalidate_season(instance.pk)
+            bump_config_version(instance.pk)
+
+def invalidate_season(sender, instance, **kwargs):
+    season_trees.invalidate_season(instance.pk)
+
+def invalidate_all_season_trees(sender, instance, **kwargs):
+    season_trees.invalidate()
+    bump_config_version()
+
+# throw away a season's trees whenever its configuration changes
+for model in (SeasonExpense, SeasonGrade, SeasonFarmerPayment):
+    post_save.connect(invalidate_season_trees, sender=model, dispatch_uid='invalidate_%s_trees' % model.__name__.lower())
+    post_delete.connect(invalidate_season_trees, sender=model, dispatch_uid='invalidate_%s_tree_deletes' % model.__name__.lower())
+
+m2m_changed.connect(invalidate_season_m2m_trees, sender=Season.cash_uses.through, dispatch_uid='invalidate_cash_use_trees')
+m2m_changed.connect(invalidate_season_m2m_trees, sender=Season.cash_sources.through, dispatch_uid='invalidate_cash_source_trees')
+
+post_save.connect(invalidate_season, sender=Season, dispatch_uid='invalidate_season_trees')
+post_delete.connect(invalidate_season, sender=Season, dispatch_uid='invalidate_season_tree_deletes')
+
+# and everything when any of the items in them change
+for model in (Expense, Grade, CashUse, CashSource, FarmerPayment):
+    post_save.connect(invalidate_all_season_trees, sender=model, dispatch_uid='invalidate_%s_trees' % model.__name__.lower())
+    post_delete.connect(invalidate_all_season_trees, sender=model, dispatch_uid='invalidate_%s_tree_deletes' % model.__name__.lower())
@@ -3,6 +3,7 @@ from tns_glass.tests import TNSTestCase
 from django.core.urlresolvers import reverse
 from .models import *
 from decimal import Decimal
+from django.db.models import F
 
 class SeasonTestCase(TNSTestCase):
 
@@ -209,6 +210,67 @@ class SeasonTestCase(TNSTestCase):
         self.assertEquals(self.low, tree[5])
         self.assertEquals(self.ungraded, tree[6])
 
+        # filters only apply to our top level grades
+        tree = season.get_grade_tree(kind='GRE')
+        self.assertEquals([self.green, self.green15, self.green13, self.low, self.ungraded], tree)
+
+    def test_season_trees(self):
+        season = Season.objects.create(name='2008', country=self.rwanda,
+                                       exchange_rate=Decimal("585"), default_adjustment=Decimal("0.16"),
+                                       farmer_income_baseline=Decimal("100"), fob_price_baseline=Decimal("1.15"),
+                                       created_by=self.admin, modified_by=self.admin)
+
+        season.add_grade(self.green)
+        season.add_grade(self.green15, True)
+        season.add_cash_use(self.cu_dividend)
+
+        stats = season_trees.get_stats()
+        tree = season.get_grade_tree()
+        self.assertEquals([self.green, self.green15], tree)
+        self.assertTrue(tree[1].is_top_grade)
+        self.assertEquals(1, tree[1].depth)
+        self.assertEquals(stats['misses'] + 1, season_trees.get_stats()['misses'])
+
+        # second time around comes from our cache
+        tree[1].depth = 5
+        tree = season.get_grade_tree()
+        self.assertEquals(1, tree[1].depth)
+        self.assertEquals(stats['hits'] + 1, season_trees.get_stats()['hits'])
+
+        # nodes can't be changed
+        with self.assertRaises(AttributeError):
+            season_trees.trees[(season.pk, 'grades')][1][0].depth = 2
+
+        # changing our configuration rebuilds our trees
+        season.add_grade(self.green13)
+        self.assertEquals([self.green, self.green15, self.green13], season.get_grade_tree())
+
+        self.assertEquals([self.cu_dividend], season.get_cash_uses())
+        season.cash_uses.clear()
+        self.assertEquals([], season.get_cash_uses())
+
+        # as does editing an item in them
+        self.green13.name = "Green 13+"
+        self.green13.save()
+        self.assertEquals("Green 13+", season.get_grade_tree()[2].name)
+
+        # changes made by other processes bump our configuration version, which we see once we reload our season
+        season = Season.objects.get(pk=season.pk)
+        self.assertEquals([self.green, self.green15, self.green13], season.get_grade_tree())
+
+        SeasonGrade.objects.bulk_create([SeasonGrade(season=season, grade=self.low)])
+        Season.objects.filter(pk=season.pk).update(config_version=F('config_version') + 1)
+        self.assertEquals([self.green, self.green15, self.green13], season.get_grade_tree())
+
+        season = Season.objects.get(pk=season.pk)
+        self.assertEquals([self.green, self.green15, self.green13, self.low], season.get_grade_tree())
+
+        # saving a stale copy of our season doesn't roll our version back
+        version = season.config_version
+        season.config_version = 0
+        season.save()
+        self.assertEquals(version, Season.objects.get(pk=season.pk).config_version)
+
     def test_season_attributes(self):
         self.login(self.admin)
 
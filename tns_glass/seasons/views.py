@@ -180,14 +180,15 @@ class SeasonCRUDL(SmartCRUDL):
             for standard in self.object.standards.all():
                 initial['standard__%d' % standard.id] = True
 
-            for cashsource in self.object.get_cash_sources():
+            # read straight from the database, what we show here is what gets saved back
+            for cashsource in self.object.cash_sources.all():
                 initial['cashsource__%d' % cashsource.id] = True
 
-            for cashuse in self.object.get_cash_uses():
+            for cashuse in self.object.cash_uses.all():
                 initial['cashuse__%d' % cashuse.id] = True
 
-            for payment in self.object.get_farmer_payments():
-                initial['payment__%d' % payment.id] = payment.applies_to
+            for payment in SeasonFarmerPayment.objects.filter(season=self.object):
+                initial['payment__%d' % payment.farmer_payment_id] = payment.applies_to
 
             return initial
 
@@ -269,6 +269,13 @@ STATIC_ROOT = os.path.join(PROJECT_DIR, '../sitestatic')
 MEDIA_ROOT = os.path.join(PROJECT_DIR, '../media')
 MEDIA_URL = "/media/"
 
+# where rendered PDFs for finalized reports are cached, this must not be served publicly as it includes
+# PDFs rendered with buyers shown, they are only handed out through the report views
+REPORT_PDF_CACHE_DIR = os.path.join(PROJECT_DIR, '../private/report_pdfs')
+
+# where season report exports are written, like our PDF cache this must not be served publicly
+REPORT_EXPORT_DIR = os.path.join(PROJECT_DIR, '../private/report_exports')
+
 #-----------------------------------------------------------------------------------
 # Permission Management
 #-----------------------------------------------------------------------------------
@@ -287,6 +294,7 @@ PERMISSIONS = {
     'reports.report': ('lookup', 'attributes', 'production', 'expenses', 'pdf', 'finalize', 'credit_only'),
     'scorecards.scorecard': ('lookup', 'standards', 'pdf', 'finalize'),
     'reportimports.reportimport': ('action', 'import'),
+    'reports.reportexport': ('export', 'download'),
     'scorecardimports.scorecardimport': ('action', 'import'),
     'wetmills.wetmillimport': ('import',),
     'aggregates.finalizetask': ('finalize',),
@@ -303,7 +311,7 @@ GROUP_PERMISSIONS = {
         'seasons.season.*', 'grades.grade.*', 'wetmills.wetmill.*', 'wetmills.wetmillimport.*', 'auth.user.*',
         'expenses.expense.*', 
         'standards.standardcategory.*','standards.standard.*',
-        'reports.report.*', 'reports.sale.*',
+        'reports.report.*', 'reports.sale.*', 'reports.reportexport.*',
         'cashuses.cashuse.*',
         'cashsources.cashsource.*',
         'farmerpayments.farmerpayment.*',
@@ -321,7 +329,7 @@ GROUP_PERMISSIONS = {
     "Country Administrators": (
         'locales.province.*', 'csps.csp.*',
         'seasons.season.*', 'wetmills.wetmill.*', 'wetmills.wetmillimport.*',
-        'reports.report.*', 'reports.sale.*',
+        'reports.report.*', 'reports.sale.*', 'reports.reportexport.*',
         'scorecards.scorecard.*', 'scorecardimports.scorecardimport.*',
         'reportimports.reportimport.*',
         'aggregates.finalizetask.*',
@@ -416,6 +424,11 @@ CELERYBEAT_SCHEDULE = {
         'schedule': timedelta(minutes=5),
     },
 
+    "approve-submissions": {
+        'task': 'sms.tasks.approve_submissions',
+        'schedule': timedelta(minutes=5),
+    },
+
     "daily-reminders": {
         'task': 'reminders.tasks.check_daily_reminders',
         'schedule': crontab(minute='0',
@@ -1,12 +1,13 @@
 from django.contrib.auth.models import User
-from django.db.models.signals import pre_save
+from django.db.models.signals import pre_save, post_save, post_delete
 import pytz
 import re
+from bisect import bisect_right
 from datetime import datetime, timedelta, date
 from decimal import Decimal
 
-from django.db import models
-from django.db.models import Avg, Sum
+from django.db import models, transaction
+from django.db.models import Avg, Sum, Max, F, Q
 from django.forms import ValidationError
 from django.conf import settings
 
@@ -19,29 +20,83 @@ from wetmills.models import Wetmill
 from csps.models import CSP
 from seasons.models import Season
 from cc.models import MessageCC
-from blurbs.models import Blurb, render
+from blurbs.models import Blurb, render, render_response
 from django.utils.translation import activate
 from locales.models import comma_formatted
 from django.utils.translation import ugettext_lazy as _
 
-from tasks import approve_submission
-
 # this is needed for South, EAV defines some new fields, we need to reassure South they work as normal
 # see: http://south.aeracode.org/wiki/MyFieldsDontWork
 from south.modelsinspector import add_introspection_rules
 add_introspection_rules([], ["^eav\.fields\.EavSlugField"])
 add_introspection_rules([], ["^eav\.fields\.EavDatatypeField"])
 
-# an hour is 60 second * 60 minutes
-ONE_HOUR = 60 * 60
+# how long we wait for a correction before approving a submission on our own
+APPROVAL_DELAY = timedelta(minutes=59)
+
+class LookupCache(object):
+    """
+    A process local cache for lookups we do on every incoming message but which almost never
+    change, such as the country for a backend or the active season for a country.
+
+    Every entry is stamped with the version of the cache it was loaded in, invalidating the cache
+    bumps the version so any stale entries are reloaded the next time they are asked for.
+    """
+    def __init__(self):
+        self.version = 0
+        self.entries = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, loader):
+        """
+        Returns the value cached for the passed in key, calling loader to build it if we don't
+        have a current value for it.
+        """
+        entry = self.entries.get(key, None)
+        if entry and entry[0] == self.version:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        version = self.version
+        value = loader()
+        self.entries[key] = (version, value)
+        return value
+
+    def invalidate(self, sender=None, **kwargs):
+        """
+        Throws away everything we have cached, can be used directly as a signal receiver.
+        """
+        self.version += 1
+        self.entries = dict()
+
+    def get_stats(self):
+        return dict(version=self.version, size=len(self.entries), hits=self.hits, misses=self.misses)
+
+# our cache of countries and seasons, we throw it away any time one of those is saved or deleted
+lookup_cache = LookupCache()
+
+post_save.connect(lookup_cache.invalidate, sender=Country, dispatch_uid='invalidate_country_lookups')
+post_delete.connect(lookup_cache.invalidate, sender=Country, dispatch_uid='invalidate_country_deletes')
+post_save.connect(lookup_cache.invalidate, sender=Season, dispatch_uid='invalidate_season_lookups')
+post_delete.connect(lookup_cache.invalidate, sender=Season, dispatch_uid='invalidate_season_deletes')
 
 def get_country_for_backend(backend):
-    country_code = settings.BACKEND_TO_COUNTRY_MAP.get(backend.lower(), 'RW')
-    return Country.objects.get(country_code__iexact=country_code)
+    backend = backend.lower()
+
+    def load_country():
+        country_code = settings.BACKEND_TO_COUNTRY_MAP.get(backend, 'RW')
+        return Country.objects.get(country_code__iexact=country_code)
+
+    return lookup_cache.get(('country', backend), load_country)
 
 def get_season(country):
-    season = Season.objects.filter(country=country, is_active=True).order_by('-name')
-    return season[0]
+    def load_season():
+        season = Season.objects.filter(country=country, is_active=True).order_by('-name')
+        return season[0]
+
+    return lookup_cache.get(('season', country.pk), load_season)
 
 def from_country_weight(weight, country): 
     return Decimal(str(weight)) / country.weight.ratio_to_kilogram
@@ -92,6 +147,28 @@ def check_wetmill_type(submission, wetmill, types):
     else:
         return False
 
+# maps the primary keyword of each form to the single handler responsible for it
+XFORM_HANDLERS = dict()
+
+def register_xform_handler(keyword, handler):
+    """
+    Registers the passed in handler for forms with the passed in primary keyword.  Only one
+    handler can be registered per keyword, registering a second replaces the first.
+    """
+    XFORM_HANDLERS[keyword] = handler
+
+def dispatch_xform(sender, **kwargs):
+    """
+    Our single XForms Signal hook.  Looks up the handler for the primary keyword of the
+    incoming form and calls only that one, forms we have no handler for cost nothing.
+    """
+    handler = XFORM_HANDLERS.get(kwargs['xform'].get_primary_keyword(), None)
+    if handler:
+        handler(sender, **kwargs)
+
+# register as the only listener for incoming forms
+xform_received.connect(dispatch_xform, dispatch_uid='dispatch_xform')
+
 class ActiveManager(models.Manager):
     """
     A manager that only selects items which are still active.
@@ -180,8 +257,8 @@ class WetmillObserver(Actor):
                     # send off any cc's
                     send_wetmill_ccs(submission.connection, xform, submission.eav.obs_wetmill, submission.template_vars)
 
-# register as a listener for incoming forms
-xform_received.connect(WetmillObserver.register_observer, dispatch_uid='register_observer')
+# register as the handler for incoming forms
+register_xform_handler('obs', WetmillObserver.register_observer)
 
 class Accountant(Actor):
     """
@@ -277,8 +354,8 @@ XFormField.register_field_type('acc', "Accountant", Accountant.parse_accountant,
                                xforms_type='string', db_type=XFormField.TYPE_OBJECT,
                                puller=Accountant.pull_accountant)
 
-# register as a listener for incoming forms
-xform_received.connect(Accountant.register_accountant, dispatch_uid='register_accountant')
+# register as the handler for incoming forms
+register_xform_handler('acc', Accountant.register_accountant)
 
 class CSPOfficer(Actor):
     """
@@ -379,8 +456,8 @@ XFormField.register_field_type('csp_off', "CSP Officer", CSPOfficer.parse_office
                                xforms_type='string', db_type=XFormField.TYPE_OBJECT,
                                puller=CSPOfficer.pull_officer)
 
-# register as a listener for incoming forms
-xform_received.connect(CSPOfficer.register_officer, dispatch_uid='register_officer')
+# register as the handler for incoming forms
+register_xform_handler('csp', CSPOfficer.register_officer)
 
 class CPO(Actor):
     """
@@ -438,8 +515,8 @@ class CPO(Actor):
 XFormField.register_field_type('cpo', "Site Collector", CPO.parse_cpo,
                                xforms_type='integer', db_type=XFormField.TYPE_OBJECT)
 
-# register as a listener for incoming forms
-xform_received.connect(CPO.register_cpo, dispatch_uid='register_cpo')
+# register as the handler for incoming forms
+register_xform_handler('sc', CPO.register_cpo)
 
 def add_cpo(wetmill, phone, name):  # pragma: no cover
     """
@@ -513,8 +590,8 @@ class Farmer(Actor):
                                                 "You are already registered with the {{ wetmill.name }} wetmill, send 'leave' first to unregister")
 
 
-# register as a listener for incoming forms
-xform_received.connect(Farmer.register_farmer, dispatch_uid='register_farmer')
+# register as the handler for incoming forms
+register_xform_handler('farmer', Farmer.register_farmer)
 
 # hook in wetmills as valid field types
 def parse_wetmill(command, value, raw=None, connection=None):
@@ -633,8 +710,8 @@ def leave(sender, **kwargs):
                                            "Your mobile number is not registered with the system.")
             submission.save()
 
-# register a listener for our 'leave' form
-xform_received.connect(leave, dispatch_uid='leave')
+# register as the handler for our 'leave' form
+register_xform_handler('leave', leave)
 
 def lang(sender, **kwargs):
     """
@@ -669,14 +746,14 @@ def lang(sender, **kwargs):
             elif contacts[0].language == 'am':
                 lang = 'Amharic'
 
-            submission.response = render(xform.response, dict(lang=lang))
+            submission.response = render(xform.response, dict(lang=lang), form_id=xform.pk, slug='response')
         else: # pragma: no cover
             submission.response = Blurb.get(xform, 'unknown', dict(),
                                             "Your mobile number is not registered with the system.")                                            
             submission.save()
 
-# register a listener for our 'lang' form
-xform_received.connect(lang, dispatch_uid='lang')
+# register as the handler for our 'lang' form
+register_xform_handler('lang', lang)
 
 def who(sender, **kwargs):
     """
@@ -726,8 +803,8 @@ def who(sender, **kwargs):
         submission.has_errors = True
         submission.save()
 
-# register a listener for our 'who' form
-xform_received.connect(who, dispatch_uid='who')
+# register as the handler for our 'who' form
+register_xform_handler('who', who)
 
 def lookup(sender, **kwargs):
     """
@@ -748,9 +825,9 @@ def lookup(sender, **kwargs):
         else:
             cpos = ", ".join(["%d: %s" % (cpo.cpo_id, cpo.name) for cpo in cpos])
             submission.template_vars['cpos'] = cpos
-            submission.response = render(xform.response, submission.template_vars)
+            submission.response = render(xform.response, submission.template_vars, form_id=xform.pk, slug='response')
 
-xform_received.connect(lookup, dispatch_uid='lookup')
+register_xform_handler('lookup', lookup)
 
 def undo(sender, **kwargs):
     """
@@ -785,11 +862,14 @@ def undo(sender, **kwargs):
 
             concrete = lookup_concrete_submission(cancel_message)
             if concrete:
+                concrete.active = False
                 concrete.is_active = False
+                concrete.pending_approval = False
                 concrete.save()
 
-            # and delete our SMS submission
+            # and delete our SMS submission, making sure it doesn't get approved later on
             cancel_message.active = False
+            cancel_message.pending_approval = False
             cancel_message.save()
             
             submission.template_vars['msg'] = last_submission
@@ -811,7 +891,7 @@ def undo(sender, **kwargs):
             submission.response = Blurb.get(xform, 'none', dict(),
                                             "No previous submission found to cancel.")
 
-xform_received.connect(undo, dispatch_uid='undo')
+register_xform_handler('undo', undo)
 
 class SMSSubmission(models.Model):
     """
@@ -826,10 +906,22 @@ class SMSSubmission(models.Model):
     created_by = models.ForeignKey(User, null=True, verbose_name=_("Created by"),
                                    help_text=_("What user created this submission if any"))
 
+    pending_approval = models.BooleanField(default=False, db_index=True, verbose_name=_("Pending Approval"),
+                                           help_text=_("Whether this submission is waiting to be approved automatically"))
+
+    submission_type = models.CharField(max_length=32, null=True, verbose_name=_("Submission Type"),
+                                       help_text=_("The name of the model which holds the rest of this submission"))
 
     objects = ActiveManager()
     all = models.Manager()
 
+    def save(self, *args, **kwargs):
+        # remember what kind of submission we are so we can find it again without checking every table
+        if not self.submission_type:
+            self.submission_type = self._meta.module_name
+
+        return super(SMSSubmission, self).save(*args, **kwargs)
+
 class StoreSubmission(SMSSubmission):
     """
     Holds the data from the 'store' command for parchment movements
@@ -921,13 +1013,13 @@ class StoreSubmission(SMSSubmission):
                     values['gradea_to_parchment'] = "0"
 
                 # rerender our template
-                submission.response = XForm.render_response(xform.response, values)
+                submission.response = render_response(xform, values)
 
                 # send off any cc's
                 send_wetmill_ccs(submission.connection, xform, submission.eav.store_acc.wetmill, submission.template_vars)
 
-# register as a listener for incoming forms
-xform_received.connect(StoreSubmission.create_submission, dispatch_uid='store_submission')
+# register as the handler for incoming forms
+register_xform_handler('store', StoreSubmission.create_submission)
 
 class ShippingSubmission(SMSSubmission):
     """
@@ -998,8 +1090,8 @@ class ShippingSubmission(SMSSubmission):
             MessageCC.send_cc(xform, 'csp', submission.connection,
                               CSPOfficer.objects.filter(csp=sub.wetmill.get_csp()), submission.template_vars)
 
-# register as a listener for incoming forms
-xform_received.connect(ShippingSubmission.create_submission, dispatch_uid='shipping_submission')
+# register as the handler for incoming forms
+register_xform_handler('send', ShippingSubmission.create_submission)
 
 class ReceivedSubmission(SMSSubmission):
     """
@@ -1082,14 +1174,14 @@ class ReceivedSubmission(SMSSubmission):
                                                     cupping_score=str(submission.eav.rec_score))
 
             # rerender our template
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             # send a CC to our accountant
             MessageCC.send_cc(xform, 'acc', submission.connection,
                               Accountant.objects.filter(wetmill=sub.wetmill), submission.template_vars)
 
-# register as a listener for incoming forms
-xform_received.connect(ReceivedSubmission.create_submission, dispatch_uid='received_submission')
+# register as the handler for incoming forms
+register_xform_handler('rec', ReceivedSubmission.create_submission)
 
 class CashSubmission(SMSSubmission):
     """
@@ -1224,13 +1316,13 @@ class CashSubmission(SMSSubmission):
 
             # figure out what the discrepency
             submission.template_vars['advance_disc'] = roundd(Decimal(sub.cash_advances) - cash_advances, "1")
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             # send off any cc's
             send_wetmill_ccs(submission.connection, xform, submission.eav.cash_acc.wetmill, submission.template_vars)            
             
-# register as a listener for incoming forms
-xform_received.connect(CashSubmission.create_submission, dispatch_uid='cash_submission')
+# register as the handler for incoming forms
+register_xform_handler('cash', CashSubmission.create_submission)
 
 def get_day(utc_time): # pragma: no cover
     """
@@ -1423,7 +1515,7 @@ class CherrySubmission(SMSSubmission):
             submission.template_vars['daylot'] = sub.daylot
 
             # rerender our response with our new values
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             # send off our CC to the cpo
             MessageCC.send_cc(xform, 'cpo', submission.connection, [sub.cpo], submission.template_vars)
@@ -1431,8 +1523,8 @@ class CherrySubmission(SMSSubmission):
             # and any others
             send_wetmill_ccs(submission.connection, xform, submission.eav.cherry_acc.wetmill, submission.template_vars)            
             
-# register as a listener for incoming forms
-xform_received.connect(CherrySubmission.create_submission, dispatch_uid='cherry_submission')
+# register as the handler for incoming forms
+register_xform_handler('cherry', CherrySubmission.create_submission)
 
 class ReturnSubmission(SMSSubmission):
     """
@@ -1516,7 +1608,7 @@ class ReturnSubmission(SMSSubmission):
             submission.template_vars['missing_cv'] = roundd(total_paid - total_value, "1")
 
             # rerender our response with our new values
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             # send off our CC to the cpo
             MessageCC.send_cc(xform, 'cpo', submission.connection, [sub.cpo], submission.template_vars)
@@ -1524,8 +1616,8 @@ class ReturnSubmission(SMSSubmission):
             # send off our CCs
             send_wetmill_ccs(submission.connection, xform, submission.eav.return_acc.wetmill, submission.template_vars)            
             
-# register as a listener for incoming forms
-xform_received.connect(ReturnSubmission.create_submission, dispatch_uid='return_submission')
+# register as the handler for incoming forms
+register_xform_handler('return', ReturnSubmission.create_submission)
 
 # register a new type for day lot id, which is really just a date
 def parse_daylot(command, value, today=None, raw=None, connection=None):
@@ -1673,13 +1765,13 @@ class SummarySubmission(SMSSubmission):
                 submission.template_vars['avg_price'] = 0
 
             # re render our response with our new values
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             # send any cc's for this message
             send_wetmill_ccs(submission.connection, xform, sub.wetmill, submission.template_vars)            
             
-# register as a listener for incoming forms
-xform_received.connect(SummarySubmission.create_submission, dispatch_uid='summary_submission')
+# register as the handler for incoming forms
+register_xform_handler('sum', SummarySubmission.create_submission)
 
 def get_week_start_before(today):
     # normalize to friday or previous friday (if saturday or monday)
@@ -1825,17 +1917,21 @@ class AmafarangaSubmission(SMSSubmission):
 
         return calculated
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
         template_vars = self.get_calculated_values()
         template_vars['wetmill'] = self.wetmill
 
-        AmafarangaSubmission.objects.filter(wetmill=self.wetmill, start_of_week=self.start_of_week).exclude(id=self.pk).update(active=False, is_active=False)
+        if AmafarangaSubmission.objects.filter(wetmill=self.wetmill, start_of_week=self.start_of_week).exclude(id=self.pk).update(active=False, is_active=False):
+            refresh_dashboard_rollup(self)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -1876,6 +1972,7 @@ class AmafarangaSubmission(SMSSubmission):
                 # create our Amafaranga Submission, they start off as NOT active
             sub = AmafarangaSubmission.objects.create(submission=submission,
                                                       active=False,
+                                                      pending_approval=True,
                                                       start_of_week=week_start,
                                                       accountant=submission.eav.amafaranga_accountant,
                                                       wetmill=wetmill,
@@ -1892,12 +1989,10 @@ class AmafarangaSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, AmafarangaSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(AmafarangaSubmission.create_submission, dispatch_uid='amafaranga_submission')
+# register as the handler for incoming forms
+register_xform_handler('amafaranga', AmafarangaSubmission.create_submission)
 
 def getd(dictionary, key):
     if not key in dictionary or not dictionary[key]:
@@ -1978,13 +2073,21 @@ class IbitumbweSubmission(SMSSubmission):
 
         calculated['cherry_price'] = cherry_price
 
-        totals = IbitumbweSubmission.objects.filter(wetmill=self.wetmill, season=self.season, report_day__lte=self.report_day, created__lte=self.created).aggregate(
-            Sum('cash_advanced'), Sum('cash_returned'), Sum('cash_spent'), Sum('credit_spent'), Sum('credit_cleared'))
-        
-        cash_balance = getd(totals, 'cash_advanced__sum') - getd(totals, 'cash_returned__sum') - getd(totals, 'cash_spent__sum') - getd(totals, 'credit_spent__sum')
+        # our running balance is usable as long as we are the latest submission, which is nearly always the case
+        cash_balance = IbitumbweBalance.get_balance(self)
+        if cash_balance is not None:
+            # add ourselves if we aren't counted in the balance yet
+            if not self.is_active:
+                cash_balance += get_ibitumbwe_balance_change(self)
 
-        if not self.active:
-            cash_balance = cash_balance + self.cash_advanced - self.cash_returned - self.cash_spent - self.credit_spent
+        else:
+            totals = IbitumbweSubmission.objects.filter(wetmill=self.wetmill, season=self.season, report_day__lte=self.report_day, created__lte=self.created).aggregate(
+                Sum('cash_advanced'), Sum('cash_returned'), Sum('cash_spent'), Sum('credit_spent'), Sum('credit_cleared'))
+
+            cash_balance = get_ibitumbwe_balance_change(totals)
+
+            if not self.active:
+                cash_balance = cash_balance + get_ibitumbwe_balance_change(self)
 
         calculated['cash_balance'] = comma_formatted(cash_balance, has_decimals)
 
@@ -1994,7 +2097,7 @@ class IbitumbweSubmission(SMSSubmission):
 
         return calculated
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
@@ -2002,11 +2105,17 @@ class IbitumbweSubmission(SMSSubmission):
         template_vars['wetmill'] = self.wetmill
 
         # make any other ibitumbwe or twakinze submissions on this date inactive
-        IbitumbweSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).exclude(id=self.pk).update(active=False, is_active=False)
-        TwakinzeSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).update(active=False, is_active=False)
+        deactivated = IbitumbweBalance.deactivate_submissions(IbitumbweSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).exclude(id=self.pk))
+        deactivated += TwakinzeSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).update(active=False, is_active=False)
+
+        if deactivated:
+            refresh_dashboard_rollup(self)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -2044,6 +2153,7 @@ class IbitumbweSubmission(SMSSubmission):
             # create our Amafaranga Submission, they start off as NOT active
             sub = IbitumbweSubmission.objects.create(submission=submission,
                                                      active=False,
+                                                     pending_approval=True,
                                                      report_day=day,
                                                      accountant=submission.eav.ibitumbwe_accountant,
                                                      wetmill=wetmill,
@@ -2056,9 +2166,7 @@ class IbitumbweSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, IbitumbweSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
 
 
     @staticmethod
@@ -2093,6 +2201,7 @@ class IbitumbweSubmission(SMSSubmission):
             # create our Submission, they start off as NOT active
             sub = IbitumbweSubmission.objects.create(submission=submission,
                                                      active=False,
+                                                     pending_approval=True,
                                                      report_day=day,
                                                      accountant=submission.eav.day_accountant,
                                                      wetmill=wetmill,
@@ -2105,13 +2214,140 @@ class IbitumbweSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, IbitumbweSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(IbitumbweSubmission.create_submission, dispatch_uid='ibitumbwe_submission')
-xform_received.connect(IbitumbweSubmission.create_day_submission, dispatch_uid='ibitumbwe_day_submission')
+# register as the handler for incoming forms
+register_xform_handler('ibitumbwe', IbitumbweSubmission.create_submission)
+register_xform_handler('day', IbitumbweSubmission.create_day_submission)
+
+def get_ibitumbwe_balance_change(values):
+    """
+    Returns how much the passed in ibitumbwe values (either a submission or a dict of sums) change
+    the cash balance of a wetmill.
+    """
+    if isinstance(values, dict):
+        return getd(values, 'cash_advanced__sum') - getd(values, 'cash_returned__sum') - \
+               getd(values, 'cash_spent__sum') - getd(values, 'credit_spent__sum')
+    else:
+        return values.cash_advanced - values.cash_returned - values.cash_spent - values.credit_spent
+
+class IbitumbweBalance(models.Model):
+    """
+    Running cash balance of all the active ibitumbwe submissions for a wetmill in a season.  This
+    is kept up to date as submissions are activated and deactivated so that we don't have to sum
+    the entire season every time we build a reply.
+
+    A submission counts towards the balance when its is_active flag is set.  last_report_day and
+    last_created only ever move forward, so they are always at or after those of the submissions
+    which make up the balance.
+    """
+    wetmill = models.ForeignKey(Wetmill, verbose_name=_("Wetmill"))
+    season = models.ForeignKey(Season, verbose_name=_("Season"))
+    cash_balance = models.DecimalField(max_digits=16, decimal_places=2, default=Decimal(0),
+                                       verbose_name=_("Cash Balance"))
+    last_report_day = models.DateField(null=True, verbose_name=_("Last Report Day"))
+    last_created = models.DateTimeField(null=True, verbose_name=_("Last Created"))
+
+    class Meta:
+        unique_together = ('wetmill', 'season')
+
+    @classmethod
+    def apply_change(cls, wetmill_id, season_id, change, report_day=None, created=None):
+        """
+        Adds the passed in change to the balance for the wetmill and season, moving our last
+        report day and created dates forward if needed.
+        """
+        balance, created_balance = cls.objects.get_or_create(wetmill_id=wetmill_id, season_id=season_id)
+
+        if change:
+            cls.objects.filter(pk=balance.pk).update(cash_balance=F('cash_balance') + change)
+
+        if report_day:
+            cls.objects.filter(Q(last_report_day=None) | Q(last_report_day__lt=report_day), pk=balance.pk).update(last_report_day=report_day)
+
+        if created:
+            cls.objects.filter(Q(last_created=None) | Q(last_created__lt=created), pk=balance.pk).update(last_created=created)
+
+    @classmethod
+    def get_balance(cls, submission):
+        """
+        Returns the cash balance of all the active submissions for the passed in submission's wetmill
+        and season, or None if we can't be sure it only includes submissions on or before it.
+        """
+        balance = cls.objects.filter(wetmill=submission.wetmill_id, season=submission.season_id)
+        if not balance:
+            return None
+
+        balance = balance[0]
+        if balance.last_report_day is None or balance.last_created is None:
+            return Decimal(0)
+
+        if balance.last_report_day <= submission.report_day and balance.last_created <= submission.created:
+            return balance.cash_balance
+        else:
+            return None
+
+    @classmethod
+    def deactivate_submissions(cls, queryset):
+        """
+        Deactivates all the ibitumbwe submissions in the passed in queryset, taking them out of
+        their balances first.  Returns the number of submissions deactivated.
+        """
+        sums = queryset.filter(is_active=True).order_by().values('wetmill', 'season').annotate(
+            Sum('cash_advanced'), Sum('cash_returned'), Sum('cash_spent'), Sum('credit_spent'))
+
+        for totals in sums:
+            cls.apply_change(totals['wetmill'], totals['season'], -get_ibitumbwe_balance_change(totals))
+
+        return queryset.update(active=False, is_active=False)
+
+    @classmethod
+    def rebuild(cls, season=None):
+        """
+        Rebuilds our balances from scratch, optionally only for the passed in season.
+        """
+        balances = cls.objects.all()
+        submissions = IbitumbweSubmission.all.filter(is_active=True)
+
+        if season:
+            balances = balances.filter(season=season)
+            submissions = submissions.filter(season=season)
+
+        balances.delete()
+
+        sums = submissions.order_by().values('wetmill', 'season').annotate(
+            Sum('cash_advanced'), Sum('cash_returned'), Sum('cash_spent'), Sum('credit_spent'),
+            Max('report_day'), Max('created'))
+
+        for totals in sums:
+            cls.objects.create(wetmill_id=totals['wetmill'], season_id=totals['season'],
+                               cash_balance=get_ibitumbwe_balance_change(totals),
+                               last_report_day=totals['report_day__max'],
+                               last_created=totals['created__max'])
+
+def capture_ibitumbwe_balance(sender, instance, raw, using, **kwargs):
+    # remember what this submission contributed to its balance before this save
+    instance._counted_balance = None
+    if instance.pk:
+        previous = IbitumbweSubmission.all.filter(pk=instance.pk, is_active=True)
+        if previous:
+            instance._counted_balance = previous[0]
+
+def update_ibitumbwe_balance(sender, instance, created, raw, using, **kwargs):
+    # take out whatever we used to count for this submission and add what we count now
+    previous = getattr(instance, '_counted_balance', None)
+    if previous:
+        IbitumbweBalance.apply_change(previous.wetmill_id, previous.season_id, -get_ibitumbwe_balance_change(previous))
+
+    if instance.is_active:
+        IbitumbweBalance.apply_change(instance.wetmill_id, instance.season_id, get_ibitumbwe_balance_change(instance),
+                                      report_day=instance.report_day, created=instance.created)
+
+    instance._counted_balance = None
+
+def remove_ibitumbwe_balance(sender, instance, using, **kwargs):
+    if instance.is_active:
+        IbitumbweBalance.apply_change(instance.wetmill_id, instance.season_id, -get_ibitumbwe_balance_change(instance))
 
 class SitokiSubmission(SMSSubmission):
     accountant = models.ForeignKey(Accountant, null=True, verbose_name=_("Accountant"))
@@ -2212,17 +2448,21 @@ class SitokiSubmission(SMSSubmission):
 
         return calculated
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
         template_vars = self.get_calculated_values()
         template_vars['wetmill'] = self.wetmill
 
-        SitokiSubmission.objects.filter(wetmill=self.wetmill, start_of_week=self.start_of_week).exclude(id=self.pk).update(active=False, is_active=False)
+        if SitokiSubmission.objects.filter(wetmill=self.wetmill, start_of_week=self.start_of_week).exclude(id=self.pk).update(active=False, is_active=False):
+            refresh_dashboard_rollup(self)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -2260,7 +2500,7 @@ class SitokiSubmission(SMSSubmission):
                 return
 
             now = datetime.now(pytz.utc)
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
             week_start = get_week_start_during(datetime_for_daylot(submission.eav.sitoki_date).date())
 
@@ -2274,6 +2514,7 @@ class SitokiSubmission(SMSSubmission):
                 # create our Sitoki Submission, they start off as NOT active
             sub = SitokiSubmission.objects.create(submission=submission,
                                                      active=False,
+                                                     pending_approval=True,
                                                      start_of_week=week_start,
                                                      accountant=submission.eav.sitoki_accountant,
                                                      wetmill=wetmill,
@@ -2288,12 +2529,10 @@ class SitokiSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, SitokiSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(SitokiSubmission.create_submission, dispatch_uid='sitoki_submission')
+# register as the handler for incoming forms
+register_xform_handler('sitoki', SitokiSubmission.create_submission)
 
 class TwakinzeSubmission(SMSSubmission):
     accountant = models.ForeignKey(Accountant, null=True, verbose_name=_("Accountant"))
@@ -2329,18 +2568,24 @@ class TwakinzeSubmission(SMSSubmission):
     def get_labels(self): # pragma: no cover
         return [ "Report Day", "Closed", "Submitted"]
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
         template_vars = dict(wetmill=self.wetmill, report_day=self.report_day)
 
         # make any other ibitumbwe or twakinze submissions on this date inactive
-        IbitumbweSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).update(active=False, is_active=False)
-        TwakinzeSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).exclude(id=self.pk).update(active=False, is_active=False)
+        deactivated = IbitumbweBalance.deactivate_submissions(IbitumbweSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day))
+        deactivated += TwakinzeSubmission.objects.filter(wetmill=self.wetmill, report_day=self.report_day).exclude(id=self.pk).update(active=False, is_active=False)
+
+        if deactivated:
+            refresh_dashboard_rollup(self)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -2369,22 +2614,22 @@ class TwakinzeSubmission(SMSSubmission):
                 return
 
             now = datetime.now(pytz.utc)
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
             day = datetime_for_daylot(submission.eav.twakinze_date).date()
 
             sub = TwakinzeSubmission.objects.create(submission=submission,
                                                     active=False,
+                                                    pending_approval=True,
                                                     report_day=day,
                                                     accountant=submission.eav.twakinze_accountant,
                                                     wetmill=wetmill,
                                                     season=season)
 
             # do our calculations and stuff them in our template
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-            approve_submission.apply_async(args=[sub, TwakinzeSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(TwakinzeSubmission.create_submission, dispatch_uid='twakinze_submission')
+# register as the handler for incoming forms
+register_xform_handler('twakinze', TwakinzeSubmission.create_submission)
 
 class IgurishaSubmission(SMSSubmission):
     # This is the green sales report
@@ -2472,7 +2717,7 @@ class IgurishaSubmission(SMSSubmission):
 
         return calculated
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
@@ -2482,7 +2727,10 @@ class IgurishaSubmission(SMSSubmission):
         IgurishaSubmission.objects.filter(wetmill=self.wetmill, sales_date=self.sales_date).exclude(id=self.pk).update(active=False, is_active=False)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -2520,11 +2768,12 @@ class IgurishaSubmission(SMSSubmission):
                 return
 
             now = datetime.now(pytz.utc)
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
                 # create our Igurisha Submission, they start off as NOT active
             sub = IgurishaSubmission.objects.create(submission=submission,
                                                      active=False,
+                                                     pending_approval=True,
                                                      sales_date=datetime.strptime(submission.eav.sales_sales_date, "%d.%m.%y"),
                                                      buyer=submission.eav.sales_buyer,
                                                      accountant=submission.eav.sales_accountant,
@@ -2540,12 +2789,10 @@ class IgurishaSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, IgurishaSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(IgurishaSubmission.create_submission, dispatch_uid='igurisha_submission')
+# register as the handler for incoming forms
+register_xform_handler('sales', IgurishaSubmission.create_submission)
 
 class DepanseSubmission(SMSSubmission):
     # This is the green expenses report
@@ -2643,7 +2890,7 @@ class DepanseSubmission(SMSSubmission):
 
         return calculated
 
-    def confirm(self):
+    def confirm(self, send_ccs=True):
         """
         Called when this message is confirmed
         """
@@ -2653,7 +2900,10 @@ class DepanseSubmission(SMSSubmission):
         DepanseSubmission.objects.filter(wetmill=self.wetmill, submission_date=self.submission_date).exclude(id=self.pk).update(active=False, is_active=False)
 
         # send off any cc's
-        send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)            
+        if send_ccs:
+            send_wetmill_ccs(self.submission.connection, self.submission.xform, self.wetmill, template_vars)
+
+        return template_vars
 
     @staticmethod
     def create_submission(sender, **kwargs):
@@ -2683,11 +2933,12 @@ class DepanseSubmission(SMSSubmission):
                 return
 
             now = datetime.now(pytz.utc)
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
+            submission.response = render_response(xform, submission.template_vars)
 
                 # create our Depanse/Expenses Submission, they start off as NOT active
             sub = DepanseSubmission.objects.create(submission=submission,
                                                      active=False,
+                                                     pending_approval=True,
                                                      submission_date=datetime.strptime(submission.eav.expenses_date, "%d.%m.%y"),
                                                      accountant=submission.eav.expenses_accountant,
                                                      wetmill=wetmill,
@@ -2703,12 +2954,10 @@ class DepanseSubmission(SMSSubmission):
 
             # do our calculations and stuff them in our template
             submission.template_vars.update(sub.get_calculated_values())
-            submission.response = XForm.render_response(xform.response, submission.template_vars)
-
-            approve_submission.apply_async(args=[sub, DepanseSubmission], countdown=ONE_HOUR)
+            submission.response = render_response(xform, submission.template_vars)
             
-# register as a listener for incoming forms
-xform_received.connect(DepanseSubmission.create_submission, dispatch_uid='depanse_submission')
+# register as the handler for incoming forms
+register_xform_handler('expenses', DepanseSubmission.create_submission)
 
 
 """
@@ -2720,28 +2969,32 @@ def roundd(value, places=".01"):
     else:
         return value.quantize(Decimal(places))
 
-def lookup_concrete_submission(sms_submission): # pragma: no cover
-    submission = AmafarangaSubmission.objects.filter(pk=sms_submission.pk)
-    if submission:
-        return submission[0]
+# the submissions used by the 2012 system, these are the only ones which can be confirmed or cancelled
+SUBMISSION_CLASSES_2012 = (AmafarangaSubmission, IbitumbweSubmission, SitokiSubmission,
+                           TwakinzeSubmission, IgurishaSubmission, DepanseSubmission)
 
-    submission = IbitumbweSubmission.objects.filter(pk=sms_submission.pk)
-    if submission:
-        return submission[0]
+def get_submission_class(submission_type):
+    """
+    Returns the model class for the passed in submission type, or None if it isn't one of the 2012 submissions
+    """
+    if not submission_type:
+        return None
 
-    submission = SitokiSubmission.objects.filter(pk=sms_submission.pk)
-    if submission:
-        return submission[0]
+    for clazz in SUBMISSION_CLASSES_2012:
+        if clazz._meta.module_name == submission_type:
+            return clazz
 
-    submission = TwakinzeSubmission.objects.filter(pk=sms_submission.pk)
-    if submission:
-        return submission[0]
+    return None
 
-    submission = IgurishaSubmission.objects.filter(pk=sms_submission.pk)
-    if submission:
-        return submission[0]
+def lookup_concrete_submission(sms_submission):
+    """
+    Returns the active concrete submission for the passed in SMSSubmission, or None if there isn't one.
+    """
+    clazz = get_submission_class(sms_submission.submission_type)
+    if not clazz:
+        return None
 
-    submission = DepanseSubmission.objects.filter(pk=sms_submission.pk)
+    submission = clazz.objects.filter(pk=sms_submission.pk)
     if submission:
         return submission[0]
 
@@ -2789,8 +3042,9 @@ def ok(sender, **kwargs):
 
         # if we found the submission, make it active
         if confirm_message:
-            # mark the message as active
+            # mark the message as active, it no longer needs to be approved
             confirm_message.active = True
+            confirm_message.pending_approval = False
             confirm_message.save()
 
             concrete = lookup_concrete_submission(confirm_message)
@@ -2809,7 +3063,86 @@ def ok(sender, **kwargs):
             submission.response = Blurb.get(xform, 'no_confirm', dict(),
                                             "No previous submission found to confirm.")
 
-xform_received.connect(ok, dispatch_uid='ok')
+register_xform_handler('ok', ok)
+
+def find_superseded_submissions(clazz, pending):
+    """
+    Given a list of pending submissions of the passed in class, returns the set of ids of those
+    which were followed by another submission from the same accountant and wetmill within our
+    approval delay.  This is done in a single query for all the pending submissions.
+    """
+    if not pending:
+        return set()
+
+    start = min([sub.created for sub in pending])
+    end = max([sub.created for sub in pending]) + APPROVAL_DELAY
+
+    # group everything sent in our window by accountant and wetmill, in the order it was sent
+    sent = dict()
+    for row in clazz.all.filter(created__gte=start, created__lt=end,
+                                wetmill__in=set([sub.wetmill_id for sub in pending])).order_by('created').values('accountant', 'wetmill', 'created'):
+        sent.setdefault((row['accountant'], row['wetmill']), []).append(row['created'])
+
+    superseded = set()
+    for sub in pending:
+        times = sent.get((sub.accountant_id, sub.wetmill_id), [])
+        later = bisect_right(times, sub.created)
+
+        if later < len(times) and times[later] < sub.created + APPROVAL_DELAY:
+            superseded.add(sub.pk)
+
+    return superseded
+
+def approve_pending_submissions(now=None):
+    """
+    Approves every submission which has been pending for longer than our approval delay without being
+    corrected by a later submission.  Approvals are done in the order the submissions were sent, inside
+    a single transaction, and any CCs are only sent once everything has been committed.
+
+    Returns a list of the submissions that were approved.
+    """
+    if not now:
+        now = datetime.now()
+
+    cutoff = now - APPROVAL_DELAY
+
+    approved = []
+    decided = []
+    for clazz in SUBMISSION_CLASSES_2012:
+        pending = list(clazz.all.filter(pending_approval=True, active=False, created__lte=cutoff).select_related('submission'))
+        superseded = find_superseded_submissions(clazz, pending)
+
+        decided += [sub.pk for sub in pending]
+        approved += [sub for sub in pending if sub.pk not in superseded]
+
+    # activate in the order they were sent so later submissions for the same day replace earlier ones
+    approved.sort(key=lambda sub: (sub.created, sub.pk))
+    ccs = []
+
+    with transaction.commit_on_success():
+        SMSSubmission.all.filter(pk__in=decided).update(pending_approval=False)
+
+        for sub in approved:
+            sub.active = True
+            sub.is_active = True
+            sub.pending_approval = False
+            sub.save()
+
+            ccs.append((sub, sub.confirm(send_ccs=False)))
+
+    for sub, template_vars in ccs:
+        if sub.submission:
+            send_wetmill_ccs(sub.submission.connection, sub.submission.xform, sub.wetmill, template_vars)
+
+    return approved
+
+def refresh_dashboard_rollup(submission):
+    """
+    Refreshes the dashboard rollup for the wetmill and season of the passed in submission.  Saving a
+    submission does this on its own, this is for when others are deactivated without being saved.
+    """
+    from dashboard.models import WetmillSeasonRollup
+    WetmillSeasonRollup.refresh(submission.wetmill_id, submission.season_id)
 
 def deactivate_daily_dupes(sender, instance, raw, using, **kwargs):
     # active instance, we need to make others inactive
@@ -2825,7 +3158,7 @@ def deactivate_daily_dupes(sender, instance, raw, using, **kwargs):
         if instance.pk and sender == TwakinzeSubmission:
             filter = filter.exclude(pk=instance.pk)
 
-        filter.update(active=False, is_active=False)
+        deactivated = filter.update(active=False, is_active=False)
 
         filter = IbitumbweSubmission.objects.filter(active=True,
                                                     season=instance.season,
@@ -2835,7 +3168,12 @@ def deactivate_daily_dupes(sender, instance, raw, using, **kwargs):
         if instance.pk and sender == IbitumbweSubmission:
             filter = filter.exclude(pk=instance.pk)
 
-        filter.update(active=False, is_active=False)
+        deactivated += IbitumbweBalance.deactivate_submissions(filter)
+
+        # our rollups are refreshed when ibitumbwe and twakinze submissions are saved, but not when
+        # sales or expenses deactivate them
+        if deactivated and sender in (IgurishaSubmission, DepanseSubmission):
+            refresh_dashboard_rollup(instance)
 
         if instance.pk and sender == DepanseSubmission:
         
@@ -2880,3 +3218,7 @@ pre_save.connect(deactivate_daily_dupes, sender=IbitumbweSubmission, dispatch_ui
 pre_save.connect(deactivate_daily_dupes, sender=TwakinzeSubmission, dispatch_uid="deactivate_twakinze_dupes")
 pre_save.connect(deactivate_daily_dupes, sender=IgurishaSubmission, dispatch_uid="deactivate_igurisha_dupes")
 pre_save.connect(deactivate_daily_dupes, sender=DepanseSubmission, dispatch_uid="deactivate_depanse_dupes")
+
+pre_save.connect(capture_ibitumbwe_balance, sender=IbitumbweSubmission, dispatch_uid="capture_ibitumbwe_balance")
+post_save.connect(update_ibitumbwe_balance, sender=IbitumbweSubmission, dispatch_uid="update_ibitumbwe_balance")
+post_delete.connect(remove_ibitumbwe_balance, sender=IbitumbweSubmission, dispatch_uid="remove_ibitumbwe_balance")
@@ -1,13 +1,35 @@
 from celery.task import task
+from django.conf import settings
 import datetime
+import redis
 
 from celery.contrib import rdb
 
+@task(track_started=True)
+def approve_submissions(): # pragma: no cover
+    """
+    Approves all the submissions which have been waiting for more than an hour without a correction
+    """
+    from .models import approve_pending_submissions
+
+    # we use redis to make sure only one approval runs at a time
+    r = redis.StrictRedis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=settings.REDIS_DB)
+
+    with r.lock('approve_submissions', timeout=300):
+        approved = approve_pending_submissions()
+
+    for submission in approved:
+        print "[%d] %s : confirmed" % (submission.pk, submission)
+
 @task(track_started=True)
 def approve_submission(submission, clazz): # pragma: no cover
+    """
+    No longer scheduled, approve_submissions takes care of this in batches.  This is only kept
+    around so that any approvals still queued from before can be processed.
+    """
     hour_later = submission.created + datetime.timedelta(minutes=59)
     now = datetime.datetime.now()
-    
+
     if now >= hour_later and not clazz.all.filter(created__gt=submission.created,
                                                   created__lt=hour_later,
                                                   accountant=submission.accountant,
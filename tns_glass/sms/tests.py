@@ -317,6 +317,89 @@ class SMSTest(TNSTestCase):
         msg = self.sms("4", "leave")
         self.sms("4", "who", False)
 
+    def test_dispatch(self):
+        # each keyword maps to exactly one handler
+        self.assertEquals(ok, XFORM_HANDLERS['ok'])
+        self.assertEquals(IbitumbweSubmission.create_day_submission, XFORM_HANDLERS['day'])
+        self.assertEquals(IgurishaSubmission.create_submission, XFORM_HANDLERS['sales'])
+
+        # only the matching handler gets called
+        called = []
+        original = XFORM_HANDLERS['who']
+        register_xform_handler('who', lambda sender, **kwargs: called.append(kwargs['xform'].get_primary_keyword()))
+
+        try:
+            self.sms("1", "who")
+            self.sms("1", "acc Nasho Newcomer")
+            self.assertEquals(['who'], called)
+        finally:
+            register_xform_handler('who', original)
+
+    def test_lookup_cache(self):
+        lookup_cache.invalidate()
+        stats = lookup_cache.get_stats()
+
+        # first lookup is a miss, second a hit
+        self.assertEquals(self.tanzania, get_country_for_backend('tz'))
+        self.assertEquals(self.tanzania, get_country_for_backend('TZ'))
+        self.assertEquals(stats['misses'] + 1, lookup_cache.get_stats()['misses'])
+        self.assertEquals(stats['hits'] + 1, lookup_cache.get_stats()['hits'])
+
+        self.assertEquals(self.tz_season, get_season(self.tanzania))
+        self.assertEquals(self.tz_season, get_season(self.tanzania))
+        self.assertEquals(stats['hits'] + 2, lookup_cache.get_stats()['hits'])
+
+        # saving a season invalidates our cache
+        version = lookup_cache.get_stats()['version']
+        self.tz_season.is_active = False
+        self.tz_season.save()
+        self.assertEquals(version + 1, lookup_cache.get_stats()['version'])
+
+        tz_2014 = Season.objects.create(name='2014', country=self.tanzania, exchange_rate=Decimal("585.00"),
+                                        default_adjustment=Decimal("0.16"), farmer_income_baseline=Decimal("100"),
+                                        fob_price_baseline="1.15", has_members=True,
+                                        created_by=self.admin, modified_by=self.admin)
+        self.assertEquals(tz_2014, get_season(self.tanzania))
+
+    def test_template_cache(self):
+        from blurbs.models import template_cache
+        template_cache.invalidate()
+
+        xform = XForm.objects.get(keyword='ibitumbwe')
+
+        # first render compiles our template and creates our blurb, the second is served from our cache
+        self.assertEquals("Hello Eric", Blurb.get(xform, 'cache-test', dict(name="Eric"), "Hello {{ name }}"))
+        self.assertEquals("Hello Nic", Blurb.get(xform, 'cache-test', dict(name="Nic"), "Hello {{ name }}"))
+
+        stats = template_cache.get_stats()
+        self.assertEquals(1, stats['misses'])
+        self.assertEquals(1, stats['hits'])
+
+        # changing our blurb throws away our cache
+        blurb = Blurb.objects.get(form=xform, slug='cache-test')
+        blurb.message = "Bonjour {{ name }}"
+        blurb.save()
+        self.assertEquals(0, template_cache.get_stats()['size'])
+        self.assertEquals("Bonjour Eric", Blurb.get(xform, 'cache-test', dict(name="Eric"), "Hello {{ name }}"))
+
+        # edits made without any signals, as in another process, are picked up too
+        Blurb.objects.filter(form=xform, slug='cache-test').update(message="Muraho {{ name }}")
+        self.assertEquals("Muraho Eric", Blurb.get(xform, 'cache-test', dict(name="Eric"), "Hello {{ name }}"))
+
+        # ccs share the same cache
+        cc = MessageCC.objects.get(slug='ibitumbwe')
+        self.assertEquals(cc.render_message(dict()), cc.render_message(dict()))
+        self.assertEquals(3, template_cache.get_stats()['size'])
+
+        # as do xform responses
+        from blurbs.models import render_response
+        xform.response = "Thanks {{ name }}"
+        self.assertEquals("Thanks Eric", render_response(xform, dict(name="Eric")))
+        self.assertEquals("Thanks Nic", render_response(xform, dict(name="Nic")))
+        self.assertEquals(4, template_cache.get_stats()['size'])
+        self.assertEquals(XForm.render_response(xform.response, dict(name="Eric")),
+                          render_response(xform, dict(name="Eric")))
+
     def test_daylot(self):
         tzname = settings.USER_TIME_ZONE
         tz = pytz.timezone(tzname)
@@ -672,6 +755,9 @@ class SMSTest(TNSTestCase):
         self.assertEquals("16,000", variables['cash_balance'])
         self.assertEquals("12.03.12", variables['day'])
 
+        # our running balance only includes the confirmed message so far
+        self.assertDecimalEquals("13000", IbitumbweBalance.objects.get(wetmill=self.nasho, season=self.season).cash_balance)
+
         msg = self.sms("1", "OK")
 
         # clear our observer messages
@@ -713,6 +799,87 @@ class SMSTest(TNSTestCase):
         self.assertFalse(IbitumbweSubmission.objects.filter(report_day=report_day))
         self.assertTrue(TwakinzeSubmission.objects.filter(report_day=report_day))
 
+        # our running balance should still match the sum of all our active submissions
+        totals = IbitumbweSubmission.objects.filter(wetmill=self.nasho, season=self.season).aggregate(
+            Sum('cash_advanced'), Sum('cash_returned'), Sum('cash_spent'), Sum('credit_spent'))
+        balance = IbitumbweBalance.objects.get(wetmill=self.nasho, season=self.season)
+        self.assertDecimalEquals(get_ibitumbwe_balance_change(totals), balance.cash_balance)
+
+        # and rebuilding it from scratch gives us the same thing
+        IbitumbweBalance.rebuild(self.season)
+        self.assertDecimalEquals(balance.cash_balance, IbitumbweBalance.objects.get(wetmill=self.nasho, season=self.season).cash_balance)
+
+    def test_batch_approval(self):
+        acc = self.sms("1", "acc Nasho Nicolas")
+        obs = self.sms("2", "obs Nasho Eric")
+        self.nasho.set_accounting_for_season(self.season, '2012')
+
+        # send a message, then correct it
+        self.sms("1", "ibitumbwe 10000 1000 5000 1000 60 12.01.12")
+        self.sms("1", "ibitumbwe 20000 1000 5000 1000 60 12.01.12")
+
+        # nothing is old enough to approve yet
+        self.assertEquals(0, len(approve_pending_submissions()))
+        self.assertFalse(IbitumbweSubmission.objects.all())
+
+        # pretend both were sent over an hour ago, a minute apart
+        first, second = IbitumbweSubmission.all.order_by('created', 'pk')
+        an_hour_ago = datetime.now() - timedelta(minutes=90)
+        SMSSubmission.all.filter(pk=first.pk).update(created=an_hour_ago)
+        SMSSubmission.all.filter(pk=second.pk).update(created=an_hour_ago + timedelta(minutes=1))
+
+        # only the correction should be approved
+        approved = approve_pending_submissions()
+        self.assertEquals([second.pk], [sub.pk for sub in approved])
+
+        sub = IbitumbweSubmission.objects.get()
+        self.assertEquals(second.pk, sub.pk)
+        self.assertTrue(sub.is_active)
+        self.assertDecimalEquals("20000", sub.cash_advanced)
+        self.assertDecimalEquals("13000", IbitumbweBalance.objects.get(wetmill=self.nasho, season=self.season).cash_balance)
+
+        # our observer got the CC
+        self.assertEquals(1, Message.objects.filter(connection=obs.connection).count())
+
+        # nothing is left pending, so running again does nothing
+        self.assertFalse(SMSSubmission.all.filter(pending_approval=True))
+        self.assertEquals(0, len(approve_pending_submissions()))
+        self.assertEquals(1, Message.objects.filter(connection=obs.connection).count())
+
+        # messages which were confirmed then undone are never approved
+        self.sms("1", "ibitumbwe 10000 1000 5000 1000 60 13.01.12")
+        self.sms("1", "ok")
+        self.sms("1", "undo")
+
+        SMSSubmission.all.update(created=an_hour_ago)
+        self.assertEquals(0, len(approve_pending_submissions()))
+        self.assertEquals(1, IbitumbweSubmission.objects.all().count())
+
+    def test_concrete_lookup(self):
+        self.sms("1", "acc Nasho Nicolas")
+        self.nasho.set_accounting_for_season(self.season, '2012')
+
+        self.sms("1", "ibitumbwe 10000 1000 5000 1000 60 12.01.12")
+        self.sms("1", "twakinze 13.01.12")
+
+        ibitumbwe = IbitumbweSubmission.all.get()
+        twakinze = TwakinzeSubmission.all.get()
+
+        # our submissions know what type they are
+        self.assertEquals('ibitumbwesubmission', SMSSubmission.all.get(pk=ibitumbwe.pk).submission_type)
+        self.assertEquals('twakinzesubmission', SMSSubmission.all.get(pk=twakinze.pk).submission_type)
+
+        # only active submissions are found one at a time
+        self.assertIsNone(lookup_concrete_submission(SMSSubmission.all.get(pk=ibitumbwe.pk)))
+        self.sms("1", "ok")
+        self.assertEquals(twakinze, lookup_concrete_submission(SMSSubmission.all.get(pk=twakinze.pk)))
+
+        # only the 2012 submissions can be resolved, older ones have nothing to confirm
+        self.assertEquals(IgurishaSubmission, get_submission_class('igurishasubmission'))
+        self.assertIsNone(get_submission_class('storesubmission'))
+        self.assertIsNone(get_submission_class('smssubmission'))
+        self.assertIsNone(get_submission_class(None))
+
     def test_twakinze(self):
         # try to send a message to nasho, should fail because we aren't an accountant
         msg = self.sms("1", "twakinze 12.01.12", False)
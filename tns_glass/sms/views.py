@@ -69,6 +69,7 @@ class SubmissionDeleteView(CheckEditPermission, SmartUpdateView):
         obj = super(SubmissionDeleteView, self).pre_save(obj)
         obj.active = False
         obj.is_active = False
+        obj.pending_approval = False
 
         return obj
 
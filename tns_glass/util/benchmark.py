@@ -0,0 +1,275 @@
+import gc
+import random
+import resource
+import time
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection, reset_queries
+
+CENTS = Decimal(".01")
+
+class NullOutput(object):
+    """
+    A file that throws away everything written to it, our PDFs are rendered into one of these
+    """
+    def write(self, data):
+        pass
+
+    def flush(self):
+        pass
+
+def get_peak_memory():
+    """
+    Returns the peak resident memory of this process so far in kilobytes.  This only ever goes up,
+    so a benchmark that doesn't move it didn't use more memory than the ones before it.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def measure(name, func, iterations=1):
+    """
+    Calls func iterations times, returning a dict with the wall times, the number of queries run by
+    the first iteration and the peak memory of our process once done.
+    """
+    times = []
+    queries = None
+
+    # count our queries the same way assertNumQueries does
+    debug_cursor = connection.use_debug_cursor
+    connection.use_debug_cursor = True
+
+    try:
+        for i in range(iterations):
+            gc.collect()
+            reset_queries()
+
+            start = time.time()
+            func()
+            times.append(time.time() - start)
+
+            if queries is None:
+                queries = len(connection.queries)
+    finally:
+        connection.use_debug_cursor = debug_cursor
+        reset_queries()
+
+    return dict(name=name, iterations=iterations, queries=queries,
+                total_seconds=sum(times), mean_seconds=sum(times) / len(times),
+                min_seconds=min(times), max_seconds=max(times),
+                peak_memory_kb=get_peak_memory())
+
+class SeasonGenerator(object):
+    """
+    Builds a synthetic season with a configurable number of wetmills, grades, expenses and sales
+    so that we can time our report calculations and PDFs against a realistic amount of data.  The
+    same seed always builds the same season.
+    """
+    def __init__(self, user, wetmills=20, grades=6, expenses=10, sales=5, seed=42):
+        self.user = user
+        self.wetmill_count = wetmills
+        self.grade_count = grades
+        self.expense_count = expenses
+        self.sale_count = sales
+        self.random = random.Random(seed)
+
+    def create(self, model, **kwargs):
+        return model.objects.create(created_by=self.user, modified_by=self.user, **kwargs)
+
+    def build(self, model, **kwargs):
+        return model(created_by=self.user, modified_by=self.user, **kwargs)
+
+    def amount(self, low, high):
+        return Decimal(self.random.randint(low * 100, high * 100)) / 100
+
+    def generate(self):
+        """
+        Creates our season, its configuration and a finalized report and scorecard for each of our
+        wetmills.  Returns the season.
+        """
+        from locales.models import Currency, Weight, Country, Province
+        from seasons.models import Season
+
+        self.local = self.create(Currency, name="Rwandan Francs", currency_code='RWF', abbreviation='RWF',
+                                 has_decimals=False, suffix=" RWF")
+        self.usd = self.create(Currency, name="US Dollars", currency_code='USD', abbreviation='US$',
+                               has_decimals=True, prefix="$")
+        self.kilogram = self.create(Weight, name="Kilograms", abbreviation="Kg", ratio_to_kilogram="1")
+
+        self.country = self.create(Country, name="Rwanda", country_code='RW', currency=self.local, weight=self.kilogram,
+                                   calling_code='250', phone_format='#### ## ## ##', national_id_format='# #### # ####### # ##',
+                                   bounds_zoom='6', bounds_lat='-1.333', bounds_lng='29.232', language='rw')
+        self.province = self.create(Province, name="Gitega", country=self.country, order=1)
+
+        self.season = self.create(Season, name='2012', country=self.country, exchange_rate=Decimal("585.00"),
+                                  default_adjustment=Decimal("0.16"), has_members=True,
+                                  farmer_income_baseline=Decimal("100"), fob_price_baseline=Decimal("1.15"))
+
+        self.configure_season()
+
+        for index in range(self.wetmill_count):
+            self.generate_wetmill(index)
+
+        return self.season
+
+    def configure_season(self):
+        from grades.models import Grade
+        from expenses.models import Expense
+        from cashuses.models import CashUse
+        from farmerpayments.models import FarmerPayment
+        from standards.models import StandardCategory, Standard
+
+        season = self.season
+
+        # our grades, green grades are split into as many screens as we were asked for
+        self.cherry = self.create(Grade, name="Cherry", kind='CHE', order=0)
+        self.parchment = self.create(Grade, name="Parchment", kind='PAR', order=1)
+        self.green = self.create(Grade, name="Green", kind='GRE', order=2)
+        season.add_grade(self.cherry)
+        season.add_grade(self.parchment)
+        season.add_grade(self.green)
+
+        self.green_grades = []
+        for index in range(self.grade_count):
+            grade = self.create(Grade, name="Screen %d" % (index + 10), kind='GRE', order=index, parent=self.green)
+            season.add_grade(grade, is_top=index == 0)
+            self.green_grades.append(grade)
+
+        # our expenses, split between washing station expenses and capex in dollars
+        washing = self.create(Expense, name="Washing Station Expenses", order=1)
+        capex = self.create(Expense, name="CAPEX Financing Expenses", order=2, in_dollars=True)
+        season.add_expense(washing)
+        season.add_expense(capex)
+
+        self.expenses = []
+        for index in range(self.expense_count):
+            if index % 4 == 3:
+                expense = self.create(Expense, name="Capex %d" % index, order=index, parent=capex, in_dollars=True)
+            else:
+                expense = self.create(Expense, name="Expense %d" % index, order=index, parent=washing, is_advance=index == 0)
+
+            season.add_expense(expense)
+            self.expenses.append(expense)
+
+        self.cash_uses = [self.create(CashUse, name="Dividend", order=0),
+                          self.create(CashUse, name="Second Payment", order=1)]
+        for cash_use in self.cash_uses:
+            season.add_cash_use(cash_use)
+
+        self.farmer_payments = [self.create(FarmerPayment, name="Dividend", order=0),
+                                self.create(FarmerPayment, name="Second Payment", order=1)]
+        season.add_farmer_payment(self.farmer_payments[0], 'MEM')
+        season.add_farmer_payment(self.farmer_payments[1], 'BOT')
+
+        # and a handful of standards for our scorecards
+        self.standards = []
+        for index, acronym in enumerate(('SRE', 'OHS', 'ENV')):
+            category = self.create(StandardCategory, name="Category %s" % acronym, acronym=acronym, order=index)
+            for order in range(4):
+                standard = self.create(Standard, name="Standard %s %d" % (acronym, order), category=category,
+                                       kind='MR' if order < 2 else 'BP', order=order)
+                season.add_standard(standard)
+                self.standards.append(standard)
+
+    def generate_wetmill(self, index):
+        from wetmills.models import Wetmill
+        from reports.models import Report, ExpenseEntry, Production, Sale, SaleComponent, CashUseEntry, FarmerPaymentEntry
+        from scorecards.models import Scorecard, StandardEntry
+
+        wetmill = self.create(Wetmill, name="Wetmill %d" % index, sms_name="wetmill%d" % index, country=self.country,
+                              province=self.province, year_started=2008,
+                              latitude=Decimal("-2.278038"), longitude=Decimal("30.643084"))
+        wetmill.set_accounting_for_season(self.season, '2012')
+
+        cherry = self.amount(50000, 100000)
+        green = (cherry / Decimal("6")).quantize(CENTS)
+
+        report = self.create(Report, wetmill=wetmill, season=self.season, farmers=self.random.randint(100, 1000),
+                             capacity=cherry, cherry_production_by_members=(cherry / Decimal("2")).quantize(CENTS),
+                             working_capital=self.amount(1000000, 5000000), working_capital_repaid=self.amount(100000, 500000),
+                             miscellaneous_revenue=Decimal("0"), is_finalized=True)
+
+        entries = []
+        for expense in self.expenses:
+            if expense.in_dollars:
+                entries.append(self.build(ExpenseEntry, report=report, expense=expense, value=self.amount(100, 1000),
+                                          exchange_rate=self.amount(570, 600)))
+            else:
+                entries.append(self.build(ExpenseEntry, report=report, expense=expense, value=self.amount(10000, 1000000)))
+        ExpenseEntry.objects.bulk_create(entries)
+
+        production = [self.build(Production, report=report, grade=self.cherry, volume=cherry),
+                      self.build(Production, report=report, grade=self.parchment, volume=(cherry / Decimal("5")).quantize(CENTS))]
+        for grade in self.green_grades:
+            production.append(self.build(Production, report=report, grade=grade, volume=(green / len(self.green_grades)).quantize(CENTS)))
+        Production.objects.bulk_create(production)
+
+        for index in range(self.sale_count):
+            grade = self.green_grades[index % len(self.green_grades)]
+            if index % 2:
+                sale = self.create(Sale, report=report, date=date(2012, 6, 1), buyer="Buyer %d" % index, currency=self.usd,
+                                   price=self.amount(3, 5), exchange_rate=self.amount(570, 600), sale_type='FOT')
+            else:
+                sale = self.create(Sale, report=report, date=date(2012, 6, 1), buyer="Buyer %d" % index, currency=self.local,
+                                   price=self.amount(1500, 2500), sale_type='FOB')
+            self.create(SaleComponent, sale=sale, grade=grade, volume=(green / self.sale_count).quantize(CENTS))
+
+        CashUseEntry.objects.bulk_create([self.build(CashUseEntry, report=report, cash_use=cash_use, value=self.amount(10000, 50000))
+                                          for cash_use in self.cash_uses])
+        FarmerPaymentEntry.objects.bulk_create([self.build(FarmerPaymentEntry, report=report, farmer_payment=payment,
+                                                           member_per_kilo=self.amount(100, 200), non_member_per_kilo=self.amount(50, 150))
+                                                for payment in self.farmer_payments])
+
+        scorecard = self.create(Scorecard, season=self.season, wetmill=wetmill, is_finalized=True)
+        StandardEntry.objects.bulk_create([self.build(StandardEntry, scorecard=scorecard, standard=standard,
+                                                      value=self.random.choice((0, 100, -1)))
+                                           for standard in self.standards])
+
+def run_benchmarks(season, iterations=1):
+    """
+    Times calculating the metrics of each report, finalizing the season and rendering the report and
+    scorecard PDFs for each wetmill in the passed in season.  Returns a list of results, one per
+    benchmark.
+    """
+    from reports.models import Report
+    from reports.pdf.render import PDFReport
+    from scorecards.models import Scorecard
+    from scorecards.pdf.render import PDFScorecard
+    from aggregates.models import SeasonAggregate
+    from locales.models import Currency
+
+    reports = list(Report.objects.filter(season=season).select_related('wetmill', 'season', 'season__country'))
+    scorecards = list(Scorecard.objects.filter(season=season).select_related('wetmill', 'season', 'season__country'))
+    usd = Currency.objects.get(currency_code='USD')
+    weight = season.country.weight
+
+    def calculate_metrics():
+        for report in reports:
+            report.calculate_metrics()
+
+    def finalize():
+        SeasonAggregate.calculate_for_season(season)
+
+    def render_reports():
+        for report in reports:
+            PDFReport(report, usd, weight, report_mode='TR').render(NullOutput())
+
+    def render_scorecards():
+        for scorecard in scorecards:
+            PDFScorecard(scorecard).render(NullOutput())
+
+    results = [measure('Report.calculate_metrics', calculate_metrics, iterations),
+               measure('SeasonAggregate.calculate_for_season', finalize, iterations)]
+
+    # the season is finalized now, reload our reports so they render with their graphs
+    reports = list(Report.objects.filter(season=season).select_related('wetmill', 'season', 'season__country'))
+
+    results += [measure('PDFReport.render', render_reports, iterations),
+                measure('PDFScorecard.render', render_scorecards, iterations)]
+
+    # add our per report and per scorecard means
+    for result in results:
+        count = len(scorecards) if result['name'] == 'PDFScorecard.render' else len(reports)
+        result['items'] = count
+        result['mean_seconds_per_item'] = result['mean_seconds'] / count if count else None
+
+    return results
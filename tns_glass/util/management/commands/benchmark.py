@@ -0,0 +1,105 @@
+import json
+import os
+import subprocess
+import tempfile
+
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections, load_backend, DEFAULT_DB_ALIAS
+
+class Command(BaseCommand):
+    """
+    Builds a synthetic season in a throwaway SQLite database and times the slow parts of our
+    reporting against it: calculating report metrics, finalizing the season and rendering the
+    report and scorecard PDFs.  Results are printed as JSON so runs can be compared over time.
+    """
+    help = 'Benchmarks report metrics, season finalization and PDF rendering against a synthetic season'
+    option_list = BaseCommand.option_list + (
+        make_option('--wetmills', type='int', dest='wetmills', default=20,
+                    help='The number of wetmills (and reports) to generate.'),
+        make_option('--grades', type='int', dest='grades', default=6,
+                    help='The number of green grades in the season.'),
+        make_option('--expenses', type='int', dest='expenses', default=10,
+                    help='The number of expenses in the season.'),
+        make_option('--sales', type='int', dest='sales', default=5,
+                    help='The number of sales for each report.'),
+        make_option('--iterations', type='int', dest='iterations', default=1,
+                    help='How many times to run each benchmark.'),
+        make_option('--seed', type='int', dest='seed', default=42,
+                    help='The seed used to generate our season.'),
+        make_option('--output', dest='output', default=None,
+                    help='Write our results to this file instead of stdout.'),)
+
+    def handle(self, *args, **options):
+        from django.contrib.auth.models import User
+        from south.management.commands import patch_for_test_db_setup
+        from util.benchmark import SeasonGenerator, run_benchmarks
+
+        # build our season in a database file of our own that we remove when done
+        (fd, db_path) = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        connection = self.use_throwaway_database(db_path)
+
+        verbosity = int(options.get('verbosity', 1))
+
+        patch_for_test_db_setup()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+        try:
+            user = User.objects.create_user('benchmark', 'benchmark@benchmark.com', 'benchmark')
+
+            generator = SeasonGenerator(user, wetmills=options['wetmills'], grades=options['grades'],
+                                        expenses=options['expenses'], sales=options['sales'], seed=options['seed'])
+            if verbosity > 1:
+                self.stderr.write("Generating season with %d wetmills.\n" % options['wetmills'])
+
+            season = generator.generate()
+            results = run_benchmarks(season, iterations=options['iterations'])
+
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            if os.path.exists(db_path):
+                os.remove(db_path)
+
+        output = dict(revision=self.get_revision(),
+                      options=dict((key, options[key]) for key in ('wetmills', 'grades', 'expenses', 'sales',
+                                                                   'iterations', 'seed')),
+                      results=results)
+        output = json.dumps(output, indent=2)
+
+        if options['output']:
+            with open(options['output'], 'w') as out:
+                out.write(output)
+        else:
+            self.stdout.write(output + "\n")
+
+    def use_throwaway_database(self, path):
+        """
+        Points our default connection at a new SQLite database at the passed in path, whatever database
+        we are configured to use, so our benchmarks never touch real data and always run against the
+        same engine.  Returns the new connection.
+        """
+        connections[DEFAULT_DB_ALIAS].close()
+
+        settings_dict = dict(connections.databases[DEFAULT_DB_ALIAS])
+        settings_dict.update(ENGINE='django.db.backends.sqlite3', NAME=path, TEST_NAME=path,
+                             USER='', PASSWORD='', HOST='', PORT='', OPTIONS={})
+
+        connections.databases[DEFAULT_DB_ALIAS] = settings_dict
+
+        connection = load_backend(settings_dict['ENGINE']).DatabaseWrapper(settings_dict, DEFAULT_DB_ALIAS)
+        setattr(connections._connections, DEFAULT_DB_ALIAS, connection)
+        return connection
+
+    def get_revision(self):
+        """
+        Returns the git revision we are running, if we can find it
+        """
+        try:
+            return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=settings.PROJECT_DIR,
+                                           stderr=open(os.devnull, 'w')).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
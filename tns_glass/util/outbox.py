@@ -0,0 +1,101 @@
+import time
+import logging
+
+from django.utils.translation import trans_real
+from rapidsms_httprouter.router import get_router
+
+logger = logging.getLogger(__name__)
+
+class Outbox(object):
+    """
+    Collects outgoing messages so they can be rendered and sent in batches.
+
+    Messages are rendered grouped by language, so we only switch languages once per group instead
+    of once per recipient, and are handed to the router in batches.  Any many to many links
+    to the sent messages (such as Broadcast.messages) are written with a single insert per batch.
+    """
+    def __init__(self, batch_size=200, links=None, verbose=False):
+        self.batch_size = batch_size
+        self.links = links if links is not None else []
+        self.verbose = verbose
+        self.pending = []
+        self.timings = []
+
+    def add(self, connection, render, language=None):
+        """
+        Adds a message for the passed in connection.  render will be called with language active
+        and should return the text of the message, messages with no text are not sent.
+        """
+        self.pending.append((connection, render, language))
+
+    def add_links(self, related):
+        """
+        Adds a many to many manager, such as broadcast.messages, that all our messages should be added to.
+        """
+        self.links.append(related)
+
+    def send(self):
+        """
+        Renders and sends all our pending messages, returning the messages that were sent.  Messages
+        which fail to render or send are logged and skipped.
+        """
+        router = get_router()
+        orig = trans_real.get_language()
+
+        # group our messages by language, keeping the order they were added in otherwise
+        languages = dict()
+        for connection, render, language in self.pending:
+            languages.setdefault(language, len(languages))
+        pending = sorted(self.pending, key=lambda message: languages[message[2]])
+        self.pending = []
+
+        sent = []
+        try:
+            active = None
+            for start in range(0, len(pending), self.batch_size):
+                started = time.time()
+                batch = []
+
+                for connection, render, language in pending[start:start + self.batch_size]:
+                    if language != active:
+                        trans_real.activate(language if language else orig)
+                        active = language
+
+                    # one bad recipient shouldn't keep everybody else from getting their message
+                    try:
+                        text = render()
+
+                        # ignore messages that have no content (if statements make this possible)
+                        if text:
+                            batch.append(router.add_outgoing(connection, text))
+
+                    except Exception:
+                        logger.exception("Error sending message to %s" % connection)
+
+                for related in self.links:
+                    add_messages(related, batch)
+
+                elapsed = time.time() - started
+                self.timings.append(dict(messages=len(batch), seconds=elapsed))
+                if self.verbose: # pragma: no cover
+                    print "-- sent %d messages in %.2f seconds" % (len(batch), elapsed)
+
+                sent += batch
+        finally:
+            trans_real.activate(orig)
+
+        return sent
+
+def add_messages(related, messages):
+    """
+    Adds the passed in messages to a many to many manager using a single insert.  The messages
+    must not already be linked.
+    """
+    if not messages:
+        return
+
+    through = related.through
+    source = '%s_id' % related.source_field_name
+    target = '%s_id' % related.target_field_name
+
+    through.objects.bulk_create([through(**{source: related.instance.pk, target: message.pk}) for message in messages])
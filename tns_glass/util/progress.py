@@ -0,0 +1,34 @@
+from datetime import datetime
+from django.db import connections
+
+# the alias of the connection task progress is saved on, it points at the same database as default
+PROGRESS_DATABASE = 'progress'
+
+def get_progress_logger(task):
+    """
+    Returns a callable which adds a message to the log of the passed in task, a FinalizeTask or
+    ReportExportTask for example, and saves it right away.
+
+    Our tasks do all their work inside a single transaction, saving the log on that same connection
+    would keep anybody from seeing any progress until the task was over.  Instead the log is saved
+    on a connection of its own, where it is committed as soon as it is written.
+
+    SQLite locks the whole database for the first write of a transaction, so a second connection
+    couldn't write until the task was done, and an in memory database can't be shared at all.  There
+    the log is saved on the task's own connection instead and shows up when the task commits.
+    """
+    if connections['default'].vendor == 'sqlite':
+        alias = 'default'
+    else:
+        alias = PROGRESS_DATABASE
+        if PROGRESS_DATABASE not in connections.databases:
+            connections.databases[PROGRESS_DATABASE] = dict(connections.databases['default'])
+
+    def log(message):
+        task.task_log += "%s\n" % message
+        task.modified_on = datetime.now()
+
+        # only touch the log, the rest of the task belongs to the task's own transaction
+        type(task).objects.using(alias).filter(pk=task.pk).update(task_log=task.task_log, modified_on=task.modified_on)
+
+    return log
@@ -0,0 +1,60 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.test import TestCase
+from aggregates.models import FinalizeTask
+from reports.models import Report
+from scorecards.models import Scorecard
+from .benchmark import SeasonGenerator, run_benchmarks, measure
+from .progress import get_progress_logger
+
+class BenchmarkTest(TestCase):
+
+    def test_generate(self):
+        user = User.objects.create_user('benchmark', 'benchmark@benchmark.com', 'benchmark')
+        season = SeasonGenerator(user, wetmills=2, grades=2, expenses=4, sales=2).generate()
+
+        self.assertEquals(2, Report.objects.filter(season=season, is_finalized=True).count())
+        self.assertEquals(2, Scorecard.objects.filter(season=season, is_finalized=True).count())
+        self.assertEquals(4, Report.objects.filter(season=season)[0].expenses.count())
+        self.assertEquals(2, Report.objects.filter(season=season)[0].sales.count())
+
+        results = run_benchmarks(season)
+        self.assertEquals(['Report.calculate_metrics', 'SeasonAggregate.calculate_for_season',
+                           'PDFReport.render', 'PDFScorecard.render'], [result['name'] for result in results])
+
+        for result in results:
+            self.assertEquals(2, result['items'])
+            self.assertTrue(result['queries'] > 0)
+            self.assertTrue(result['peak_memory_kb'] > 0)
+
+        # finalizing the season happened for real
+        self.assertTrue(season.is_finalized)
+
+    def test_measure(self):
+        calls = []
+        result = measure('test', lambda: calls.append(User.objects.count()), iterations=3)
+
+        self.assertEquals(3, len(calls))
+        self.assertEquals(3, result['iterations'])
+        self.assertEquals(1, result['queries'])
+        self.assertTrue(result['min_seconds'] <= result['mean_seconds'] <= result['max_seconds'])
+
+class ProgressTest(TestCase):
+
+    def test_progress_logger(self):
+        user = User.objects.create_user('progress', 'progress@progress.com', 'progress')
+        season = SeasonGenerator(user, wetmills=1, grades=1, expenses=1, sales=1).generate()
+        task = FinalizeTask.objects.create(season=season, task_log="", created_by=user, modified_by=user)
+
+        # log from inside a transaction which has already written, as our tasks do
+        with transaction.commit_on_success():
+            Report.objects.filter(season=season).update(is_finalized=False)
+
+            log = get_progress_logger(task)
+            log("Calculating")
+            log("Done")
+
+            self.assertEquals("Calculating\nDone\n", FinalizeTask.objects.get(pk=task.pk).task_log)
+
+        self.assertEquals("Calculating\nDone\n", task.task_log)
+        self.assertEquals("Calculating\nDone\n", FinalizeTask.objects.get(pk=task.pk).task_log)
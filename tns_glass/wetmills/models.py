@@ -87,6 +87,20 @@ class Wetmill(SmartModel):
         else:
             return ACC_NONE
 
+    @classmethod
+    def get_accounting_for_wetmills(cls, season, wetmill_ids):
+        """
+        Returns a dict of wetmill id to the accounting system used by each of the passed in wetmills
+        for the passed in season, loading them all in a single query.
+        """
+        accounting_systems = dict((wetmill_id, ACC_NONE) for wetmill_id in wetmill_ids)
+
+        matches = WetmillSeasonAccountingSystem.objects.filter(season=season, wetmill__in=wetmill_ids)
+        for wetmill_id, accounting_system in matches.values_list('wetmill', 'accounting_system'):
+            accounting_systems[wetmill_id] = accounting_system
+
+        return accounting_systems
+
     def get_accounting_system(self):
         """
         Returns the most recent accounting system for this wetmill